@@ -92,3 +92,7 @@ ogp_site_url = canonical_url()
 ogp_social_cards = {
     "enable": False,
 }
+
+
+# copy the card created by "make open-graph-card" unless building on Read the Docs
+osr_open_graph_fetch = bool(os.environ.get("READTHEDOCS"))
@@ -0,0 +1,21 @@
+"""On-disk cache location."""
+
+import os
+from pathlib import Path
+
+
+def cache_directory(*parts: str) -> Path:
+    """Get cache directory, the directory is not created.
+
+    Uses ``$OSR_CACHE_DIR`` if set, otherwise ``osr`` within ``$XDG_CACHE_HOME`` or
+    ``~/.cache``.
+
+    :param parts: sub-directories within the cache directory.
+    """
+    if directory := os.environ.get("OSR_CACHE_DIR"):
+        root = Path(directory)
+    else:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+        root = Path(xdg_cache_home or Path.home() / ".cache") / "osr"
+
+    return root.joinpath(*parts)
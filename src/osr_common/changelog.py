@@ -0,0 +1,150 @@
+"""Commitizen changelog cached by git revision.
+
+A changelog only changes when commits, tags or the Commitizen configuration do, so
+generated changelogs are cached on disk keyed by the repository ``HEAD``, the set of
+tags, the configuration files in the working directory and the changelog format.
+Listing the refs with ``git show-ref`` is far cheaper than running ``cz``.
+
+Outside a git repository, such as in a source archive, or if ``cz`` fails, a
+warning is logged and the changelog is not cached.
+
+Example usage:
+
+.. code-block:: python
+
+    text = changelogs.text("CHANGELOG.rst")
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from osr_common.cache import cache_directory
+from osr_common.tools import tools
+
+logger = logging.getLogger(__name__)
+
+#: Commitizen configuration files, including the changelog template settings.
+CONFIG_FILES = (
+    "pyproject.toml",
+    ".cz.toml",
+    "cz.toml",
+    ".cz.json",
+    "cz.json",
+    ".cz.yaml",
+    "cz.yaml",
+)
+
+
+class ChangelogProvider:
+    """Generate changelogs with Commitizen, caching them by git revision.
+
+    :param directory: Cache directory.
+    :param command: Command printing the changelog, the file name is appended.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        command: Sequence[str] = ("cz", "changelog", "--dry-run", "--file-name"),
+    ) -> None:
+        """Initialise ChangelogProvider."""
+        self.directory = directory
+        self.command = tuple(command)
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def revision() -> str | None:
+        """Hash repository HEAD, tags and Commitizen configuration.
+
+        :return: hash, ``None`` outside a git repository
+        """
+        try:
+            result = tools.run_sync(["git", "show-ref", "--head", "--tags"])
+        except FileNotFoundError:  # git is not installed
+            result = None
+
+        if result is None or result.returncode:
+            logger.warning("Not a git repository, changelogs are not cached.")
+            return None
+
+        sha256 = hashlib.sha256(result.stdout.encode())
+
+        for name in CONFIG_FILES:
+            if (path := Path(name)).is_file():
+                sha256.update(name.encode())
+                sha256.update(path.read_bytes())
+
+        return sha256.hexdigest()
+
+    def path(self, revision: str, file_name: str) -> Path:
+        """Get cache file of changelog, the format is determined by the suffix."""
+        return self.directory / f"{revision[:16]}{Path(file_name).suffix}"
+
+    def text(
+        self,
+        file_name: str = "CHANGELOG.rst",
+        revision: str | None = None,
+        check: bool = False,
+    ) -> str:
+        """Get changelog, running Commitizen on a cache miss.
+
+        :param file_name: Changelog file name, determines the format.
+        :param revision: Revision from :meth:`revision`, found if not given.
+        :param check: Raise :class:`subprocess.CalledProcessError` if Commitizen
+            fails, rather than logging a warning.
+        """
+        revision = revision or self.revision()
+        path = self.path(revision, file_name) if revision else None
+
+        if (cached := self.load(path)) is not None:
+            return cached
+
+        completed = tools.run_sync([*self.command, file_name])
+        if check:
+            completed.check_returncode()
+
+        if completed.returncode:
+            logger.warning(
+                f"{completed.args[0]} failed, the changelog is not cached: "
+                f"{completed.stderr}"
+            )
+        elif path is not None:
+            self.save(path, completed.stdout)
+
+        return completed.stdout
+
+    def load(self, path: Path | None) -> str | None:
+        """Load cached changelog, ``None`` on a cache miss."""
+        try:
+            result = path.read_text() if path else None
+        except FileNotFoundError:
+            result = None
+
+        if result is None:
+            self.misses += 1
+            logger.debug(f"Changelog cache miss {path}.")
+        else:
+            self.hits += 1
+
+        return result
+
+    @staticmethod
+    def save(path: Path, text: str) -> None:
+        """Save changelog, replacing the file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=path.suffix, delete=False
+        ) as file:
+            file.write(text)
+
+        os.replace(file.name, path)
+
+
+changelogs = ChangelogProvider(cache_directory("changelog"))
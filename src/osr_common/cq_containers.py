@@ -1,13 +1,79 @@
 """Abstract base classes for CadQuery object containers."""
 
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
 
 import cadquery as cq
 
 from osr_mechanical.bom.parts import PartIdentifier
 
+ContainerMemo = dict[Hashable, Any]
 
-class CqSketchContainer(ABC):
+_memo: ContextVar[ContainerMemo | None] = ContextVar("container_memo", default=None)
+
+
+class ContainerMeta(ABCMeta):
+    """Metaclass reusing container instances within :func:`memoise_containers`.
+
+    Containers are keyed by class and initialisation arguments. A container whose
+    module has been reloaded has a new class and so is created again.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Create container or get it from the active memo."""
+        memo = _memo.get()
+
+        if memo is None:
+            return super().__call__(*args, **kwargs)
+
+        key = (cls, args, tuple(sorted(kwargs.items())))
+
+        try:
+            return memo[key]
+        except KeyError:
+            result = memo[key] = super().__call__(*args, **kwargs)
+        except TypeError:
+            result = super().__call__(*args, **kwargs)
+
+        return result
+
+
+@contextmanager
+def memoise_containers(memo: ContainerMemo | None = None) -> Iterator[ContainerMemo]:
+    """Reuse containers created with the same arguments within the context.
+
+    Example usage:
+
+    .. code-block:: python
+
+        memo = {}
+
+        with memoise_containers(memo):
+            FinalAssembly()
+
+        # FrameFore and other sub-assemblies are reused
+        with memoise_containers(memo):
+            FinalAssembly(simple=True)
+
+    Memoised containers are shared, their CadQuery objects must not be modified.
+    ``cadquery.Assembly.add`` copies sub-assemblies so containers may be added to
+    more than one parent assembly.
+    """
+    if memo is None:
+        memo = {}
+
+    token = _memo.set(memo)
+
+    try:
+        yield memo
+    finally:
+        _memo.reset(token)
+
+
+class CqSketchContainer(metaclass=ContainerMeta):
     """Abstract base class for CadQuery Sketch containers."""
 
     _cq_object: cq.Sketch
@@ -23,7 +89,7 @@ class CqSketchContainer(ABC):
         ...
 
 
-class CqWorkplaneContainer(ABC):
+class CqWorkplaneContainer(metaclass=ContainerMeta):
     """Abstract base class for CadQuery Workplane containers."""
 
     _cq_object: cq.Workplane
@@ -39,7 +105,7 @@ class CqWorkplaneContainer(ABC):
         ...
 
 
-class CqAssemblyContainer(ABC):
+class CqAssemblyContainer(metaclass=ContainerMeta):
     """Abstract base class for CadQuery Assembly containers."""
 
     _cq_object: cq.Assembly
@@ -9,6 +9,12 @@ from cadquery import Shape, Workplane
 from cadquery.occ_impl.exporters import ExportLiterals
 from wurlitzer import pipes
 
+from osr_common.meshing import MeshSettings, mesh_settings
+from osr_common.tessellation import as_shape
+
+#: Export types meshed before export.
+MESH_EXPORT_TYPES = {"3MF", "AMF", "STL", "TJS", "VRML", "VTP"}
+
 
 class Export:
     """Wrapper for cadquery.occ_impl.exporters.export.
@@ -48,6 +54,7 @@ class Export:
         tolerance: float = 0.1,
         angular_tolerance: float = 0.1,
         opt: Optional[dict[str, Any]] = None,
+        settings: Optional[MeshSettings] = None,
     ) -> Any:
         """
         Export Workplane or Shape to file. Multiple entities are converted to compound.
@@ -59,7 +66,17 @@ class Export:
         :param tolerance: the deflection tolerance, in model units. Default 0.1.
         :param angular_tolerance: the angular tolerance, in radians. Default 0.1.
         :param opt: additional options passed to the specific exporter. Default None.
+        :param settings: meshing settings for mesh export types. Default None, the
+            project-wide meshing settings.
         """
+        export_type = export_type or fname.suffix[1:].upper()  # type: ignore
+
+        if export_type in MESH_EXPORT_TYPES:
+            # mesh a copy, leaving the caller's shape without triangulation
+            shape = as_shape(w).copy()
+            (settings or mesh_settings()).mesh(shape, tolerance, angular_tolerance)
+            w = shape
+
         export_stdout = StringIO()
         export_stderr = StringIO()
 
@@ -0,0 +1,250 @@
+"""Binary glTF export for web viewers.
+
+Meshes are read from the tessellation cache and written quantized, using
+``KHR_mesh_quantization``: vertex positions are stored as unsigned 16-bit integers
+and indices as 16-bit integers where possible, about a third of the size of a
+floating point mesh. Normals are omitted, viewers shade flat.
+
+A part used more than once in an assembly, such as a fastener, is stored as one
+mesh referenced by a node for each location. Parts are told apart by shape, the
+shape of a workplane is created once by
+:func:`~osr_common.tessellation.assembly_parts`.
+
+Example usage:
+
+.. code-block:: python
+
+    Path("final.glb").write_bytes(glb(FinalAssembly().cq_object))
+"""
+
+import json
+import struct
+from typing import Any
+
+import cadquery as cq
+import numpy as np
+import numpy.typing as npt
+
+from osr_common.tessellation import Mesh, assembly_parts, tessellations
+
+RGBA = tuple[float, float, float, float]
+
+COLOR: RGBA = (0.8, 0.8, 0.8, 1.0)
+
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+
+#: Convert millimetres, Z up, to metres, Y up.
+ROOT_MATRIX = [0.001, 0, 0, 0, 0, 0, -0.001, 0, 0, 0.001, 0, 0, 0, 0, 0, 1]
+
+
+class GltfBuilder:
+    """Build binary glTF of a shape or assembly.
+
+    :param tolerance: Tessellation tolerance.
+    :param angular_tolerance: Tessellation angular tolerance.
+    """
+
+    def __init__(self, tolerance: float = 0.1, angular_tolerance: float = 0.2) -> None:
+        """Initialise GltfBuilder."""
+        self.tolerance = tolerance
+        self.angular_tolerance = angular_tolerance
+
+        self.binary = bytearray()
+        self.gltf: dict[str, Any] = {
+            "asset": {"version": "2.0", "generator": "osr_common.gltf"},
+            "extensionsUsed": ["KHR_mesh_quantization"],
+            "extensionsRequired": ["KHR_mesh_quantization"],
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"matrix": ROOT_MATRIX, "children": []}],
+            "meshes": [],
+            "materials": [],
+            "accessors": [],
+            "bufferViews": [],
+        }
+
+        self._meshes: dict[tuple[cq.Shape, int], tuple[int, npt.NDArray[Any]]] = {}
+        self._materials: dict[RGBA, int] = {}
+
+    def __call__(
+        self, cq_object: cq.Shape | cq.Assembly, color: RGBA | None = None
+    ) -> bytes:
+        """Build binary glTF, color overrides the colours of the assembly."""
+        if not isinstance(cq_object, cq.Assembly):
+            cq_object = cq.Assembly(cq_object)
+
+        for shape, _name, location, shape_color in assembly_parts(cq_object):
+            rgba = color or (shape_color.toTuple() if shape_color else COLOR)
+            self.add(shape, location, rgba)
+
+        return self.encode()
+
+    def add(self, shape: cq.Shape, location: cq.Location, color: RGBA) -> None:
+        """Add node of shape at location."""
+        key = (shape, self.material(color))
+
+        if key not in self._meshes:
+            mesh = tessellations.get(shape, self.tolerance, self.angular_tolerance)
+            if not len(mesh.triangles):
+                return
+
+            self._meshes[key] = self.mesh(mesh, key[1])
+
+        index, dequantize = self._meshes[key]
+        matrix = location_matrix(location) @ dequantize
+
+        self.gltf["nodes"][0]["children"].append(len(self.gltf["nodes"]))
+        self.gltf["nodes"].append(
+            {"mesh": index, "matrix": matrix.ravel(order="F").tolist()}
+        )
+
+    def material(self, color: RGBA) -> int:
+        """Get index of material of color."""
+        if color not in self._materials:
+            self._materials[color] = len(self.gltf["materials"])
+            self.gltf["materials"].append(
+                {
+                    "pbrMetallicRoughness": {
+                        "baseColorFactor": list(color),
+                        "metallicFactor": 0.0,
+                        "roughnessFactor": 0.6,
+                    },
+                    "alphaMode": "BLEND" if color[3] < 1 else "OPAQUE",
+                }
+            )
+
+        return self._materials[color]
+
+    def mesh(self, mesh: Mesh, material: int) -> tuple[int, npt.NDArray[Any]]:
+        """Add quantized mesh, returning its index and dequantization matrix."""
+        positions, dequantize = quantize(mesh.vertices)
+        index_type = UNSIGNED_SHORT if len(positions) <= 0xFFFF else UNSIGNED_INT
+        indices = mesh.triangles.astype(
+            np.uint16 if index_type == UNSIGNED_SHORT else np.uint32
+        )
+
+        position_accessor = self.accessor(
+            positions,
+            ARRAY_BUFFER,
+            {
+                "componentType": UNSIGNED_SHORT,
+                "type": "VEC3",
+                "min": positions[:, :3].min(axis=0).tolist(),
+                "max": positions[:, :3].max(axis=0).tolist(),
+            },
+            stride=8,
+        )
+        index_accessor = self.accessor(
+            indices,
+            ELEMENT_ARRAY_BUFFER,
+            {"componentType": index_type, "type": "SCALAR"},
+        )
+
+        self.gltf["meshes"].append(
+            {
+                "primitives": [
+                    {
+                        "attributes": {"POSITION": position_accessor},
+                        "indices": index_accessor,
+                        "material": material,
+                    }
+                ]
+            }
+        )
+
+        return len(self.gltf["meshes"]) - 1, dequantize
+
+    def accessor(
+        self,
+        array: npt.NDArray[Any],
+        target: int,
+        accessor: dict[str, Any],
+        stride: int | None = None,
+    ) -> int:
+        """Add array to the binary buffer with a buffer view and accessor."""
+        offset = len(self.binary)
+        self.binary += array.tobytes()
+        self.binary += b"\0" * (-len(self.binary) % 4)
+
+        view = {"buffer": 0, "byteOffset": offset, "byteLength": array.nbytes}
+        view["target"] = target
+        if stride is not None:
+            view["byteStride"] = stride
+
+        self.gltf["bufferViews"].append(view)
+        self.gltf["accessors"].append(
+            {
+                "bufferView": len(self.gltf["bufferViews"]) - 1,
+                "count": len(array) if stride else array.size,
+                **accessor,
+            }
+        )
+
+        return len(self.gltf["accessors"]) - 1
+
+    def encode(self) -> bytes:
+        """Encode GLB container."""
+        self.gltf["buffers"] = [{"byteLength": len(self.binary)}]
+
+        document = json.dumps(self.gltf, separators=(",", ":")).encode()
+        document += b" " * (-len(document) % 4)
+
+        return b"".join(
+            [
+                struct.pack("<4sII", b"glTF", 2, 28 + len(document) + len(self.binary)),
+                struct.pack("<I4s", len(document), b"JSON"),
+                document,
+                struct.pack("<I4s", len(self.binary), b"BIN\0"),
+                bytes(self.binary),
+            ]
+        )
+
+
+def quantize(
+    vertices: npt.NDArray[np.float32],
+) -> tuple[npt.NDArray[np.uint16], npt.NDArray[np.float64]]:
+    """Quantize vertices to unsigned 16-bit integers.
+
+    Rows are padded to four components to align vertices to four bytes.
+
+    :returns: Quantized vertices and the matrix restoring their coordinates.
+    """
+    lower = vertices.min(axis=0).astype(np.float64)
+    extent = vertices.max(axis=0) - lower
+    scale = np.where(extent > 0, extent / 0xFFFF, 1.0)
+
+    result = np.zeros((len(vertices), 4), dtype=np.uint16)
+    result[:, :3] = np.rint((vertices - lower) / scale)
+
+    dequantize = np.diag([*scale, 1.0])
+    dequantize[:3, 3] = lower
+
+    return result, dequantize
+
+
+def location_matrix(location: cq.Location) -> npt.NDArray[np.float64]:
+    """Convert location to a 4 by 4 transformation matrix."""
+    transformation = location.wrapped.Transformation()
+    result = np.identity(4)
+
+    for row in range(3):
+        for column in range(4):
+            result[row, column] = transformation.Value(row + 1, column + 1)
+
+    return result
+
+
+def glb(
+    cq_object: cq.Shape | cq.Assembly,
+    tolerance: float = 0.1,
+    angular_tolerance: float = 0.2,
+    color: RGBA | None = None,
+) -> bytes:
+    """Build quantized binary glTF of shape or assembly.
+
+    :param color: Colour of all parts, overriding the colours of the assembly.
+    """
+    return GltfBuilder(tolerance, angular_tolerance)(cq_object, color)
@@ -0,0 +1,92 @@
+"""Bounding box measurements.
+
+The bounding box of an assembly is the union of the bounding box of each part
+transformed by the location of the part. Boxes of parts are cached, so parts used
+more than once, such as fasteners, are measured once.
+
+Transforming a box encloses its corners, which would enlarge the box of a part
+rotated other than by a multiple of 90 degrees. Such parts are measured at their
+location instead.
+
+Example usage:
+
+.. code-block:: python
+
+    bounding_boxes = BoundingBoxes()
+    width = bounding_boxes(FinalAssembly().cq_object).xlen
+"""
+
+import cadquery as cq
+from OCP.Bnd import Bnd_Box
+
+from osr_common.tessellation import assembly_parts
+
+#: Bounding box attribute of each measurement.
+MEASUREMENTS = {
+    "height": "zlen",
+    "length": "ylen",
+    "width": "xlen",
+}
+
+
+class BoundingBoxes:
+    """Bounding boxes of shapes and assemblies, caching the box of each part."""
+
+    def __init__(self) -> None:
+        """Initialise BoundingBoxes."""
+        self._parts: dict[cq.Shape, Bnd_Box] = {}
+
+    def __len__(self) -> int:
+        """Get number of cached parts."""
+        return len(self._parts)
+
+    def part(self, shape: cq.Shape) -> Bnd_Box:
+        """Get bounding box of part, computing it on first use."""
+        if shape not in self._parts:
+            self._parts[shape] = shape.BoundingBox().wrapped
+
+        return self._parts[shape]
+
+    def __call__(self, cq_object: cq.Shape | cq.Assembly) -> cq.BoundBox:
+        """Get bounding box of shape or assembly."""
+        if not isinstance(cq_object, cq.Assembly):
+            return cq.BoundBox(self.part(cq_object))
+
+        result = Bnd_Box()
+
+        for shape, _name, location, _color in assembly_parts(cq_object):
+            if axis_aligned(location):
+                transformation = location.wrapped.Transformation()
+                result.Add(self.part(shape).Transformed(transformation))
+            else:
+                result.Add(shape.moved(location).BoundingBox().wrapped)
+
+        return cq.BoundBox(result)
+
+
+def axis_aligned(location: cq.Location, tolerance: float = 1e-9) -> bool:
+    """Check whether location rotates by a multiple of 90 degrees about each axis."""
+    transformation = location.wrapped.Transformation()
+
+    return all(
+        min(abs(value), abs(abs(value) - 1)) < tolerance
+        for value in (
+            transformation.Value(row, column)
+            for row in range(1, 4)
+            for column in range(1, 4)
+        )
+    )
+
+
+def measure(bounding_box: cq.BoundBox, measurement: str) -> float:
+    """Get measurement of bounding box.
+
+    :param measurement: One of :data:`MEASUREMENTS`.
+    """
+    try:
+        return float(getattr(bounding_box, MEASUREMENTS[measurement]))
+    except KeyError:
+        raise ValueError(
+            f"Invalid measurement: {measurement}. "
+            f"Expected one of {', '.join(MEASUREMENTS)}."
+        )
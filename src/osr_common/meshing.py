@@ -0,0 +1,103 @@
+"""Meshing settings applied to every mesh producing export.
+
+Shapes are meshed with ``BRepMesh_IncrementalMesh`` before export, exporters then
+reuse the triangulation rather than meshing the shape again. OCP is imported when a
+shape is meshed, so that settings may be configured by the console at start up.
+
+Example usage:
+
+.. code-block:: python
+
+    set_mesh_settings(MeshSettings(parallel=True, min_size=0.05))
+
+    mesh_settings().mesh(shape, tolerance=0.01, angular_tolerance=0.1)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import cadquery as cq
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MeshSettings:
+    """BRepMesh meshing settings.
+
+    :param parallel: Mesh faces in parallel using all cores.
+    :param relative: Scale linear tolerance by the size of each edge.
+    :param min_size: Minimum size of mesh elements, ``None`` for the OpenCascade
+        default. Ignored if ``OCP.IMeshTools`` is not available.
+    """
+
+    parallel: bool = True
+    relative: bool = False
+    min_size: float | None = None
+
+    @property
+    def key(self) -> str:
+        """Settings affecting the mesh produced, parallel meshing does not."""
+        return f"{self.relative!r}:{self.min_size!r}"
+
+    def mesh(
+        self, shape: "cq.Shape", tolerance: float, angular_tolerance: float
+    ) -> None:
+        """Mesh shape in place.
+
+        Faces already meshed more finely may keep their triangulation, mesh a copy
+        of shapes that may have been meshed with other parameters.
+        """
+        from OCP.BRepMesh import BRepMesh_IncrementalMesh
+
+        parameters = self._parameters(tolerance, angular_tolerance)
+
+        if parameters is None:
+            BRepMesh_IncrementalMesh(
+                shape.wrapped,
+                tolerance,
+                self.relative,
+                angular_tolerance,
+                self.parallel,
+            )
+        else:
+            BRepMesh_IncrementalMesh(shape.wrapped, parameters)
+
+    def _parameters(self, tolerance: float, angular_tolerance: float) -> Any:
+        """Create IMeshTools parameters, ``None`` if min_size is not set.
+
+        ``OCP.IMeshTools`` is not bound by all OCP builds.
+        """
+        if self.min_size is None:
+            return None
+
+        try:
+            from OCP.IMeshTools import IMeshTools_Parameters
+        except ImportError:
+            logger.warning("OCP.IMeshTools is not available, ignoring min_size.")
+            return None
+
+        parameters = IMeshTools_Parameters()
+        parameters.Deflection = tolerance
+        parameters.Angle = angular_tolerance
+        parameters.Relative = self.relative
+        parameters.InParallel = self.parallel
+        parameters.MinSize = self.min_size
+
+        return parameters
+
+
+_mesh_settings = MeshSettings()
+
+
+def mesh_settings() -> MeshSettings:
+    """Get project-wide meshing settings."""
+    return _mesh_settings
+
+
+def set_mesh_settings(settings: MeshSettings) -> None:
+    """Set project-wide meshing settings."""
+    global _mesh_settings
+    _mesh_settings = settings
@@ -0,0 +1,104 @@
+"""Assembly serialization.
+
+CadQuery assemblies cannot be pickled. An assembly is saved flattened, as a JSON
+manifest line of the name, location and colour of each part followed by a binary
+BRep compound of the unique shapes, so shapes used more than once are stored once.
+Metadata is not saved.
+
+Example usage:
+
+.. code-block:: python
+
+    save_assembly(FinalAssembly().cq_object, Path("final.bin"))
+    assembly = load_assembly(Path("final.bin"))
+"""
+
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import cadquery as cq
+from OCP.BinTools import BinTools
+from OCP.gp import gp_Trsf
+from OCP.TopoDS import TopoDS_Shape
+
+from osr_common.tessellation import assembly_parts
+
+
+def location_matrix(location: cq.Location) -> list[float]:
+    """Convert location to a row-major 3 by 4 transformation matrix."""
+    transformation = location.wrapped.Transformation()
+
+    return [
+        transformation.Value(row, column)
+        for row in range(1, 4)
+        for column in range(1, 5)
+    ]
+
+
+def matrix_location(matrix: list[float]) -> cq.Location:
+    """Convert a row-major 3 by 4 transformation matrix to a location."""
+    transformation = gp_Trsf()
+    transformation.SetValues(*matrix)
+
+    return cq.Location(transformation)
+
+
+def save_assembly(assembly: cq.Assembly, path: Path) -> Path:
+    """Save flattened assembly, replacing the file atomically.
+
+    Part names are paths relative to the assembly, such as ``frame/side``.
+    """
+    shapes: dict[cq.Shape, int] = {}
+    parts: list[dict[str, Any]] = []
+
+    for shape, name, location, color in assembly_parts(assembly):
+        parts.append(
+            {
+                "name": name.removeprefix(f"{assembly.name}/"),
+                "shape": shapes.setdefault(shape, len(shapes)),
+                "location": location_matrix(location),
+                "color": color.toTuple() if color else None,
+            }
+        )
+
+    buffer = io.BytesIO()
+    BinTools.Write_s(cq.Compound.makeCompound(shapes).wrapped, buffer)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, suffix=path.suffix, delete=False
+    ) as file:
+        file.write(json.dumps({"name": assembly.name, "parts": parts}).encode())
+        file.write(b"\n")
+        file.write(buffer.getvalue())
+
+    os.replace(file.name, path)
+
+    return path
+
+
+def load_assembly(path: Path) -> cq.Assembly:
+    """Load flattened assembly."""
+    with path.open("rb") as file:
+        manifest = json.loads(file.readline())
+
+        compound = TopoDS_Shape()
+        BinTools.Read_s(compound, io.BytesIO(file.read()))
+
+    shapes = list(cq.Compound(compound))
+    result = cq.Assembly(name=manifest["name"])
+
+    for part in manifest["parts"]:
+        result.add(
+            shapes[part["shape"]],
+            name=part["name"],
+            loc=matrix_location(part["location"]),
+            color=cq.Color(*part["color"]) if part["color"] else None,
+        )
+
+    return result
@@ -0,0 +1,397 @@
+"""Tessellation cache.
+
+Triangle meshes are cached in memory and on disk, keyed by a fingerprint of the shape
+and the tessellation tolerances, so that a shape is tessellated once for every STL,
+glTF or image export.
+
+Example usage:
+
+.. code-block:: python
+
+    mesh = tessellations.get(shape, tolerance=0.01, angular_tolerance=0.1)
+    mesh.vertices  # (n, 3) float32 array
+    mesh.triangles  # (m, 3) uint32 array of vertex indices
+
+    mesh.write_stl(Path("shape.stl"))
+
+Arrays are read-only. Meshes loaded from disk are memory mapped rather than copied.
+
+Meshes on disk are limited in total size. When the limit is exceeded the least
+recently used meshes are removed, so meshes of shapes that have since changed do not
+accumulate.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+import cadquery as cq
+import numpy as np
+import numpy.typing as npt
+import OCP
+from cadquery.occ_impl.exporters.utils import toCompound
+from OCP.BRep import BRep_Tool
+from OCP.BRepTools import BRepTools
+from OCP.TopAbs import TopAbs_Orientation
+from OCP.TopLoc import TopLoc_Location
+from OCP.TopTools import TopTools_FormatVersion
+
+from osr_common.cache import cache_directory
+from osr_common.meshing import MeshSettings, mesh_settings
+
+logger = logging.getLogger(__name__)
+
+#: Increment when the on-disk format or tessellation method changes.
+FORMAT_VERSION = 1
+
+BREP_FORMAT_VERSION = TopTools_FormatVersion.TopTools_FormatVersion_CURRENT
+BREP_FLAGS = re.compile(rb"^[01]{7}$", re.MULTILINE)
+
+#: Shape, name, location and colour of an assembly part.
+AssemblyPart = tuple[cq.Shape, str, cq.Location, cq.Color | None]
+
+STL_DTYPE = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+
+@dataclass(frozen=True)
+class Mesh:
+    """Triangle mesh.
+
+    :param vertices: ``(n, 3)`` array of vertex coordinates.
+    :param triangles: ``(m, 3)`` array of vertex indices, counter-clockwise when
+        viewed from outside the shape.
+    """
+
+    vertices: npt.NDArray[np.float32]
+    triangles: npt.NDArray[np.uint32]
+
+    @classmethod
+    def from_shape(
+        cls,
+        shape: cq.Shape,
+        tolerance: float,
+        angular_tolerance: float,
+        settings: MeshSettings | None = None,
+    ) -> Self:
+        """Mesh and tessellate shape, faces which cannot be meshed are skipped.
+
+        A copy of shape is meshed, so that the mesh does not depend on an existing
+        triangulation and shape is left unchanged.
+
+        :param settings: Meshing settings, defaults to the project-wide settings.
+        """
+        shape = shape.copy()
+        (settings or mesh_settings()).mesh(shape, tolerance, angular_tolerance)
+
+        vertices: list[tuple[float, float, float]] = []
+        triangles: list[tuple[int, int, int]] = []
+        failed = 0
+
+        for face in shape.Faces():
+            location = TopLoc_Location()
+            poly = BRep_Tool.Triangulation_s(face.wrapped, location)
+            if poly is None:
+                failed += 1
+                continue
+
+            transformation = location.Transformation()
+            reverse = face.wrapped.Orientation() == TopAbs_Orientation.TopAbs_REVERSED
+            order = (1, 3, 2) if reverse else (1, 2, 3)
+            offset = len(vertices) - 1
+
+            vertices.extend(
+                poly.Node(i).Transformed(transformation).Coord()
+                for i in range(1, poly.NbNodes() + 1)
+            )
+            triangles.extend(
+                tuple(triangle.Value(i) + offset for i in order)
+                for triangle in poly.Triangles()
+            )
+
+        if failed:
+            logger.warning(f"{failed} faces could not be meshed and were skipped.")
+
+        return cls.from_arrays(
+            np.array(vertices, dtype=np.float32).reshape(-1, 3),
+            np.array(triangles, dtype=np.uint32).reshape(-1, 3),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        vertices: npt.NDArray[np.float32],
+        triangles: npt.NDArray[np.uint32],
+    ) -> Self:
+        """Create mesh from arrays, the arrays are made read-only."""
+        vertices.flags.writeable = False
+        triangles.flags.writeable = False
+
+        return cls(vertices, triangles)
+
+    def normals(self) -> npt.NDArray[np.float32]:
+        """Calculate unit normal of each triangle."""
+        corners = self.vertices[self.triangles]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+
+        return np.divide(
+            normals, lengths, out=np.zeros_like(normals), where=lengths > 0
+        ).astype(np.float32)
+
+    def write_stl(self, path: Path) -> None:
+        """Write binary STL."""
+        data = np.zeros(len(self.triangles), dtype=STL_DTYPE)
+        data["normal"] = self.normals()
+        data["vertices"] = self.vertices[self.triangles]
+
+        with path.open("wb") as file:
+            file.write(b"\0" * 80)
+            file.write(np.uint32(len(data)).tobytes())
+            data.tofile(file)
+
+
+def as_shape(cq_object: cq.Shape | cq.Workplane | cq.Assembly) -> cq.Shape:
+    """Convert workplanes and assemblies to a compound."""
+    if isinstance(cq_object, cq.Assembly):
+        return cq_object.toCompound()
+
+    if isinstance(cq_object, cq.Workplane):
+        return toCompound(cq_object)
+
+    return cq_object
+
+
+def assembly_parts(assembly: cq.Assembly) -> Iterator[AssemblyPart]:
+    """Iterate over the parts of an assembly, as iterating the assembly does.
+
+    Iterating an assembly creates a new compound for a workplane each time it is
+    used, so parts cannot be told apart from shapes. Here the shape of a workplane is
+    created once, a workplane of a single shape gives that shape.
+    """
+    shapes: dict[int, cq.Shape] = {}
+
+    def visit(
+        node: cq.Assembly,
+        location: cq.Location | None,
+        name: str | None,
+        color: cq.Color | None,
+    ) -> Iterator[AssemblyPart]:
+        name = f"{name}/{node.name}" if name else node.name
+        location = location * node.loc if location else node.loc
+        color = node.color or color
+
+        if node.obj:
+            yield part_shape(node.obj, shapes), name, location, color
+
+        for child in node.children:
+            yield from visit(child, location, name, color)
+
+    return visit(assembly, None, None, None)
+
+
+def part_shape(obj: cq.Shape | cq.Workplane, shapes: dict[int, cq.Shape]) -> cq.Shape:
+    """Get shape of an assembly part, shapes of workplanes are cached by identity."""
+    if isinstance(obj, cq.Shape):
+        return obj
+
+    if id(obj) not in shapes:
+        values = [value for value in obj.vals() if isinstance(value, cq.Shape)]
+        shapes[id(obj)] = (
+            values[0] if len(values) == 1 else cq.Compound.makeCompound(values)
+        )
+
+    return shapes[id(obj)]
+
+
+def shape_fingerprint(shape: cq.Shape) -> str:
+    """SHA-256 of shape geometry, topology and location in BREP format.
+
+    Triangulations and shape flags are excluded. Tessellation modifies both, the
+    fingerprint of a shape does not change once it has been tessellated.
+    """
+    brep = io.BytesIO()
+    BRepTools.Write_s(shape.wrapped, brep, False, False, BREP_FORMAT_VERSION)
+
+    return hashlib.sha256(BREP_FLAGS.sub(b"", brep.getvalue())).hexdigest()
+
+
+class TessellationCache:
+    """Cache of shape tessellations in memory and on disk.
+
+    :param directory: Directory for cached meshes, ``None`` to cache in memory only.
+    :param max_entries: Maximum number of meshes kept in memory.
+    :param max_bytes: Maximum total size of meshes on disk. When exceeded, least
+        recently used meshes are removed until the total is below three quarters of
+        the maximum.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        max_entries: int = 256,
+        max_bytes: int = 2**30,
+    ) -> None:
+        """Initialise TessellationCache."""
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._meshes: OrderedDict[str, Mesh] = OrderedDict()
+        self._disk_bytes: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        shape: cq.Shape,
+        tolerance: float,
+        angular_tolerance: float,
+        settings: MeshSettings,
+    ) -> str:
+        """Cache key of a shape tessellated with tolerances and settings."""
+        parameters = f"{FORMAT_VERSION}:{OCP.__version__}:{tolerance!r}:"
+        parameters += f"{angular_tolerance!r}:{settings.key}"
+
+        return hashlib.sha256(
+            f"{shape_fingerprint(shape)}:{parameters}".encode("ascii")
+        ).hexdigest()
+
+    def get(
+        self,
+        shape: cq.Shape,
+        tolerance: float = 0.1,
+        angular_tolerance: float = 0.1,
+        settings: MeshSettings | None = None,
+    ) -> Mesh:
+        """Get mesh of shape, tessellating on first use.
+
+        :param settings: Meshing settings, defaults to the project-wide settings.
+        """
+        settings = settings or mesh_settings()
+        key = self.key(shape, tolerance, angular_tolerance, settings)
+        mesh = self._meshes.get(key) or self._load(key)
+
+        if mesh is None:
+            self.misses += 1
+            mesh = Mesh.from_shape(shape, tolerance, angular_tolerance, settings)
+            self._save(key, mesh)
+        else:
+            self.hits += 1
+
+        self._meshes[key] = mesh
+        self._meshes.move_to_end(key)
+
+        while len(self._meshes) > self.max_entries:
+            self._meshes.popitem(last=False)
+
+        return mesh
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        """Paths of vertex and triangle arrays."""
+        assert self.directory is not None
+        directory = self.directory / key[:2]
+
+        return directory / f"{key}.vertices.npy", directory / f"{key}.triangles.npy"
+
+    def _load(self, key: str) -> Mesh | None:
+        """Load memory mapped mesh from disk."""
+        if self.directory is None:
+            return None
+
+        vertices_path, triangles_path = self._paths(key)
+
+        try:
+            mesh = Mesh.from_arrays(
+                np.load(vertices_path, mmap_mode="r"),
+                np.load(triangles_path, mmap_mode="r"),
+            )
+            # modification time records last use for pruning
+            os.utime(vertices_path)
+            os.utime(triangles_path)
+        except (OSError, ValueError):
+            return None
+
+        return mesh
+
+    def _save(self, key: str, mesh: Mesh) -> None:
+        """Save mesh to disk, each file is replaced atomically."""
+        if self.directory is None:
+            return
+
+        for path, array in zip(self._paths(key), (mesh.vertices, mesh.triangles)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                dir=path.parent, suffix=".npy", delete=False
+            ) as file:
+                np.save(file, array)
+
+            os.replace(file.name, path)
+
+        self._add_disk_bytes(sum(path.stat().st_size for path in self._paths(key)))
+
+    def _add_disk_bytes(self, size: int) -> None:
+        """Add to the total size of meshes on disk, pruning if over the maximum."""
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _used, size, _paths in self._usage())
+        else:
+            self._disk_bytes += size
+
+        if self._disk_bytes > self.max_bytes:
+            self.prune(self.max_bytes * 3 // 4)
+
+    def _usage(self) -> list[tuple[float, int, list[Path]]]:
+        """Last use, size and files of each mesh on disk, least recently used first.
+
+        Temporary files of meshes being saved are excluded.
+        """
+        assert self.directory is not None
+        meshes: dict[str, list[Path]] = defaultdict(list)
+
+        for path in self.directory.glob("*/*.*.npy"):
+            meshes[path.name.partition(".")[0]].append(path)
+
+        result = []
+        for paths in meshes.values():
+            try:
+                stats = [path.stat() for path in paths]
+            except FileNotFoundError:  # removed by another process
+                continue
+
+            used = max(stat.st_mtime for stat in stats)
+            result.append((used, sum(stat.st_size for stat in stats), paths))
+
+        return sorted(result, key=lambda item: item[0])
+
+    def prune(self, max_bytes: int) -> None:
+        """Remove least recently used meshes from disk until below max_bytes."""
+        if self.directory is None:
+            return
+
+        usage = self._usage()
+        self._disk_bytes = sum(size for _used, size, _paths in usage)
+
+        for _used, size, paths in usage:
+            if self._disk_bytes <= max_bytes:
+                break
+
+            for path in paths:
+                path.unlink(missing_ok=True)
+            self._disk_bytes -= size
+
+    def clear(self) -> None:
+        """Remove meshes from memory."""
+        self._meshes.clear()
+
+
+tessellations = TessellationCache(cache_directory("tessellation"))
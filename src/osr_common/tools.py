@@ -0,0 +1,203 @@
+"""External tool runner.
+
+Run external tools, such as ``optipng`` and ``cz``, as asyncio subprocesses with
+per-tool concurrency limits, timeouts and retries.
+
+Example usage:
+
+.. code-block:: python
+
+    results = tools.run_all([["optipng", path] for path in paths])
+
+    for result in results:
+        result.check_returncode()
+
+Failures are logged with the captured output of the tool. ``check_returncode``
+raises :class:`subprocess.CalledProcessError`, a tool that does not finish within
+its timeout raises :class:`subprocess.TimeoutExpired`.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from os import PathLike, cpu_count
+from subprocess import CalledProcessError, TimeoutExpired
+from time import perf_counter
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+Command = Sequence[str | PathLike[str]]
+
+#: Seconds between attempts to acquire a limit held by another thread.
+POLL_INTERVAL = 0.01
+
+
+@dataclass(frozen=True)
+class Tool:
+    """External tool settings.
+
+    :param concurrency: Maximum number of concurrent invocations.
+    :param timeout: Seconds to wait for an invocation, ``None`` to wait indefinitely.
+    :param retries: Number of times a failed or timed out invocation is retried.
+    """
+
+    concurrency: int = cpu_count() or 1
+    timeout: float | None = None
+    retries: int = 0
+
+
+@dataclass(frozen=True)
+class ToolResult:
+    """Completed tool invocation."""
+
+    args: tuple[str, ...]
+    returncode: int
+    stdout: str
+    stderr: str
+    seconds: float
+    attempts: int
+
+    def check_returncode(self) -> None:
+        """Raise CalledProcessError if the exit code is non-zero."""
+        if self.returncode:
+            raise CalledProcessError(
+                self.returncode, self.args, self.stdout, self.stderr
+            )
+
+
+class ToolRunner:
+    """Run external tools concurrently.
+
+    Concurrency limits apply to all invocations in the process, including those of
+    event loops in different threads. Each call of :meth:`run_all` or
+    :meth:`run_sync` runs its own event loop.
+
+    :param tools: Settings by tool name, tools without settings use the defaults of
+        :class:`Tool`.
+    """
+
+    def __init__(self, tools: dict[str, Tool] | None = None) -> None:
+        """Initialise ToolRunner."""
+        self.tools = tools or {}
+
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = WeakKeyDictionary()
+        self._limits: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def tool(self, name: str) -> Tool:
+        """Get tool settings."""
+        return self.tools.get(name, Tool())
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        """Get concurrency limit of tool in the running event loop."""
+        semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+
+        if name not in semaphores:
+            semaphores[name] = asyncio.Semaphore(self.tool(name).concurrency)
+
+        return semaphores[name]
+
+    def _limit(self, name: str) -> threading.BoundedSemaphore:
+        """Get concurrency limit of tool in the process."""
+        with self._lock:
+            if name not in self._limits:
+                self._limits[name] = threading.BoundedSemaphore(
+                    self.tool(name).concurrency
+                )
+
+            return self._limits[name]
+
+    @asynccontextmanager
+    async def _slot(self, name: str) -> AsyncIterator[None]:
+        """Wait until the tool can be invoked within its concurrency limit.
+
+        Invocations wait in the running event loop, then for invocations in other
+        threads without blocking the event loop.
+        """
+        limit = self._limit(name)
+
+        async with self._semaphore(name):
+            while not limit.acquire(blocking=False):
+                await asyncio.sleep(POLL_INTERVAL)
+
+            try:
+                yield
+            finally:
+                limit.release()
+
+    async def run(self, command: Command) -> ToolResult:
+        """Run tool, retrying if it fails or times out."""
+        args = tuple(map(str, command))
+        tool = self.tool(args[0])
+        start = perf_counter()
+
+        async with self._slot(args[0]):
+            for attempt in range(1, tool.retries + 2):
+                try:
+                    returncode, stdout, stderr = await self._run(args, tool.timeout)
+                except TimeoutExpired:
+                    logger.warning(f"{args[0]} timed out, attempt {attempt}.")
+                    if attempt > tool.retries:
+                        raise
+                    continue
+
+                if returncode == 0 or attempt > tool.retries:
+                    break
+
+                logger.warning(f"{args[0]} failed, attempt {attempt}: {stderr}")
+
+        result = ToolResult(
+            args, returncode, stdout, stderr, perf_counter() - start, attempt
+        )
+        logger.debug(f"{' '.join(args)} exited {returncode} in {result.seconds:.2f}s.")
+
+        return result
+
+    @staticmethod
+    async def _run(
+        args: tuple[str, ...], timeout: float | None
+    ) -> tuple[int, str, str]:
+        """Run process once, killing it on timeout."""
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise TimeoutExpired(args, timeout or 0)
+
+        assert process.returncode is not None
+
+        return process.returncode, stdout.decode(), stderr.decode()
+
+    async def gather(self, commands: Sequence[Command]) -> list[ToolResult]:
+        """Run tools concurrently, within the concurrency limit of each tool."""
+        return list(await asyncio.gather(*(self.run(command) for command in commands)))
+
+    def run_all(self, commands: Sequence[Command]) -> list[ToolResult]:
+        """Run tools concurrently from synchronous code."""
+        return asyncio.run(self.gather(commands))
+
+    def run_sync(self, command: Command) -> ToolResult:
+        """Run tool from synchronous code."""
+        return self.run_all([command])[0]
+
+
+tools = ToolRunner(
+    {
+        "cz": Tool(concurrency=1, timeout=120),
+        "mayo": Tool(concurrency=2, timeout=300, retries=1),
+        "optipng": Tool(timeout=300),
+    }
+)
@@ -0,0 +1,307 @@
+"""Benchmark suite.
+
+Time construction of warehouse parts and assemblies, exports, BOM generation and DXF
+conversion. Results are recorded with a fingerprint of the machine so that they can
+be compared against a stored baseline.
+
+Example usage:
+
+.. code-block:: python
+
+    runner = BenchmarkRunner(repeat=5, warmup=1)
+    report = runner.run(default_benchmarks(), pattern="frame.*")
+
+    baseline = BenchmarkReport.from_json(Path("baseline.json").read_text())
+    regressions = [c for c in compare(baseline, report) if c.regression]
+"""
+
+import json
+import logging
+import os
+import platform
+import statistics
+import tempfile
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Self
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """Benchmark.
+
+    :param name: Dotted benchmark name, such as ``frame.side``.
+    :param func: Function to be timed, called with the result of setup.
+    :param setup: Function called once before timing, such as building the assembly
+        to be exported.
+    """
+
+    name: str
+    func: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a single benchmark in seconds."""
+
+    name: str
+    times: list[float]
+
+    @property
+    def minimum(self) -> float:
+        """Fastest time."""
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        """Median time."""
+        return statistics.median(self.times)
+
+    @property
+    def stdev(self) -> float:
+        """Standard deviation of times."""
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+
+@dataclass
+class BenchmarkReport:
+    """Benchmark results with the machine they were recorded on."""
+
+    machine: dict[str, Any]
+    results: list[BenchmarkResult] = field(default_factory=list)
+    created: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
+    )
+
+    def result(self, name: str) -> BenchmarkResult | None:
+        """Get result by benchmark name."""
+        return next((r for r in self.results if r.name == name), None)
+
+    def to_json(self) -> str:
+        """Encode report as JSON."""
+        return json.dumps(asdict(self), indent=2)
+
+    @classmethod
+    def from_json(cls, document: str) -> Self:
+        """Decode report from JSON."""
+        data = json.loads(document)
+        results = [BenchmarkResult(**result) for result in data.pop("results")]
+
+        return cls(results=results, **data)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Comparison of a benchmark result against its baseline."""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        """Current median time relative to baseline."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    @property
+    def regression(self) -> bool:
+        """Current time exceeds baseline by more than the threshold."""
+        return self.ratio > 1 + self.threshold
+
+    def __str__(self) -> str:
+        """Format comparison as a table row."""
+        flag = "REGRESSION" if self.regression else ""
+
+        return (
+            f"{self.name:<32} {self.baseline:>10.4f} {self.current:>10.4f} "
+            f"{self.ratio:>7.2f}x {flag}"
+        ).rstrip()
+
+
+def machine_fingerprint() -> dict[str, Any]:
+    """Describe the machine and software versions benchmarks are run on."""
+    packages: dict[str, str | None] = {}
+
+    for package in ("cadquery", "cadquery-ocp", "ezdxf"):
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "packages": packages,
+    }
+
+
+def compare(
+    baseline: BenchmarkReport, current: BenchmarkReport, threshold: float = 0.1
+) -> list[Comparison]:
+    """Compare median times of benchmarks present in both reports.
+
+    :param threshold: Fractional increase in median time flagged as a regression.
+    """
+    if baseline.machine != current.machine:
+        logger.warning("Baseline was recorded on a different machine.")
+
+    result = []
+
+    for current_result in current.results:
+        baseline_result = baseline.result(current_result.name)
+
+        if baseline_result is None:
+            continue
+
+        result.append(
+            Comparison(
+                current_result.name,
+                baseline_result.median,
+                current_result.median,
+                threshold,
+            )
+        )
+
+    return result
+
+
+class BenchmarkRunner:
+    """Run benchmarks.
+
+    :param repeat: Number of timed runs of each benchmark.
+    :param warmup: Number of untimed runs before timing.
+    """
+
+    def __init__(self, repeat: int = 5, warmup: int = 1) -> None:
+        """Initialise BenchmarkRunner."""
+        if repeat < 1:
+            raise ValueError(f"Repeat must be at least 1, got {repeat}.")
+
+        self.repeat = repeat
+        self.warmup = warmup
+
+    def run(
+        self, benchmarks: Iterable[Benchmark], pattern: str = "*"
+    ) -> BenchmarkReport:
+        """Run benchmarks with names matching a shell-style pattern."""
+        report = BenchmarkReport(machine_fingerprint())
+
+        for benchmark in benchmarks:
+            if fnmatchcase(benchmark.name, pattern):
+                report.results.append(self.time(benchmark))
+
+        return report
+
+    def time(self, benchmark: Benchmark) -> BenchmarkResult:
+        """Time a single benchmark."""
+        logger.info(f"Benchmark {benchmark.name}.")
+        argument = benchmark.setup()
+
+        for _ in range(self.warmup):
+            benchmark.func(argument)
+
+        times = []
+        for _ in range(self.repeat):
+            start = perf_counter()
+            benchmark.func(argument)
+            times.append(perf_counter() - start)
+
+        return BenchmarkResult(benchmark.name, times)
+
+
+def _warehouse_benchmarks() -> list[Benchmark]:
+    """Benchmarks of warehouse parts."""
+    from osr_warehouse.alexco.profiles20 import Vslot2020Profile, Vslot2040Profile
+    from osr_warehouse.alexco.vslot import Vslot2020, Vslot2040
+    from osr_warehouse.generic.linear_motion.shf import SHF
+    from osr_warehouse.generic.vslot.brackets2020 import (
+        StandardLightDuty90,
+        StandardStandardDuty90,
+    )
+    from osr_warehouse.generic.vslot.tnut20 import SlidingTNut20
+
+    return [
+        Benchmark("warehouse.vslot2020_profile", lambda _: Vslot2020Profile()),
+        Benchmark("warehouse.vslot2040_profile", lambda _: Vslot2040Profile()),
+        Benchmark("warehouse.vslot2020", lambda _: Vslot2020().make(1000)),
+        Benchmark("warehouse.vslot2040", lambda _: Vslot2040().make(1000)),
+        Benchmark("warehouse.bracket_light_duty", lambda _: StandardLightDuty90()),
+        Benchmark(
+            "warehouse.bracket_standard_duty", lambda _: StandardStandardDuty90()
+        ),
+        Benchmark("warehouse.tnut20", lambda _: SlidingTNut20(simple=False)),
+        Benchmark("warehouse.shf8", lambda _: SHF(8)),
+    ]
+
+
+def _assembly_benchmarks() -> list[Benchmark]:
+    """Benchmarks of frame sub-assemblies and the final assembly."""
+    from osr_mechanical.bom.parts import port
+    from osr_mechanical.final import FinalAssembly
+    from osr_mechanical.frame.final import Frame
+    from osr_mechanical.frame.fore import FrameFore
+    from osr_mechanical.frame.pivot_beam import FramePivotBeam
+    from osr_mechanical.frame.side import FrameSide
+
+    return [
+        Benchmark("frame.side", lambda _: FrameSide(port)),
+        Benchmark("frame.fore", lambda _: FrameFore()),
+        Benchmark("frame.pivot_beam", lambda _: FramePivotBeam()),
+        Benchmark("frame.final", lambda _: Frame()),
+        Benchmark("final.simple", lambda _: FinalAssembly(simple=True)),
+        Benchmark("final.full", lambda _: FinalAssembly()),
+    ]
+
+
+def _export(export_type: str) -> Callable[[Any], None]:
+    """Export shape to a temporary file."""
+    from osr_common.cq_wrappers import Export
+
+    def func(shape: Any) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            Export()(shape, Path(directory) / f"benchmark.{export_type.lower()}")
+
+    return func
+
+
+def _output_benchmarks() -> list[Benchmark]:
+    """Benchmarks of exports, BOM generation and DXF conversion."""
+    from osr_common.cq_dxf import DxfDocument
+    from osr_mechanical.bom.bom import Bom
+    from osr_mechanical.final import FinalAssembly
+    from osr_mechanical.pcb.rpi_hat import RpiHatBoard
+
+    def final_compound() -> Any:
+        return FinalAssembly(simple=True).cq_object.toCompound()
+
+    def board_face() -> Any:
+        return RpiHatBoard(mounting_holes=True).board_face()
+
+    return [
+        Benchmark("export.step", _export("STEP"), final_compound),
+        Benchmark("export.stl", _export("STL"), final_compound),
+        Benchmark("export.dxf", _export("DXF"), board_face),
+        Benchmark("bom.final", Bom, lambda: FinalAssembly().cq_object),
+        Benchmark("dxf.document", lambda f: DxfDocument().add_shape(f), board_face),
+    ]
+
+
+def default_benchmarks() -> list[Benchmark]:
+    """Get project benchmarks.
+
+    CadQuery and project modules are imported when called.
+    """
+    return _warehouse_benchmarks() + _assembly_benchmarks() + _output_benchmarks()
@@ -1,7 +1,6 @@
 """Bill of materials utilities."""
 
 import csv
-import importlib
 import io
 from collections import UserDict
 from json import JSONEncoder, dumps
@@ -12,6 +11,7 @@ from cq_warehouse.fastener import Nut, Screw, Washer
 
 from osr_mechanical.bom.converters import FastenerToPart
 from osr_mechanical.bom.parts import Commodity, PartIdentifier, PartType
+from osr_mechanical.cache import containers
 
 
 class BomEntry:
@@ -127,12 +127,7 @@ class BomBuilder:
     @staticmethod
     def from_string(assembly_name: str = "final.FinalAssembly") -> Bom:
         """Create BOM."""
-        module_name, class_name = f"osr_mechanical.{assembly_name}".rsplit(".", 1)
-
-        module = importlib.import_module(module_name)
-        assembly_container = getattr(module, class_name)
-
-        assembly = assembly_container().cq_object
+        assembly = containers.from_string(assembly_name).cq_object
 
         return Bom(assembly)
 
@@ -149,11 +144,21 @@ class BomEncoder(JSONEncoder):
         if isinstance(obj, BomEntry):
             return vars(obj)
         if isinstance(obj, PartIdentifier):
-            return {
-                "commodity_type": obj.commodity_type,
-                "description": obj.description,
-            }
+            return self.encode_part(obj)
         if isinstance(obj, PartType):
             return vars(obj)
 
         return JSONEncoder.default(self, obj)
+
+    @staticmethod
+    def encode_part(part: PartIdentifier) -> dict[str, Any]:
+        """Part identifier encoding."""
+        result = {
+            "commodity_type": part.commodity_type,
+            "description": part.description,
+        }
+
+        if part.length is not None:
+            result |= {"profile": part.profile, "length": part.length}
+
+        return result
@@ -0,0 +1,314 @@
+"""Cut list optimisation for parts cut from stock bars.
+
+Parts recording a profile and length, such as T-slot extrusions, are packed onto
+stock bars of a standard length. Each cut consumes the part length plus the saw kerf.
+
+Small instances are solved exactly with a branch and bound search, larger instances
+use first-fit-decreasing.
+"""
+
+import csv
+import io
+from dataclasses import dataclass, field
+from itertools import groupby
+from json import dumps
+from math import ceil
+from typing import Iterable, Optional
+
+from osr_mechanical.bom.parts import PartIdentifier
+
+EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class Cut:
+    """Part cut from a stock bar."""
+
+    identifier: str
+    length: float
+
+
+@dataclass
+class Bar:
+    """Stock bar and the parts to be cut from it."""
+
+    profile: str
+    stock_length: float
+    kerf: float
+    cuts: list[Cut] = field(default_factory=list)
+
+    @property
+    def used(self) -> float:
+        """Length consumed by cuts including kerf."""
+        return sum(cut.length + self.kerf for cut in self.cuts)
+
+    @property
+    def offcut(self) -> float:
+        """Length remaining after all cuts."""
+        return max(self.stock_length - self.used, 0)
+
+
+class CutList(list[Bar]):
+    """Cut list, a list of stock bars with their cuts."""
+
+    ENCODE_CSV = "csv"
+    ENCODE_JSON = "json"
+
+    @property
+    def waste(self) -> float:
+        """Total offcut length."""
+        return sum(bar.offcut for bar in self)
+
+    def bar_count(self, profile: str) -> int:
+        """Count stock bars of a profile."""
+        return sum(1 for bar in self if bar.profile == profile)
+
+    def encode(self, encoder: Optional[str] = None) -> str:
+        """Get cut list, optionally encode to CSV or JSON."""
+        if self.ENCODE_JSON == encoder or encoder is None:
+            return dumps(
+                [
+                    {
+                        "profile": bar.profile,
+                        "stock_length": bar.stock_length,
+                        "cuts": [vars(cut) for cut in bar.cuts],
+                        "offcut": bar.offcut,
+                    }
+                    for bar in self
+                ]
+            )
+
+        if self.ENCODE_CSV == encoder:
+            mem_file = io.StringIO()
+            writer = csv.writer(mem_file)
+
+            header = ["bar", "profile", "stock_length", "part_number", "length"]
+            writer.writerow(header)
+
+            for index, bar in enumerate(self, start=1):
+                for cut in bar.cuts:
+                    writer.writerow(
+                        [
+                            index,
+                            bar.profile,
+                            bar.stock_length,
+                            cut.identifier,
+                            cut.length,
+                        ]
+                    )
+
+            return mem_file.getvalue()
+
+        raise ValueError(
+            f'Formatter must be one of: "{self.ENCODE_CSV}", "{self.ENCODE_JSON}".'
+        )
+
+
+class CutListOptimiser:
+    """Pack parts onto stock bars.
+
+    Example usage:
+
+    .. code-block:: python
+
+        bom = BomBuilder().from_string("final.FinalAssembly")
+
+        optimiser = CutListOptimiser(stock_length=1000, kerf=3)
+        cut_list = optimiser.optimise(
+            ((entry.part, entry.quantity) for entry in bom.values()), multiplier=3
+        )
+
+    :param stock_length: Length of stock bars.
+    :param kerf: Width of material removed by each cut.
+    :param exact_limit: Maximum number of cuts per profile for the exact solver.
+    :param node_limit: Maximum number of search nodes for the exact solver, beyond which
+        the first-fit-decreasing solution is kept.
+    """
+
+    def __init__(
+        self,
+        stock_length: float = 1000,
+        kerf: float = 3,
+        *,
+        exact_limit: int = 40,
+        node_limit: int = 200_000,
+    ) -> None:
+        """Initialise CutListOptimiser."""
+        self.stock_length = stock_length
+        self.kerf = kerf
+        self.exact_limit = exact_limit
+        self.node_limit = node_limit
+
+    def optimise(
+        self, parts: Iterable[tuple[PartIdentifier, int]], multiplier: int = 1
+    ) -> CutList:
+        """Create cut list.
+
+        :param parts: Pairs of part identifier and quantity. Parts without a length
+            are ignored.
+        :param multiplier: Number of assemblies to be built.
+        """
+        cuts = sorted(self.cuts(parts, multiplier), key=lambda c: c[0])
+        result = CutList()
+
+        for profile, group in groupby(cuts, key=lambda c: c[0]):
+            result.extend(self.optimise_profile(profile, [cut for _, cut in group]))
+
+        return result
+
+    def cuts(
+        self, parts: Iterable[tuple[PartIdentifier, int]], multiplier: int = 1
+    ) -> list[tuple[str, Cut]]:
+        """List required cuts as pairs of profile and cut."""
+        result = []
+
+        for part, quantity in parts:
+            if part.length is None:
+                continue
+
+            if part.length + self.kerf > self.stock_length + EPSILON:
+                raise ValueError(
+                    f"Part {part} length {part.length} exceeds stock length "
+                    f"{self.stock_length}."
+                )
+
+            cut = Cut(part.identifier, part.length)
+            result.extend([(part.profile or "", cut)] * quantity * multiplier)
+
+        return result
+
+    def optimise_profile(self, profile: str, cuts: list[Cut]) -> list[Bar]:
+        """Pack cuts of a single profile onto stock bars."""
+        cuts = sorted(cuts, key=lambda c: c.length, reverse=True)
+        bars = self.first_fit_decreasing(profile, cuts)
+
+        if len(cuts) <= self.exact_limit and len(bars) > self.lower_bound(cuts):
+            exact = self.exact(profile, cuts, len(bars))
+            if exact is not None:
+                bars = exact
+
+        return bars
+
+    def lower_bound(self, cuts: list[Cut]) -> int:
+        """Minimum possible number of stock bars."""
+        used = sum(c.length + self.kerf for c in cuts)
+
+        return ceil(used / self.stock_length - EPSILON)
+
+    def first_fit_decreasing(self, profile: str, cuts: list[Cut]) -> list[Bar]:
+        """Place each cut, longest first, on the first bar with room."""
+        bars: list[Bar] = []
+
+        for cut in sorted(cuts, key=lambda c: c.length, reverse=True):
+            bar = next((b for b in bars if self._fits(b, cut)), None)
+
+            if bar is None:
+                bar = Bar(profile, self.stock_length, self.kerf)
+                bars.append(bar)
+
+            bar.cuts.append(cut)
+
+        return bars
+
+    def _fits(self, bar: Bar, cut: Cut) -> bool:
+        """Check cut fits on bar."""
+        return bar.used + cut.length + self.kerf <= self.stock_length + EPSILON
+
+    def exact(self, profile: str, cuts: list[Cut], upper: int) -> list[Bar] | None:
+        """Find a packing using fewer than upper bars.
+
+        :return: list of bars or ``None`` if no better packing was found within the
+            node limit.
+        """
+        search = _BranchAndBound(
+            [c.length + self.kerf for c in cuts],
+            self.stock_length,
+            upper,
+            self.lower_bound(cuts),
+            self.node_limit,
+        )
+        assignment = search.run()
+
+        if assignment is None:
+            return None
+
+        return [
+            Bar(profile, self.stock_length, self.kerf, [cuts[i] for i in indices])
+            for indices in assignment
+        ]
+
+
+class _BranchAndBound:
+    """Branch and bound bin packing of sizes sorted in decreasing order."""
+
+    def __init__(
+        self,
+        sizes: list[float],
+        capacity: float,
+        upper: int,
+        lower: int,
+        node_limit: int,
+    ) -> None:
+        """Initialise _BranchAndBound."""
+        self.sizes = sizes
+        self.capacity = capacity
+        self.best = upper
+        self.lower = lower
+        self.nodes = node_limit
+
+        self.bins: list[list[int]] = []
+        self.remaining: list[float] = []
+        self.result: list[list[int]] | None = None
+
+    def run(self) -> list[list[int]] | None:
+        """Search for a packing using fewer bins than the upper bound."""
+        self._search(0)
+
+        return self.result
+
+    def _done(self) -> bool:
+        """Check whether search should stop."""
+        return self.nodes <= 0 or self.best <= self.lower
+
+    def _search(self, index: int) -> None:
+        """Assign size at index to each distinct open bin, then a new bin."""
+        self.nodes -= 1
+
+        if len(self.bins) >= self.best or self._done():
+            return
+
+        if index == len(self.sizes):
+            self.best = len(self.bins)
+            self.result = [list(b) for b in self.bins]
+            return
+
+        for position in self._candidates(index):
+            self._assign(index, position)
+
+        self.bins.append([])
+        self.remaining.append(self.capacity)
+        self._assign(index, len(self.bins) - 1)
+        self.bins.pop()
+        self.remaining.pop()
+
+    def _candidates(self, index: int) -> list[int]:
+        """Open bins with room, skipping bins with equal remaining capacity."""
+        seen = set()
+        result = []
+
+        for position, remaining in enumerate(self.remaining):
+            if remaining + EPSILON >= self.sizes[index] and remaining not in seen:
+                seen.add(remaining)
+                result.append(position)
+
+        return result
+
+    def _assign(self, index: int, position: int) -> None:
+        """Place size in bin and continue search."""
+        self.bins[position].append(index)
+        self.remaining[position] -= self.sizes[index]
+
+        self._search(index + 1)
+
+        self.remaining[position] += self.sizes[index]
+        self.bins[position].pop()
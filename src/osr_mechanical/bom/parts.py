@@ -69,6 +69,9 @@ class PartIdentifier:
     """Internal part identifier.
 
     Parts are identified using a significant part numbering system.
+
+    Parts cut from stock, such as T-slot extrusions, may also record their profile
+    and cut length for use in cut lists.
     """
 
     def __init__(
@@ -78,6 +81,9 @@ class PartIdentifier:
         description: str,
         commodity_type: Commodity = Commodity.PURCHASED,
         suffix: str = "",
+        *,
+        profile: str | None = None,
+        length: float | None = None,
     ) -> None:
         """Initialise PartIdentifier."""
         self.prefix = prefix
@@ -85,6 +91,8 @@ class PartIdentifier:
         self.description = description
         self.commodity_type = commodity_type
         self.suffix = suffix
+        self.profile = profile
+        self.length = length
 
     @property
     def root(self) -> str:
@@ -121,7 +129,7 @@ class PartIdentifier:
         return self.identifier
 
 
-@dataclass
+@dataclass(frozen=True)
 class NauticalSide:
     """Side, either port or starboard."""
 
@@ -0,0 +1,89 @@
+"""Cache of CadQuery object containers.
+
+Containers build their CadQuery object when initialised, which for assemblies such as
+``FinalAssembly`` takes seconds. Within a long running process, such as
+``console serve``, containers are shared between commands using :data:`containers`.
+"""
+
+import importlib
+import logging
+from collections.abc import Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def container_class(name: str) -> Any:
+    """Import container class by name relative to ``osr_mechanical``.
+
+    :param name: Module and class name, such as ``final.FinalAssembly``.
+    """
+    module_name, class_name = f"osr_mechanical.{name}".rsplit(".", 1)
+    module = importlib.import_module(module_name)
+
+    return getattr(module, class_name)
+
+
+class ContainerCache:
+    """Cache container instances by class and keyword arguments.
+
+    Example usage:
+
+    .. code-block:: python
+
+        cache = ContainerCache()
+
+        assembly = cache.get(FinalAssembly)
+        assert assembly is cache.get(FinalAssembly)
+
+    Cached containers are shared, their CadQuery objects must not be modified.
+    """
+
+    def __init__(self) -> None:
+        """Initialise ContainerCache."""
+        self._instances: dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get number of cached containers."""
+        return len(self._instances)
+
+    def get(self, container: type[T], **kwargs: Any) -> T:
+        """Get container instance, creating it on first use.
+
+        Containers initialised with unhashable arguments are not cached.
+        """
+        key = (container.__module__, container.__qualname__, *sorted(kwargs.items()))
+
+        try:
+            result: T = self._instances[key]
+        except KeyError:
+            self.misses += 1
+            logger.debug(f"Container cache miss {container.__qualname__} {kwargs}.")
+            result = self._instances[key] = container(**kwargs)
+        except TypeError:
+            self.misses += 1
+            return container(**kwargs)
+        else:
+            self.hits += 1
+
+        return result
+
+    def from_string(self, name: str, **kwargs: Any) -> Any:
+        """Get container instance by name relative to ``osr_mechanical``.
+
+        :param name: Module and class name, such as ``final.FinalAssembly``.
+        """
+        return self.get(container_class(name), **kwargs)
+
+    def clear(self) -> None:
+        """Remove all cached containers."""
+        self._instances.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+containers = ContainerCache()
@@ -1,50 +1,115 @@
-"""Rover console command."""
+"""Rover console command.
+
+Sub-command dependencies such as CadQuery, Jinja2, and Pillow are imported when the
+sub-command runs so that ``console --help`` and ``console --version`` start quickly.
+"""
 
-import importlib
 import logging
+import sys
 import tempfile
 from argparse import ArgumentParser, Namespace
 from base64 import b64encode
 from datetime import datetime
 from os import EX_OK, getcwd
 from pathlib import Path
-from sys import stdout
-
-from cadquery import exporters as cq_exporters
-from jinja2 import Environment, PackageLoader, select_autoescape
+from time import perf_counter
+from typing import TYPE_CHECKING
 
+from osr_common.meshing import MeshSettings, set_mesh_settings
 from osr_mechanical import __version__
-from osr_mechanical.bom.bom import Bom, BomBuilder
+from osr_mechanical.cache import containers
 from osr_mechanical.config import (
     COPYRIGHT_OWNER,
     PROJECT_HOST,
     PROJECT_NAME,
     SHORT_DESCRIPTION,
 )
-from osr_mechanical.console.dxf import dxf_import_export
-from osr_mechanical.console.exporters import ExportPNG
-from osr_mechanical.console.release import ReleaseBuilder
-from osr_mechanical.console.utilities import snake_to_camel_case
+from osr_mechanical.console.daemon import DaemonServer, default_socket_path, forward
+from osr_mechanical.console.utilities import (
+    board_quantity,
+    container_argument,
+    image_size,
+    positive_integer,
+    snake_to_camel_case,
+    vector,
+)
+
+if TYPE_CHECKING:
+    from cadquery import Workplane
+
+ENCODE_JSON = "json"
 
 logging.basicConfig(encoding="utf-8", level=logging.INFO)
 logger = logging.getLogger("osr_mechanical.console")
 
 
 def export_png(args: Namespace) -> None:
-    """Export PNG image of final assembly."""
-    logger.debug("Exporting final assembly PNG.")
+    """Export PNG images of an assembly.
+
+    Multiple views or sizes are written to ``OUT_FILE-VIEW-WIDTHxHEIGHT.png``.
+    """
+    from osr_mechanical.console.exporters import ExportPNG, ViewSpec
+    from osr_mechanical.console.renderers import CAMERAS, RENDERERS, View
+
+    logger.debug(f"Exporting {args.assembly} PNG.")
 
     out_file = args.out_file[0]
-    label = args.no_label
+    names = args.view or ["iso"]
+    sizes = args.size or [(args.width, args.height)]
+    single = len(names) == 1 and len(sizes) == 1
+
+    specs = [
+        ViewSpec(
+            (
+                out_file
+                if single
+                else out_file.with_stem(f"{out_file.stem}-{name}-{width}x{height}")
+            ),
+            View(CAMERAS[name], width, height),
+            args.no_label,
+        )
+        for name in names
+        for width, height in sizes
+    ]
+
+    exporter = ExportPNG(
+        out_file,
+        shape=containers.from_string(args.assembly).cq_object,
+        renderer=RENDERERS[args.renderer](),
+    )
+    exporter.export_views(specs)
+
+    exit(EX_OK)
+
+
+def export_turntable(args: Namespace) -> None:
+    """Export turntable animation of an assembly."""
+    from osr_mechanical.console.renderers import CAMERAS, RENDERERS
+    from osr_mechanical.console.turntable import Turntable
+
+    width, height = args.size
+    turntable = Turntable(
+        frames=args.frames,
+        axis=args.axis,
+        camera=CAMERAS[args.view],
+        width=width,
+        height=height,
+        duration=args.duration,
+        workers=args.workers,
+        renderer=RENDERERS[args.renderer](),
+    )
 
-    exporter = ExportPNG(out_file, height=args.height, width=args.width, label=label)
-    exporter.export()
+    start = perf_counter()
+    turntable.export(containers.from_string(args.assembly).cq_object, args.out_file)
+    logger.info(f"Rendered {args.frames} frames in {perf_counter() - start:.2f}s.")
 
     exit(EX_OK)
 
 
 def open_graph_card_svg(_args: Namespace) -> None:
     """Create Open Graph Card in SVG format."""
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
     env = Environment(
         loader=PackageLoader("osr_mechanical"), autoescape=select_autoescape()
     )
@@ -76,13 +141,15 @@ def open_graph_card_svg(_args: Namespace) -> None:
         short_description=SHORT_DESCRIPTION,
     )
 
-    stdout.write(result)
+    sys.stdout.write(result)
 
     exit(EX_OK)
 
 
 def build_cam_archive(args: Namespace) -> None:
     """Build Computer Aided Manufacturing file archive."""
+    from osr_mechanical.console.release import ReleaseBuilder
+
     if not args.build_dir.is_dir():
         logger.critical(f"Build directory does not exist {args.build_dir}.")
         exit(1)
@@ -95,41 +162,218 @@ def build_cam_archive(args: Namespace) -> None:
 
 def dxf_reduce(args: Namespace) -> None:
     """Import a DXF followed by export."""
+    from osr_mechanical.console.dxf import dxf_import_export
+
     output = dxf_import_export(args.filename)
-    stdout.write(output)
+    sys.stdout.write(output)
     exit(EX_OK)
 
 
 def export_bom(args: Namespace) -> None:
     """Generate bill of materials."""
+    from osr_mechanical.bom.bom import BomBuilder
+
     builder = BomBuilder()
     bom = builder.from_string(args.assembly)
 
-    stdout.write(bom.encode(encoder=args.encode) + "\n")
+    sys.stdout.write(bom.encode(encoder=args.encode) + "\n")
     exit(EX_OK)
 
 
-def export_pcb_outline(args: Namespace) -> None:
-    """Export PCB outlines as DXF."""
-    module_name = (
-        f"osr_mechanical.pcb.{args.board}.{snake_to_camel_case(args.board)}Board"
+def export_cut_list(args: Namespace) -> None:
+    """Generate cut list for parts cut from stock bars."""
+    from osr_mechanical.bom.bom import BomBuilder
+    from osr_mechanical.bom.cutlist import CutListOptimiser
+
+    bom = BomBuilder().from_string(args.assembly)
+
+    optimiser = CutListOptimiser(args.stock_length, args.kerf)
+    cut_list = optimiser.optimise(
+        ((entry.part, entry.quantity) for entry in bom.values()),
+        multiplier=args.quantity,
+    )
+
+    sys.stdout.write(cut_list.encode(encoder=args.encode) + "\n")
+    exit(EX_OK)
+
+
+def pcb_board_face(board: str) -> "Workplane":
+    """Face of PCB board for use as an outline."""
+    board_container = containers.from_string(
+        f"pcb.{board}.{snake_to_camel_case(board)}Board",
+        mounting_holes=False,
+        full_size=True,
     )
 
-    module_name, class_name = module_name.rsplit(".", 1)
-    module = importlib.import_module(module_name)
-    container = getattr(module, class_name)
+    result: "Workplane" = board_container.board_face()
+    return result
 
-    pcb_face = container(mounting_holes=False, full_size=True).board_face()
+
+def export_pcb_outline(args: Namespace) -> None:
+    """Export PCB outlines as DXF."""
+    from cadquery import exporters as cq_exporters
+
+    pcb_face = pcb_board_face(args.board)
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_file = Path(tmp_dir) / "tmp.dxf"
         cq_exporters.export(pcb_face, str(tmp_file), "DXF")
 
-        stdout.write(tmp_file.read_text())
+        sys.stdout.write(tmp_file.read_text())
+
+    exit(EX_OK)
+
+
+def export_nest(args: Namespace) -> None:
+    """Nest PCB outlines onto stock sheets and export a DXF per sheet."""
+    from osr_mechanical.nesting.nest import Nest
+    from osr_mechanical.nesting.packing import Sheet
+
+    if not args.out_dir.is_dir():
+        logger.critical(f"Output directory does not exist {args.out_dir}.")
+        exit(1)
+
+    sheet = Sheet(args.sheet_width, args.sheet_height, args.margin)
+    nest = Nest(sheet, spacing=args.spacing, refine=args.refine)
+
+    for board, quantity in args.board:
+        nest.add(board, pcb_board_face(board), quantity)
+
+    for index, dxf in enumerate(nest.dxf_documents(), start=1):
+        dxf.document.saveas(args.out_dir / f"sheet-{index}.dxf")
 
+    logger.info(f"Nested {len(nest.placements)} parts on {nest.sheet_count} sheets.")
     exit(EX_OK)
 
 
+def benchmark(args: Namespace) -> None:
+    """Run benchmark suite, optionally comparing against a baseline."""
+    from osr_mechanical.benchmark import (
+        BenchmarkReport,
+        BenchmarkRunner,
+        compare,
+        default_benchmarks,
+    )
+
+    runner = BenchmarkRunner(repeat=args.repeat, warmup=args.warmup)
+    report = runner.run(default_benchmarks(), pattern=args.filter)
+
+    if args.out_file is None:
+        sys.stdout.write(report.to_json() + "\n")
+    else:
+        args.out_file.write_text(report.to_json() + "\n")
+
+    if args.compare is None:
+        exit(EX_OK)
+
+    baseline = BenchmarkReport.from_json(args.compare.read_text())
+    comparisons = compare(baseline, report, threshold=args.threshold)
+
+    for comparison in comparisons:
+        sys.stderr.write(f"{comparison}\n")
+
+    exit(1 if any(c.regression for c in comparisons) else EX_OK)
+
+
+def batch(args: Namespace) -> None:
+    """Run batch jobs from a job file."""
+    from osr_mechanical.console.batch import (
+        BatchRunner,
+        JobFileError,
+        load_jobs,
+        write_summary,
+    )
+
+    try:
+        jobs = load_jobs(args.job_file.read_text())
+    except JobFileError as exception:
+        logger.critical(f"Invalid job file {args.job_file}: {exception}")
+        exit(1)
+
+    start = perf_counter()
+    results = BatchRunner(args.workers).run(jobs)
+    write_summary(results, perf_counter() - start)
+
+    exit(1 if any(result.error for result in results) else EX_OK)
+
+
+def export(args: Namespace) -> None:
+    """Export containers in worker processes."""
+    from osr_mechanical.console.batch import BatchRunner, Job, write_summary
+
+    if not args.out_dir.is_dir():
+        logger.critical(f"Output directory does not exist {args.out_dir}.")
+        exit(1)
+
+    jobs = []
+    for assembly in dict.fromkeys(args.assembly):
+        for part in dict.fromkeys(args.part or [None]):
+            for export_format in dict.fromkeys(args.format):
+                name = f"{assembly}__{part}" if part else assembly
+                jobs.append(
+                    Job(
+                        name=f"{name}.{export_format}",
+                        output=args.out_dir / f"{name}.{export_format}",
+                        assembly=assembly,
+                        arguments=dict(args.argument),
+                        format=export_format,
+                        part=part,
+                    )
+                )
+
+    start = perf_counter()
+    results = BatchRunner(args.workers).run(jobs)
+    write_summary(results, perf_counter() - start)
+
+    exit(1 if any(result.error for result in results) else EX_OK)
+
+
+def watch(args: Namespace) -> None:
+    """Rebuild and export an assembly when source files change."""
+    from osr_mechanical.console.watch import Watcher
+
+    arguments = {"simple": True} if args.simple else {}
+    out_file = args.out_file or Path(f"{args.assembly}.{args.format}")
+
+    watcher = Watcher(args.assembly, args.format, out_file, arguments)
+
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+    exit(EX_OK)
+
+
+def serve(args: Namespace) -> None:
+    """Run console daemon."""
+    for assembly in args.preload:
+        containers.from_string(assembly)
+
+    with DaemonServer(args.socket, run) as server:
+        logger.info(f"Listening on {args.socket}.")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    exit(EX_OK)
+
+
+def via_daemon(socket_path: Path, argv: list[str]) -> None:
+    """Run command in the console daemon, or directly if it is not running."""
+    argv = [argument for argument in argv if argument != "--via-daemon"]
+
+    try:
+        status = forward(socket_path, argv)
+    except (FileNotFoundError, ConnectionRefusedError):
+        logger.warning(f"Daemon not listening on {socket_path}, running directly.")
+        run(argv)
+    else:
+        exit(status)
+
+
 def build_parser() -> ArgumentParser:
     """Parse arguments."""
     parser = ArgumentParser(prog="console", description="Rover console command.")
@@ -153,6 +397,33 @@ def build_parser() -> ArgumentParser:
         dest="log_level",
         const=logging.INFO,
     )
+    parser.add_argument(
+        "--mesh-serial",
+        help="mesh shapes on a single core",
+        action="store_false",
+        dest="mesh_parallel",
+    )
+    parser.add_argument(
+        "--mesh-relative",
+        help="scale mesh tolerance by the size of each edge",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--mesh-min-size",
+        type=float,
+        help="minimum size of mesh elements",
+    )
+    parser.add_argument(
+        "--via-daemon",
+        help="run command in the console daemon (see serve)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=default_socket_path(),
+        help="console daemon socket",
+    )
 
     subparsers = parser.add_subparsers()
 
@@ -184,7 +455,7 @@ def build_parser() -> ArgumentParser:
 
     parser_export_png = subparsers.add_parser(
         "export-png",
-        help="export PNG image of final assembly",
+        help="export PNG images of an assembly",
     )
     parser_export_png.add_argument(
         "--width",
@@ -203,6 +474,31 @@ def build_parser() -> ArgumentParser:
         action="store_false",
         help="do not label image",
     )
+    parser_export_png.add_argument(
+        "--renderer",
+        choices=["auto", "mayo", "vtk"],
+        default="auto",
+        help="render in-process with VTK or with Mayo (default: auto, VTK if it "
+        "can render offscreen)",
+    )
+    parser_export_png.add_argument(
+        "--assembly",
+        default="final.FinalAssembly",
+        help="container relative to osr_mechanical (default: final.FinalAssembly)",
+    )
+    parser_export_png.add_argument(
+        "--view",
+        action="append",
+        choices=["front", "iso", "side", "top"],
+        help="camera view, may be repeated (default: iso)",
+    )
+    parser_export_png.add_argument(
+        "--size",
+        action="append",
+        type=image_size,
+        help="image size as WIDTHxHEIGHT, may be repeated (default: --width and "
+        "--height)",
+    )
     parser_export_png.add_argument(
         "out_file",
         type=Path,
@@ -211,6 +507,64 @@ def build_parser() -> ArgumentParser:
     )
     parser_export_png.set_defaults(func=export_png)
 
+    parser_turntable = subparsers.add_parser(
+        "export-turntable",
+        help="export turntable animation of an assembly",
+    )
+    parser_turntable.add_argument(
+        "--assembly",
+        default="final.FinalAssembly",
+        help="container relative to osr_mechanical (default: final.FinalAssembly)",
+    )
+    parser_turntable.add_argument(
+        "--frames",
+        type=positive_integer,
+        default=120,
+        help="number of frames (default: 120)",
+    )
+    parser_turntable.add_argument(
+        "--axis",
+        type=vector,
+        default=(0, 0, 1),
+        help="rotation axis as x,y,z (default: 0,0,1)",
+    )
+    parser_turntable.add_argument(
+        "--view",
+        choices=["front", "iso", "side", "top"],
+        default="iso",
+        help="camera view of the first frame (default: iso)",
+    )
+    parser_turntable.add_argument(
+        "--size",
+        type=image_size,
+        default=(640, 480),
+        help="frame size as WIDTHxHEIGHT (default: 640x480)",
+    )
+    parser_turntable.add_argument(
+        "--duration",
+        type=float,
+        default=6,
+        help="seconds per revolution (default: 6)",
+    )
+    parser_turntable.add_argument(
+        "--renderer",
+        choices=["auto", "mayo", "vtk"],
+        default="auto",
+        help="render in-process with VTK or with Mayo (default: auto, VTK if it "
+        "can render offscreen)",
+    )
+    parser_turntable.add_argument(
+        "--workers",
+        type=positive_integer,
+        help="number of worker processes (default: number of processors)",
+    )
+    parser_turntable.add_argument(
+        "out_file",
+        type=Path,
+        help="output file, .gif, .png (APNG), or .webp",
+    )
+    parser_turntable.set_defaults(func=export_turntable)
+
     parser_open_graph_card = subparsers.add_parser(
         "open-graph-card",
         help="create open graph card SVG",
@@ -221,7 +575,7 @@ def build_parser() -> ArgumentParser:
     parser_bom.add_argument(
         "--encode",
         type=str,
-        default=Bom.ENCODE_JSON,
+        default=ENCODE_JSON,
         help="output format",
     )
     parser_bom.add_argument(
@@ -232,6 +586,41 @@ def build_parser() -> ArgumentParser:
     )
     parser_bom.set_defaults(func=export_bom)
 
+    parser_cutlist = subparsers.add_parser(
+        "cutlist", help="generate cut list for parts cut from stock bars"
+    )
+    parser_cutlist.add_argument(
+        "--encode",
+        type=str,
+        default=ENCODE_JSON,
+        help="output format",
+    )
+    parser_cutlist.add_argument(
+        "--assembly",
+        type=str,
+        default="final.FinalAssembly",
+        help="assembly for which to generate cut list",
+    )
+    parser_cutlist.add_argument(
+        "--quantity",
+        type=int,
+        default=1,
+        help="number of assemblies to be built",
+    )
+    parser_cutlist.add_argument(
+        "--stock-length",
+        type=float,
+        default=1000,
+        help="length of stock bars in mm",
+    )
+    parser_cutlist.add_argument(
+        "--kerf",
+        type=float,
+        default=3,
+        help="width of material removed by each cut in mm",
+    )
+    parser_cutlist.set_defaults(func=export_cut_list)
+
     parser_pcb_outline = subparsers.add_parser(
         "pcb-outline", help="generate printed circuit board outlines"
     )
@@ -243,15 +632,230 @@ def build_parser() -> ArgumentParser:
     )
     parser_pcb_outline.set_defaults(func=export_pcb_outline)
 
+    parser_nest = subparsers.add_parser(
+        "nest", help="nest printed circuit board outlines onto stock sheets"
+    )
+    parser_nest.add_argument(
+        "--board",
+        required=True,
+        type=board_quantity,
+        action="append",
+        help="board to nest, optionally with quantity (e.g. rpi_hat=10)",
+    )
+    parser_nest.add_argument(
+        "--sheet-width",
+        type=float,
+        default=300,
+        help="width of stock sheet in mm",
+    )
+    parser_nest.add_argument(
+        "--sheet-height",
+        type=float,
+        default=200,
+        help="height of stock sheet in mm",
+    )
+    parser_nest.add_argument(
+        "--margin",
+        type=float,
+        default=5,
+        help="clear border around edge of stock sheet in mm",
+    )
+    parser_nest.add_argument(
+        "--spacing",
+        type=float,
+        default=2,
+        help="minimum distance between parts in mm",
+    )
+    parser_nest.add_argument(
+        "--refine",
+        action="store_true",
+        help="compact parts using their outlines rather than bounding rectangles",
+    )
+    parser_nest.add_argument(
+        "--out-dir",
+        type=Path,
+        default=Path(getcwd()).absolute(),
+        help="output directory for sheet DXF files",
+    )
+    parser_nest.set_defaults(func=export_nest)
+
+    parser_bench = subparsers.add_parser(
+        "bench",
+        help="run benchmark suite",
+        epilog="Exits with status 1 if a regression against the baseline is found.",
+    )
+    parser_bench.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of timed runs of each benchmark",
+    )
+    parser_bench.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="number of untimed runs before timing",
+    )
+    parser_bench.add_argument(
+        "--filter",
+        type=str,
+        default="*",
+        help="run benchmarks matching a shell-style pattern (e.g. 'frame.*')",
+    )
+    parser_bench.add_argument(
+        "--out-file",
+        type=Path,
+        help="write results as JSON to file rather than stdout",
+    )
+    parser_bench.add_argument(
+        "--compare",
+        type=Path,
+        metavar="BASELINE",
+        help="compare results against a baseline JSON file",
+    )
+    parser_bench.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fractional increase in median time flagged as a regression",
+    )
+    parser_bench.set_defaults(func=benchmark)
+
+    parser_batch = subparsers.add_parser(
+        "batch",
+        help="run jobs from a TOML job file in a pool of worker processes",
+        epilog="Exits with status 1 if any job fails.",
+    )
+    parser_batch.add_argument(
+        "job_file",
+        type=Path,
+        help="TOML job file",
+    )
+    parser_batch.add_argument(
+        "--workers",
+        type=int,
+        help="maximum number of worker processes (default: number of processors)",
+    )
+    parser_batch.set_defaults(func=batch)
+
+    parser_export = subparsers.add_parser(
+        "export",
+        help="export containers in worker processes",
+        epilog=(
+            "Each combination of assembly, part and format is exported to "
+            "OUT_DIR/ASSEMBLY[__PART].FORMAT. A single assembly is built once and "
+            "its formats, other than DXF, are exported in parallel. Exits with "
+            "status 1 if any export fails."
+        ),
+    )
+    parser_export.add_argument(
+        "--assembly",
+        required=True,
+        type=str,
+        action="append",
+        help="container to export (e.g. frame.side.FrameSide), may be repeated",
+    )
+    parser_export.add_argument(
+        "--format",
+        required=True,
+        choices=["brep", "dxf", "glb", "step", "stl"],
+        action="append",
+        help="export format, may be repeated",
+    )
+    parser_export.add_argument(
+        "--part",
+        type=str,
+        action="append",
+        help="export named part or sub-assembly rather than the container",
+    )
+    parser_export.add_argument(
+        "--argument",
+        type=container_argument,
+        action="append",
+        default=[],
+        help=(
+            "container argument as name=value (e.g. simple=True or "
+            "nautical_side=@bom.parts.port)"
+        ),
+    )
+    parser_export.add_argument(
+        "--out-dir",
+        type=Path,
+        default=Path(getcwd()).absolute(),
+        help="output directory",
+    )
+    parser_export.add_argument(
+        "--workers",
+        type=int,
+        help="maximum number of worker processes (default: number of processors)",
+    )
+    parser_export.set_defaults(func=export)
+
+    parser_watch = subparsers.add_parser(
+        "watch",
+        help="rebuild and export an assembly when source files change",
+    )
+    parser_watch.add_argument(
+        "--assembly",
+        type=str,
+        default="final.FinalAssembly",
+        help="assembly to export",
+    )
+    parser_watch.add_argument(
+        "--format",
+        choices=["dxf", "glb", "png", "step", "stl"],
+        default="step",
+        help="export format",
+    )
+    parser_watch.add_argument(
+        "--simple",
+        action="store_true",
+        help="build simplified assembly",
+    )
+    parser_watch.add_argument(
+        "--out-file",
+        type=Path,
+        help="export file (default: ASSEMBLY.FORMAT)",
+    )
+    parser_watch.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="seconds between checks for changed files",
+    )
+    parser_watch.set_defaults(func=watch)
+
+    parser_serve = subparsers.add_parser(
+        "serve",
+        help="run console daemon with modules loaded and containers cached",
+    )
+    parser_serve.add_argument(
+        "--preload",
+        type=str,
+        action="append",
+        default=[],
+        help="assembly to build on start-up (e.g. final.FinalAssembly)",
+    )
+    parser_serve.set_defaults(func=serve)
+
     return parser
 
 
-def main() -> int:
-    """Rover console command."""
+def run(argv: list[str] | None = None) -> None:
+    """Run console command.
+
+    :param argv: command line arguments, defaults to ``sys.argv[1:]``.
+    """
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logging.getLogger().setLevel(args.log_level)
+    set_mesh_settings(
+        MeshSettings(args.mesh_parallel, args.mesh_relative, args.mesh_min_size)
+    )
+
+    if args.via_daemon:
+        via_daemon(args.socket, sys.argv[1:] if argv is None else argv)
 
     try:
         func = args.func
@@ -260,6 +864,11 @@ def main() -> int:
 
     func(args)  # noqa
 
+
+def main() -> int:
+    """Rover console command."""
+    run()
+
     return 1
 
 
@@ -0,0 +1,475 @@
+"""Batch job runner.
+
+Run many exports from a TOML job file in a pool of worker processes. Jobs exporting
+the same container run in the same worker so that the container is built once. When
+all jobs export one container it is built once before the pool is started, and its
+exports in :data:`SHARED_FORMATS` each run in a worker loading the saved model.
+
+Example job file:
+
+.. code-block:: toml
+
+    [[job]]
+    name = "final-assembly-step"
+    assembly = "final.FinalAssembly"
+    arguments = {simple = true}
+    format = "step"
+    output = "_build/final-assembly.step"
+    options = {tolerance = 0.01}
+
+    [[job]]
+    assembly = "final.FinalAssembly"
+    format = "bom-csv"
+    output = "_build/bom.csv"
+
+    [[job]]
+    command = ["open-graph-card"]
+    output = "_build/open-graph-card/open-graph-card.svg"
+
+Export jobs require ``assembly``, a container relative to ``osr_mechanical``,
+``format`` and ``output``. ``arguments`` are passed to the container, strings
+prefixed with ``@`` are resolved to objects, for example
+``arguments = {nautical_side = "@bom.parts.port"}``. ``part`` selects a part or
+sub-assembly by name. ``options`` are passed to the exporter.
+
+Command jobs run a ``console`` command, writing its output to ``output`` when given;
+``assembly`` may be set to run the command in the same worker as exports of that
+container.
+"""
+
+import io
+import logging
+import sys
+import tempfile
+import tomllib
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from osr_common.meshing import mesh_settings, set_mesh_settings
+from osr_mechanical.cache import container_class, containers
+from osr_mechanical.console.daemon import exit_status
+
+logger = logging.getLogger(__name__)
+
+Exporter = Callable[[Any, Path, dict[str, Any]], None]
+
+
+def _shape(cq_object: Any) -> Any:
+    """Get shape or workplane, assemblies are converted to a compound."""
+    import cadquery as cq
+
+    if isinstance(cq_object, cq.Assembly):
+        return cq_object.toCompound()
+
+    return cq_object
+
+
+def _export_shape(export_type: str) -> Exporter:
+    """Export shape using CadQuery."""
+
+    def exporter(cq_object: Any, output: Path, options: dict[str, Any]) -> None:
+        from osr_common.cq_wrappers import Export
+
+        export = Export()
+        shape = _shape(cq_object)
+        export(shape, output, export_type, **options)  # type: ignore[arg-type]
+
+    return exporter
+
+
+def _export_bom(encoder: str) -> Exporter:
+    """Export bill of materials."""
+
+    def exporter(cq_object: Any, output: Path, options: dict[str, Any]) -> None:
+        from osr_mechanical.bom.bom import Bom
+
+        output.write_text(Bom(cq_object, **options).encode(encoder) + "\n")
+
+    return exporter
+
+
+def _export_stl(cq_object: Any, output: Path, options: dict[str, Any]) -> None:
+    """Export STL using the tessellation cache."""
+    from osr_common.tessellation import as_shape, tessellations
+
+    tessellations.get(as_shape(cq_object), **options).write_stl(output)
+
+
+def _export_brep(cq_object: Any, output: Path, options: dict[str, Any]) -> None:
+    """Export OpenCascade BREP."""
+    from osr_common.tessellation import as_shape
+
+    as_shape(cq_object).exportBrep(str(output))
+
+
+def _export_glb(cq_object: Any, output: Path, options: dict[str, Any]) -> None:
+    """Export binary glTF."""
+    import cadquery as cq
+
+    if not isinstance(cq_object, cq.Assembly):
+        cq_object = cq.Assembly(cq_object)
+
+    cq_object.save(str(output), "GLTF", **options)
+
+
+def _export_png(cq_object: Any, output: Path, options: dict[str, Any]) -> None:
+    """Export PNG image.
+
+    Option ``renderer`` is ``auto``, ``mayo`` or ``vtk``, ``view`` is a camera name
+    such as ``top``.
+    """
+    import cadquery as cq
+
+    from osr_common.tessellation import as_shape
+    from osr_mechanical.console.exporters import ExportPNG
+    from osr_mechanical.console.renderers import CAMERAS, RENDERERS
+
+    options = dict(options)
+    renderer = RENDERERS[options.pop("renderer", "auto")]()
+    camera = CAMERAS[options.pop("view", "iso")]
+
+    if not isinstance(cq_object, cq.Assembly):
+        cq_object = as_shape(cq_object)
+
+    ExportPNG(
+        output, shape=cq_object, renderer=renderer, camera=camera, **options
+    ).export()
+
+
+def select_part(cq_object: Any, name: str) -> Any:
+    """Get part or sub-assembly of an assembly by name.
+
+    Parts are in the coordinates of their own sub-assembly.
+    """
+    import cadquery as cq
+
+    if not isinstance(cq_object, cq.Assembly):
+        raise ValueError(f"Part '{name}' can only be selected from an assembly.")
+
+    try:
+        node = cq_object.objects[name]
+    except KeyError:
+        raise ValueError(
+            f"Invalid part '{name}', expected one of: {', '.join(cq_object.objects)}."
+        )
+
+    return node if node.obj is None else node.obj
+
+
+def resolve_arguments(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Resolve ``@`` prefixed string arguments to objects.
+
+    For example ``@bom.parts.port`` is resolved to ``osr_mechanical.bom.parts.port``.
+    """
+    return {
+        name: (
+            container_class(value[1:])
+            if isinstance(value, str) and value.startswith("@")
+            else value
+        )
+        for name, value in arguments.items()
+    }
+
+
+EXPORTERS: dict[str, Exporter] = {
+    "bom-csv": _export_bom("csv"),
+    "bom-json": _export_bom("json"),
+    "brep": _export_brep,
+    "dxf": _export_shape("DXF"),
+    "glb": _export_glb,
+    "png": _export_png,
+    "step": _export_shape("STEP"),
+    "stl": _export_stl,
+}
+
+#: Export formats that can be run from a saved model, without the container.
+SHARED_FORMATS = {"brep", "glb", "png", "step", "stl"}
+
+
+@dataclass(frozen=True)
+class Job:
+    """Batch job."""
+
+    name: str
+    output: Path | None = None
+    assembly: str | None = None
+    arguments: dict[str, Any] = field(default_factory=dict)
+    format: str | None = None
+    options: dict[str, Any] = field(default_factory=dict)
+    part: str | None = None
+    command: list[str] | None = None
+
+    @property
+    def group(self) -> tuple[Any, ...]:
+        """Jobs in the same group share a worker process."""
+        if self.assembly is None:
+            return ("command", self.name)
+
+        return (self.assembly, repr(sorted(self.arguments.items())))
+
+    def run(self) -> None:
+        """Run job."""
+        if self.output is not None:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.command is not None:
+            self._run_command(self.command)
+            return
+
+        assert self.format is not None and self.output is not None
+        EXPORTERS[self.format](self.cq_object(), self.output, self.options)
+
+    def cq_object(self) -> Any:
+        """Build container and select part."""
+        assert self.assembly is not None
+
+        arguments = resolve_arguments(self.arguments)
+        cq_object = containers.from_string(self.assembly, **arguments).cq_object
+
+        if self.part is not None:
+            cq_object = select_part(cq_object, self.part)
+
+        return cq_object
+
+    def _run_command(self, command: list[str]) -> None:
+        """Run console command, writing output to file."""
+        from osr_mechanical.console.application import run
+
+        output = io.StringIO()
+
+        try:
+            with redirect_stdout(output):
+                run(command)
+        except SystemExit as exception:
+            if status := exit_status(exception.code):
+                raise RuntimeError(f"Command exited with status {status}.")
+
+        if self.output is not None:
+            self.output.write_text(output.getvalue())
+
+
+@dataclass(frozen=True)
+class SharedJob(Job):
+    """Export job loading a model saved by :func:`share_jobs`.
+
+    Assemblies are loaded flattened and other objects as a shape.
+    """
+
+    source: Path | None = None
+
+    @property
+    def group(self) -> tuple[Any, ...]:
+        """Shared jobs run in a worker process of their own."""
+        return ("shared", self.name)
+
+    def cq_object(self) -> Any:
+        """Load saved model."""
+        import cadquery as cq
+
+        from osr_common.serialization import load_assembly
+
+        assert self.source is not None
+
+        if ".brep" == self.source.suffix:
+            return cq.Shape.importBrep(str(self.source))
+
+        return load_assembly(self.source)
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Outcome of a batch job."""
+
+    name: str
+    seconds: float
+    cache_hit: bool
+    error: str | None = None
+
+    def __str__(self) -> str:
+        """Format result as a table row."""
+        cache = "hit" if self.cache_hit else "miss"
+        status = "ok" if self.error is None else f"failed: {self.error}"
+
+        return f"{self.name:<40} {self.seconds:>8.2f}s {cache:<5} {status}"
+
+
+class JobFileError(ValueError):
+    """Invalid batch job file."""
+
+
+def _job(index: int, table: dict[str, Any]) -> Job:
+    """Create job from a job file table."""
+    name = table.get("name", f"job-{index}")
+
+    try:
+        job = Job(name=name, **{k: v for k, v in table.items() if k != "name"})
+    except TypeError as exception:
+        raise JobFileError(f"Job {name}: {exception}.")
+
+    if job.output is not None:
+        job = replace(job, output=Path(job.output))
+
+    if job.command is None and (job.format not in EXPORTERS or job.output is None):
+        raise JobFileError(
+            f"Job {name}: requires command, or output and a format of "
+            f"{', '.join(EXPORTERS)}."
+        )
+
+    return job
+
+
+def load_jobs(document: str) -> list[Job]:
+    """Load jobs from a TOML job file."""
+    try:
+        data = tomllib.loads(document)
+    except tomllib.TOMLDecodeError as exception:
+        raise JobFileError(str(exception))
+
+    tables = data.get("job", [])
+    if not isinstance(tables, list) or not all(isinstance(t, dict) for t in tables):
+        raise JobFileError("Jobs must be an array of tables, written as [[job]].")
+
+    jobs = [_job(index, table) for index, table in enumerate(tables)]
+
+    names = [job.name for job in jobs]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise JobFileError(f"Duplicate job names: {', '.join(sorted(duplicates))}.")
+
+    return jobs
+
+
+def group_jobs(jobs: list[Job]) -> list[list[Job]]:
+    """Group jobs sharing a container, preserving job file order."""
+    groups: dict[tuple[Any, ...], list[Job]] = {}
+
+    for job in jobs:
+        groups.setdefault(job.group, []).append(job)
+
+    return list(groups.values())
+
+
+def _save(job: Job, path: Path) -> Path | None:
+    """Save model of job, or ``None`` if it cannot be built."""
+    import cadquery as cq
+
+    from osr_common.serialization import save_assembly
+    from osr_common.tessellation import as_shape
+
+    try:
+        cq_object = job.cq_object()
+    except Exception:
+        return None  # failures are reported when the job is run
+
+    if isinstance(cq_object, cq.Assembly):
+        return save_assembly(cq_object, path.with_suffix(".bin"))
+
+    path = path.with_suffix(".brep")
+    as_shape(cq_object).exportBrep(str(path))
+
+    return path
+
+
+def share_jobs(jobs: list[Job], directory: Path) -> list[list[Job]]:
+    """Split jobs exporting one container into groups of their own.
+
+    The container is built once in this process and each part exported is saved to
+    directory. Exports in :data:`SHARED_FORMATS` load the saved part, other jobs
+    remain in one group.
+    """
+    sources: dict[str | None, Path | None] = {}
+    shared: list[list[Job]] = []
+    remaining: list[Job] = []
+
+    for job in jobs:
+        if job.command is None and job.format in SHARED_FORMATS:
+            if job.part not in sources:
+                sources[job.part] = _save(job, directory / str(len(sources)))
+
+            if source := sources[job.part]:
+                shared.append([SharedJob(**vars(job), source=source)])
+                continue
+
+        remaining.append(job)
+
+    return ([remaining] if remaining else []) + shared
+
+
+def run_jobs(jobs: list[Job]) -> list[JobResult]:
+    """Run jobs in order in the current process."""
+    results = []
+
+    for job in jobs:
+        hits, misses = containers.hits, containers.misses
+        start = perf_counter()
+
+        try:
+            job.run()
+        except Exception as exception:
+            logger.exception(f"Job {job.name} failed.")
+            error: str | None = f"{type(exception).__name__}: {exception}"
+        else:
+            error = None
+
+        cache_hit = containers.hits > hits and containers.misses == misses
+        results.append(JobResult(job.name, perf_counter() - start, cache_hit, error))
+
+    return results
+
+
+class BatchRunner:
+    """Run batch jobs in a pool of worker processes.
+
+    :param workers: Maximum number of worker processes, defaults to the number of
+        processors.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        """Initialise BatchRunner."""
+        self.workers = workers
+
+    def run(self, jobs: list[Job]) -> list[JobResult]:
+        """Run jobs, returning results in job order."""
+        groups = group_jobs(jobs)
+
+        with tempfile.TemporaryDirectory() as directory:
+            if len(groups) == 1 and self.workers != 1:
+                groups = share_jobs(groups[0], Path(directory))
+
+            results = self._run(groups)
+
+        order = {job.name: index for index, job in enumerate(jobs)}
+
+        return sorted(results, key=lambda result: order[result.name])
+
+    def _run(self, groups: list[list[Job]]) -> list[JobResult]:
+        """Run groups of jobs, in worker processes if there is more than one."""
+        if len(groups) <= 1 or self.workers == 1:
+            return [result for group in groups for result in run_jobs(group)]
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=set_mesh_settings,
+            initargs=(mesh_settings(),),
+        ) as executor:
+            grouped = executor.map(run_jobs, groups)
+            return [result for group in grouped for result in group]
+
+
+def write_summary(results: list[JobResult], total: float) -> None:
+    """Write per-job timings and cache hits to stderr."""
+    for result in results:
+        sys.stderr.write(f"{result}\n")
+
+    hits = sum(result.cache_hit for result in results)
+    failures = sum(result.error is not None for result in results)
+
+    sys.stderr.write(
+        f"{len(results)} jobs in {total:.2f}s, {hits} cache hits, "
+        f"{failures} failed.\n"
+    )
@@ -0,0 +1,210 @@
+"""Persistent console daemon.
+
+``console serve`` keeps a process with CadQuery imported and containers cached
+listening on a Unix socket. ``console --via-daemon`` forwards its command line to the
+daemon and streams the output back, avoiding the import and build time of each run.
+
+Messages are newline delimited JSON objects. The client sends a single request
+``{"argv": [...], "cwd": "..."}``. The daemon responds with any number of
+``{"stdout": "..."}`` and ``{"stderr": "..."}`` messages followed by
+``{"exit": status}``.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import sys
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from socketserver import StreamRequestHandler, UnixStreamServer
+from typing import Any
+
+from osr_mechanical.cache import containers
+
+logger = logging.getLogger(__name__)
+
+Command = Callable[[list[str]], Any]
+
+
+def default_socket_path() -> Path:
+    """Get default daemon socket path.
+
+    Uses ``$XDG_RUNTIME_DIR`` when available, otherwise the temporary directory.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+
+    if runtime_dir:
+        return Path(runtime_dir) / "osr-console.sock"
+
+    return Path(tempfile.gettempdir()) / f"osr-console-{os.getuid()}.sock"
+
+
+def exit_status(code: Any) -> int:
+    """Convert ``SystemExit.code`` to an exit status."""
+    if code is None:
+        return os.EX_OK
+
+    if isinstance(code, int):
+        return code
+
+    return 1
+
+
+class MessageWriter(io.TextIOBase):
+    """Text stream writing each write as a message to a socket."""
+
+    def __init__(self, stream: io.BufferedIOBase, name: str) -> None:
+        """Initialise MessageWriter."""
+        self.stream = stream
+        self.name = name
+
+    def writable(self) -> bool:
+        """Stream is writable."""
+        return True
+
+    def write(self, text: str) -> int:
+        """Send text to the client."""
+        if text:
+            send_message(self.stream, {self.name: text})
+
+        return len(text)
+
+
+def send_message(stream: io.BufferedIOBase, message: dict[str, Any]) -> None:
+    """Write a newline delimited JSON message."""
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+class CommandHandler(StreamRequestHandler):
+    """Run a single console command for a client."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        """Handle client request."""
+        line = self.rfile.readline()
+
+        if not line:
+            return
+
+        request = json.loads(line)
+
+        stdout = MessageWriter(self.wfile, "stdout")
+        stderr = MessageWriter(self.wfile, "stderr")
+
+        try:
+            status = self.server.run(request["argv"], request["cwd"], stdout, stderr)
+        except BrokenPipeError:
+            logger.warning("Client disconnected.")
+            return
+
+        send_message(self.wfile, {"exit": status})
+
+
+class DaemonServer(UnixStreamServer):
+    """Console daemon.
+
+    Commands are run one at a time in the daemon process so that imported modules
+    and cached containers are reused.
+
+    :param socket_path: Unix socket path.
+    :param command: Console entry point, called with the command line arguments.
+    """
+
+    def __init__(self, socket_path: Path, command: Command) -> None:
+        """Initialise DaemonServer."""
+        self.socket_path = socket_path
+        self.command = command
+
+        remove_stale_socket(socket_path)
+
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), CommandHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        """Close and remove socket."""
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+    def run(
+        self, argv: list[str], cwd: str, stdout: io.TextIOBase, stderr: io.TextIOBase
+    ) -> int:
+        """Run command with output redirected and the client working directory."""
+        log_handler = logging.StreamHandler(stderr)
+        root_logger = logging.getLogger()
+        log_level = root_logger.level
+
+        streams = sys.stdin, sys.stdout, sys.stderr
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO(), stdout, stderr
+        working_directory = os.getcwd()
+        root_logger.addHandler(log_handler)
+
+        try:
+            os.chdir(cwd)
+            self.command(argv)
+        except SystemExit as exception:
+            return exit_status(exception.code)
+        except Exception:
+            logger.exception(f"Command failed {argv}.")
+            return 1
+        finally:
+            root_logger.removeHandler(log_handler)
+            root_logger.setLevel(log_level)
+            sys.stdin, sys.stdout, sys.stderr = streams
+            os.chdir(working_directory)
+            logger.info(
+                f"{' '.join(argv)}: "
+                f"{containers.hits} container cache hits, {containers.misses} misses."
+            )
+
+        return os.EX_OK
+
+
+def remove_stale_socket(socket_path: Path) -> None:
+    """Remove socket left by a daemon that is no longer running."""
+    if not socket_path.is_socket():
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+            return
+
+    raise RuntimeError(f"Daemon already listening on {socket_path}.")
+
+
+def forward(socket_path: Path, argv: list[str]) -> int:
+    """Run command in the daemon, streaming output to stdout and stderr.
+
+    :raises ConnectionError: if the daemon is not running.
+    :raises FileNotFoundError: if the socket does not exist.
+
+    :return: exit status
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+
+        with client.makefile("rwb") as stream:
+            send_message(stream, {"argv": argv, "cwd": os.getcwd()})
+
+            for line in stream:
+                message = json.loads(line)
+
+                if "exit" in message:
+                    return int(message["exit"])
+
+                for name, text in message.items():
+                    output = sys.stderr if name == "stderr" else sys.stdout
+                    output.write(text)
+                    output.flush()
+
+    raise ConnectionError("Daemon closed connection before command completed.")
@@ -1,18 +1,16 @@
 """Custom exporters."""
 
-from configparser import ConfigParser
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
-from math import ceil
 from pathlib import Path
-from subprocess import run
-from tempfile import TemporaryDirectory
-from typing import Any
 
-from PIL import Image, ImageDraw, ImageFont
+from cadquery import Assembly, Shape
+from PIL import Image, ImageOps
 from PIL.ExifTags import TAGS
 from PIL.Image import Exif
 
-from osr_common.cq_wrappers import Export as ExportWrapper
+from osr_mechanical.cache import containers
 from osr_mechanical.config import (
     COPYRIGHT_NOTICE,
     COPYRIGHT_OWNER,
@@ -20,14 +18,36 @@ from osr_mechanical.config import (
     PROJECT_HOST,
     PROJECT_URL,
 )
+from osr_mechanical.console.images import FONT_PATH, Labeller, optimise_pngs
+from osr_mechanical.console.renderers import (
+    Camera,
+    Renderer,
+    View,
+    default_renderer,
+)
 from osr_mechanical.final import FinalAssembly
 
 
+@dataclass(frozen=True)
+class ViewSpec:
+    """PNG image of a view.
+
+    :param out_file: Output file.
+    :param view: Camera and image size.
+    :param label: Label image.
+    """
+
+    out_file: Path
+    view: View = View()
+    label: bool = True
+
+
 class ExportPNG:
-    """Export PNG raster image using Mayo.
+    """Export PNG raster images.
 
-    `Mayo <https://github.com/fougue/mayo>`_ 3D CAD viewer and converter based on Qt
-    and OpenCascade.
+    :param shape: Shape or assembly to be rendered, defaults to the final assembly.
+    :param renderer: Renderer, defaults to in-process offscreen rendering with VTK
+        if available, otherwise Mayo.
     """
 
     EXIF_DATE_FORMAT = "%Y:%m:%d %H:%M:%S"
@@ -37,177 +57,92 @@ class ExportPNG:
         out_file: Path,
         width: int = 1000,
         height: int = 750,
-        mayo_config: dict[str, Any] | None = None,
         label: bool = True,
+        shape: Shape | Assembly | None = None,
+        renderer: Renderer | None = None,
+        camera: Camera | None = None,
     ) -> None:
         """Initialise ExportPNG."""
         self.out_file = out_file
         self.width = width
         self.height = height
-        self.mayo_config = mayo_config
         self.label = label
+        self.shape = shape
+        self.renderer = renderer or default_renderer()
+        self.camera = camera or Camera()
 
         self.now = datetime.utcnow()
-        self.font_path = Path("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+        self.font_path = FONT_PATH
 
     def export(self) -> Path:
         """Export PNG image."""
-        with TemporaryDirectory() as tmp_directory_name:
-            tmp_directory = Path(tmp_directory_name)
+        view = View(self.camera, self.width, self.height)
 
-            step_pathname = self.export_step(tmp_directory)
+        return self.export_views([ViewSpec(self.out_file, view, self.label)])[0]
 
-            mayo_config = self.create_mayo_config(
-                self.height, self.width, self.mayo_config
-            )
-            mayo_config_pathname = Path(tmp_directory / "mayo.ini")
-            with mayo_config_pathname.open("w") as file:
-                mayo_config.write(file)
+    def export_views(self, specs: list[ViewSpec]) -> list[Path]:
+        """Export PNG images of views, rendering the model once.
 
-            exported_png = self.export_png(mayo_config_pathname, step_pathname)
+        Each camera is rendered once for landscape and once for portrait images, at
+        a size covering all of them. Images are cropped and downscaled from it.
+        """
+        shape = self.shape
 
-            result_path = Path(tmp_directory / "result.png")
-            image = Image.open(exported_png)
+        if shape is None:
+            shape = containers.get(FinalAssembly).cq_object
 
-            if self.label:
-                label = f"{PROJECT_HOST}    {self.now.strftime('%Y-%m-%d')}"
-                image = self.label_image(image, label)
+        sources = self.downscale_sources([spec.view for spec in specs])
+        unique = list(dict.fromkeys(sources))
+        rendered = dict(zip(unique, self.renderer.render(shape, unique)))
 
-            exif = self.exif_tags()
-            image.save(result_path, exif=exif)
+        labeller = Labeller(
+            f"{PROJECT_HOST}    {self.now.strftime('%Y-%m-%d')}", self.font_path
+        )
+        images = []
 
-            self.optimise_png(result_path)
+        for spec, source in zip(specs, sources):
+            image = rendered[source]
 
-            result_path.rename(self.out_file)
+            if image.size != spec.view.size:
+                image = ImageOps.fit(image, spec.view.size, Image.Resampling.LANCZOS)
 
-        return self.out_file
+            images.append((labeller(image) if spec.label else image, spec.out_file))
 
-    @staticmethod
-    def export_step(out_directory: Path) -> Path:
-        """Export STEP from CadQuery model."""
-        pathname = out_directory / "result.step"
-        cq_object = FinalAssembly().cq_object.toCompound()
-
-        export = ExportWrapper()
-
-        export(
-            cq_object,
-            pathname,
-            tolerance=0.01,
-            angular_tolerance=0.1,
-        )
+        optimise_pngs(images, self.exif_tags())
 
-        return pathname
+        return [spec.out_file for spec in specs]
 
     @staticmethod
-    def create_mayo_config(
-        height: int, width: int, mayo_config: dict[str, Any] | None = None
-    ) -> ConfigParser:
-        """Create mayo config.
-
-        Mayo config file keys are case-sensitive. To prevent ``configparser`` from
-        forcing keys to lower-case ``configparser.RawConfigParser.optionxform`` is
-        monkey patched.
-        """
-        config = ConfigParser()
+    def downscale_sources(views: list[View]) -> list[View]:
+        """Get view to render for each view.
 
-        # allow mixed case keys
-        config.optionxform = lambda optionstr: optionstr  # type: ignore[method-assign]
+        Renderers fit the model to the shorter side of an image. Landscape views
+        with the same camera are cropped from the full height of a view as wide as
+        the widest of them and as high as the highest, portrait views likewise from
+        the full width of a view.
+        """
+        groups: dict[tuple[Camera, bool], list[View]] = defaultdict(list)
 
-        config["application"] = {
-            "language": "en",
-        }
+        for view in views:
+            groups[(view.camera, view.width >= view.height)].append(view)
 
-        config["export"] = {
-            "Image\\backgroundColor": "#000000",
-            "Image\\cameraOrientation": "1, -1, 1",
-            "Image\\cameraProjection": "Orthographic",
-            "Image\\height": str(height),
-            "Image\\width": str(width),
+        sources = {
+            key: ExportPNG.covering_view(*key, group) for key, group in groups.items()
         }
 
-        if mayo_config is not None:
-            config.read_dict(mayo_config)
-
-        return config
+        return [sources[(view.camera, view.width >= view.height)] for view in views]
 
     @staticmethod
-    def export_png(mayo_config_pathname: Path, in_file: Path) -> Path:
-        """Export PNG image from STEP file."""
-        out_file = Path(in_file.parent / "exported-from-step.png")
-
-        result = run(
-            [
-                "mayo",
-                "--settings",
-                mayo_config_pathname,
-                in_file,
-                "--export",
-                out_file,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        result.check_returncode()
-
-        return out_file
-
-    @staticmethod
-    def optimise_png(in_file: Path) -> None:
-        """Optimise PNG with optipng."""
-        result = run(
-            [
-                "optipng",
-                in_file,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        result.check_returncode()
-
-    def label_image(
-        self,
-        image: Image,  # type: ignore[valid-type]
-        text: str,
-        font_size: int = 20,
-    ) -> Image:  # type: ignore[valid-type]
-        """Label image."""
-        font = ImageFont.truetype(str(self.font_path), font_size)
-
-        label_bg_color = (255, 255, 255)
-        label_fg_color = (0, 0, 0)
-
-        left, top, right, bottom = font.getbbox(text)
-        del left, right
-
-        text_height = bottom - top
-        label_height = ceil(text_height * 1.2)
-
-        label = Image.new(
-            image.mode,  # type: ignore[attr-defined]
-            (image.width, label_height),  # type: ignore[attr-defined]
-            label_bg_color,
-        )
-        label_draw = ImageDraw.Draw(label)
-        label_draw.text(
-            (label.width / 2, label.height / 2),
-            text,
-            label_fg_color,
-            font=font,
-            anchor="mm",
-        )
-
-        result = Image.new(
-            image.mode,  # type: ignore[attr-defined]
-            (
-                image.width,  # type: ignore[attr-defined]
-                image.height + label.height,  # type: ignore[attr-defined]
-            ),
-        )
-        result.paste(image, (0, 0))
-        result.paste(label, (0, image.height))  # type: ignore[attr-defined]
-
-        return result
+    def covering_view(camera: Camera, landscape: bool, views: list[View]) -> View:
+        """Get the smallest view each landscape or portrait view can be cropped from."""
+        if landscape:
+            height = max(view.height for view in views)
+            width = max(-(-height * view.width // view.height) for view in views)
+        else:
+            width = max(view.width for view in views)
+            height = max(-(-width * view.height // view.width) for view in views)
+
+        return View(camera, width, height)
 
     def exif_tags(self) -> Exif:
         """Create EXIF tags."""
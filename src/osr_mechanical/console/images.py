@@ -0,0 +1,148 @@
+"""Raster image labelling and PNG optimisation.
+
+PNG images are optimised in-process. Images with at most 256 colours are converted
+to a palette losslessly, then encoded with each zlib strategy at maximum
+compression keeping the smallest, similar to the trials of ``optipng``. zlib
+releases the GIL so that images are optimised concurrently in a thread pool.
+
+Example usage:
+
+.. code-block:: python
+
+    labeller = Labeller("example.com    2024-01-01")
+    optimise_pngs([(labeller(image), out_file) for image, out_file in images])
+"""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from io import BytesIO
+from math import ceil
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+from PIL.Image import Exif
+
+FONT_PATH = Path("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf")
+
+#: zlib strategies tried when encoding PNG images.
+STRATEGIES = (Image.DEFAULT_STRATEGY, Image.FILTERED, Image.RLE)
+
+
+@cache
+def font(path: Path, size: int) -> ImageFont.FreeTypeFont:
+    """Load font, each font is loaded once."""
+    return ImageFont.truetype(str(path), size)
+
+
+class Labeller:
+    """Append a label below images.
+
+    The label is rendered once for each image width.
+
+    :param text: Label text.
+    :param font_path: TrueType font.
+    :param font_size: Font size in points.
+    """
+
+    BACKGROUND = (255, 255, 255)
+    FOREGROUND = (0, 0, 0)
+
+    def __init__(
+        self, text: str, font_path: Path = FONT_PATH, font_size: int = 20
+    ) -> None:
+        """Initialise Labeller."""
+        self.text = text
+        self.font = font(font_path, font_size)
+
+        self._labels: dict[tuple[str, int], Image.Image] = {}
+
+    def label(self, mode: str, width: int) -> Image.Image:
+        """Get label of width."""
+        key = (mode, width)
+
+        if key not in self._labels:
+            _left, top, _right, bottom = self.font.getbbox(self.text)
+            label = Image.new(
+                mode, (width, ceil((bottom - top) * 1.2)), self.BACKGROUND
+            )
+            ImageDraw.Draw(label).text(
+                (label.width / 2, label.height / 2),
+                self.text,
+                self.FOREGROUND,
+                font=self.font,
+                anchor="mm",
+            )
+            self._labels[key] = label
+
+        return self._labels[key]
+
+    def __call__(self, image: Image.Image) -> Image.Image:
+        """Label image."""
+        label = self.label(image.mode, image.width)
+
+        result = Image.new(image.mode, (image.width, image.height + label.height))
+        result.paste(image, (0, 0))
+        result.paste(label, (0, image.height))
+
+        return result
+
+
+def reduce_palette(image: Image.Image) -> Image.Image:
+    """Convert RGB image with at most 256 colours to a palette image losslessly."""
+    if image.mode != "RGB" or image.getcolors(256) is None:
+        return image
+
+    pixels = np.asarray(image, dtype=np.uint32)
+    keys = pixels[..., 0] << 16 | pixels[..., 1] << 8 | pixels[..., 2]
+    colors, indices = np.unique(keys, return_inverse=True)
+
+    result = Image.fromarray(indices.reshape(keys.shape).astype(np.uint8), "P")
+    palette = np.stack([colors >> 16, colors >> 8 & 0xFF, colors & 0xFF], axis=1)
+    result.putpalette(palette.astype(np.uint8).tobytes())
+
+    return result
+
+
+def encode_png(image: Image.Image, exif: Exif | None = None) -> bytes:
+    """Encode PNG image with each zlib strategy, returning the smallest."""
+    image = reduce_palette(image)
+    result = b""
+
+    for strategy in STRATEGIES:
+        buffer = BytesIO()
+        image.save(
+            buffer,
+            "PNG",
+            optimize=True,
+            compress_type=strategy,
+            exif=exif or Exif(),
+        )
+
+        if not result or buffer.tell() < len(result):
+            result = buffer.getvalue()
+
+    return result
+
+
+def optimise_png(image: Image.Image, out_file: Path, exif: Exif | None = None) -> Path:
+    """Write optimised PNG image."""
+    out_file.write_bytes(encode_png(image, exif))
+
+    return out_file
+
+
+def optimise_pngs(
+    images: Sequence[tuple[Image.Image, Path]],
+    exif: Exif | None = None,
+    workers: int | None = None,
+) -> list[Path]:
+    """Write optimised PNG images concurrently."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda item: optimise_png(item[0], item[1], exif),
+                images,
+            )
+        )
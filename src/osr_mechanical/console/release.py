@@ -1,16 +1,17 @@
 """Release builder."""
 
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from shutil import rmtree
-from subprocess import run
 from zipfile import ZIP_DEFLATED, ZipFile
 
-from cadquery import exporters
 from jinja2 import Environment, PackageLoader, select_autoescape
 
+from osr_common.changelog import changelogs
 from osr_common.cq_wrappers import Export as ExportWrapper
+from osr_common.tessellation import as_shape, tessellations
 from osr_mechanical import __version__
 from osr_mechanical import __version__ as project_version
 from osr_mechanical.bom.bom import Bom
@@ -45,13 +46,21 @@ class ReleaseBuilder:
         self.remove_directory(self.release_directory)
         self.release_directory.mkdir()
 
-        self.readme(self.release_directory / "README.md")
-        self.docs_redirect_file(self.release_directory / "docs-redirect.html")
-        self.changelog(self.release_directory / "CHANGELOG.md")
-        self.final_assembly_step(self.release_directory / f"{PROJECT_NAME}.step")
-        self.final_assembly_png(self.release_directory / f"{PROJECT_NAME}.png")
-        self.jigs(self.release_directory / "jigs")
-        self.bom(self.release_directory / "bom")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # external tool runs while models are exported
+            changelog = executor.submit(
+                self.changelog, self.release_directory / "CHANGELOG.md"
+            )
+
+            self.readme(self.release_directory / "README.md")
+            self.docs_redirect_file(self.release_directory / "docs-redirect.html")
+            self.final_assembly_step(self.release_directory / f"{PROJECT_NAME}.step")
+            self.final_assembly_png(self.release_directory / f"{PROJECT_NAME}.png")
+            self.jigs(self.release_directory / "jigs")
+            self.bom(self.release_directory / "bom")
+
+            changelog.result()
+
         self.archive()
 
     @staticmethod
@@ -96,16 +105,9 @@ class ReleaseBuilder:
         return out_file.write_text(result)
 
     @staticmethod
-    def changelog(out_file: Path) -> int:
-        """Create changelog."""
-        result = run(
-            ["cz", "changelog", "--file-name", out_file],
-            capture_output=True,
-            text=True,
-        )
-        result.check_returncode()
-
-        return result.returncode
+    def changelog(out_file: Path) -> None:
+        """Create changelog, cached by git revision."""
+        out_file.write_text(changelogs.text(out_file.name, check=True))
 
     @staticmethod
     def final_assembly_step(out_file: Path) -> None:
@@ -134,10 +136,9 @@ class ReleaseBuilder:
 
         end_tap_jig_pathname = out_directory / "vslot-end-tap-jig-2020.stl"
         end_tap_jig = EndTapJig(simple=True)
-        exporters.export(
-            end_tap_jig.cq_part("2020_end_tap_jig__body"),
-            str(end_tap_jig_pathname),
-        )
+        body = as_shape(end_tap_jig.cq_part("2020_end_tap_jig__body"))
+
+        tessellations.get(body).write_stl(end_tap_jig_pathname)
 
     @staticmethod
     def bom(out_directory: Path) -> None:
@@ -0,0 +1,431 @@
+"""Raster image renderers.
+
+Renderers render a list of :class:`View`, each a camera and image size, so that a
+model is loaded and tessellated once for all views. Camera settings are shared so
+that images are framed the same whichever renderer is used.
+
+* :class:`VTKRenderer` renders offscreen in-process from the tessellation cache.
+* :class:`MayoRenderer` renders an STL file with the external
+  `Mayo <https://github.com/fougue/mayo>`_ 3D CAD viewer and converter.
+
+:func:`default_renderer` uses VTK where it can create an OpenGL context, otherwise
+Mayo.
+"""
+
+import logging
+import os
+import sys
+from configparser import ConfigParser
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Protocol, Sequence
+
+import cadquery as cq
+import numpy as np
+from PIL import Image
+from vtkmodules import vtkRenderingOpenGL2  # registers render window
+from vtkmodules.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
+from vtkmodules.vtkCommonMath import vtkMatrix4x4
+from vtkmodules.vtkFiltersCore import vtkPolyDataNormals
+from vtkmodules.vtkRenderingCore import (
+    vtkActor,
+    vtkPolyDataMapper,
+    vtkRenderer,
+    vtkRenderWindow,
+    vtkWindowToImageFilter,
+)
+
+from osr_common.tessellation import Mesh, as_shape, assembly_parts, tessellations
+from osr_common.tools import tools
+
+logger = logging.getLogger(__name__)
+
+RGB = tuple[float, float, float]
+
+#: Render windows of VTK builds rendering without a display.
+HEADLESS_RENDER_WINDOWS = ("vtkEGLRenderWindow", "vtkOSOpenGLRenderWindow")
+
+
+@dataclass(frozen=True)
+class Camera:
+    """Camera and scene settings.
+
+    :param direction: Direction from the model to the camera, Z is up.
+    :param orthographic: Use orthographic rather than perspective projection.
+    :param background: Background colour as a hex triplet.
+    """
+
+    direction: tuple[float, float, float] = (1, -1, 1)
+    orthographic: bool = True
+    background: str = "#000000"
+
+    @property
+    def background_rgb(self) -> RGB:
+        """Background colour with components in the range 0 to 1."""
+        value = int(self.background.lstrip("#"), 16)
+
+        return ((value >> 16) / 255, (value >> 8 & 0xFF) / 255, (value & 0xFF) / 255)
+
+    @property
+    def view_up(self) -> tuple[float, float, float]:
+        """Up direction of the image, Z unless looking along Z."""
+        x, y, _z = self.direction
+
+        return (0, 0, 1) if x or y else (0, 1, 0)
+
+
+#: Named cameras.
+CAMERAS = {
+    "iso": Camera(),
+    "top": Camera((0, 0, 1)),
+    "front": Camera((0, -1, 0)),
+    "side": Camera((1, 0, 0)),
+}
+
+
+@dataclass(frozen=True)
+class View:
+    """Camera and image size in pixels."""
+
+    camera: Camera = Camera()
+    width: int = 1000
+    height: int = 750
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Image width and height."""
+        return self.width, self.height
+
+
+class Renderer(Protocol):
+    """Raster image renderer."""
+
+    def render(
+        self, cq_object: cq.Shape | cq.Assembly, views: Sequence[View]
+    ) -> list[Image.Image]:
+        """Render views of shape or assembly."""
+
+
+@dataclass(frozen=True)
+class Part:
+    """Tessellated part of a scene.
+
+    :param mesh: Part mesh.
+    :param color: Part colour.
+    :param matrix: Row-major 3 by 4 transformation matrix, ``None`` for identity.
+    """
+
+    mesh: Mesh
+    color: RGB
+    matrix: tuple[float, ...] | None = None
+
+
+class VTKRenderer:
+    """Render offscreen in-process using VTK.
+
+    Each part of an assembly is rendered from the tessellation cache, parts used
+    more than once are tessellated once. Requires an OpenGL context, on hosts without
+    a display use the ``vtk-osmesa`` wheel or ``xvfb-run``. Without one,
+    :class:`RuntimeError` is raised before VTK is asked for a render window, as VTK
+    aborts the process when it cannot connect to an X server.
+
+    :param tolerance: Tessellation tolerance.
+    :param angular_tolerance: Tessellation angular tolerance.
+    """
+
+    #: Colour of parts without a colour.
+    COLOR: RGB = (0.8, 0.8, 0.8)
+
+    def __init__(self, tolerance: float = 0.01, angular_tolerance: float = 0.1) -> None:
+        """Initialise VTKRenderer."""
+        self.tolerance = tolerance
+        self.angular_tolerance = angular_tolerance
+
+    def render(
+        self, cq_object: cq.Shape | cq.Assembly, views: Sequence[View]
+    ) -> list[Image.Image]:
+        """Render views of shape or assembly."""
+        return self.render_parts(self.parts(cq_object), views)
+
+    @staticmethod
+    def available() -> bool:
+        """Check whether an OpenGL context can be created for offscreen rendering.
+
+        VTK renders without a display on Windows, macOS and with OSMesa or EGL
+        builds, otherwise an X server is required.
+        """
+        if sys.platform in ("darwin", "win32"):
+            return True
+
+        if any(hasattr(vtkRenderingOpenGL2, name) for name in HEADLESS_RENDER_WINDOWS):
+            return True
+
+        return x_display_available()
+
+    @classmethod
+    def check_available(cls) -> None:
+        """Raise an exception if an OpenGL context cannot be created."""
+        if not cls.available():
+            raise RuntimeError(
+                "VTK cannot render without a display, use the Mayo renderer, the "
+                "vtk-osmesa wheel or xvfb-run."
+            )
+
+    def parts(self, cq_object: cq.Shape | cq.Assembly) -> list[Part]:
+        """Tessellate shape or each part of assembly."""
+        if not isinstance(cq_object, cq.Assembly):
+            return [Part(self.mesh(cq_object), self.COLOR)]
+
+        return [
+            Part(
+                self.mesh(shape),
+                color.toTuple()[:3] if color else self.COLOR,
+                self.matrix(location),
+            )
+            for shape, _name, location, color in assembly_parts(cq_object)
+        ]
+
+    def mesh(self, shape: cq.Shape) -> Mesh:
+        """Get cached tessellation of shape."""
+        return tessellations.get(shape, self.tolerance, self.angular_tolerance)
+
+    @classmethod
+    def render_parts(
+        cls, parts: list[Part], views: Sequence[View]
+    ) -> list[Image.Image]:
+        """Render views of parts, the scene is created once."""
+        cls.check_available()
+
+        renderer = cls.scene(parts)
+
+        window = vtkRenderWindow()
+        window.SetOffScreenRendering(True)
+        window.AddRenderer(renderer)
+
+        result = []
+
+        for view in views:
+            # the camera is fitted to the aspect ratio of the window
+            window.SetSize(view.width, view.height)
+            cls.set_camera(renderer, view.camera)
+            window.Render()
+            result.append(cls.capture(window))
+
+        window.Finalize()
+
+        return result
+
+    @staticmethod
+    def capture(window: vtkRenderWindow) -> Image.Image:
+        """Capture rendered image."""
+        capture = vtkWindowToImageFilter()
+        capture.SetInput(window)
+        capture.SetInputBufferTypeToRGB()
+        capture.ReadFrontBufferOff()
+        capture.Update()
+
+        image = capture.GetOutput()
+        width, height, _ = image.GetDimensions()
+        pixels = vtk_to_numpy(image.GetPointData().GetScalars())
+
+        return Image.fromarray(np.flipud(pixels.reshape(height, width, -1)), "RGB")
+
+    @classmethod
+    def scene(cls, parts: list[Part]) -> vtkRenderer:
+        """Create renderer with an actor for each part."""
+        renderer = vtkRenderer()
+
+        for part in parts:
+            renderer.AddActor(cls.actor(part))
+
+        return renderer
+
+    @staticmethod
+    def set_camera(renderer: vtkRenderer, camera: Camera) -> None:
+        """Set background and position camera to fit the scene."""
+        renderer.SetBackground(*camera.background_rgb)
+
+        active_camera = renderer.GetActiveCamera()
+        active_camera.SetFocalPoint(0, 0, 0)
+        active_camera.SetPosition(*camera.direction)
+        active_camera.SetViewUp(*camera.view_up)
+        active_camera.SetParallelProjection(camera.orthographic)
+        renderer.ResetCamera()
+
+    @classmethod
+    def actor(cls, part: Part) -> vtkActor:
+        """Create actor from part."""
+        normals = vtkPolyDataNormals()
+        normals.SetInputData(cls.polydata(part.mesh))
+
+        mapper = vtkPolyDataMapper()
+        mapper.SetInputConnection(normals.GetOutputPort())
+
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        actor.GetProperty().SetColor(*part.color)
+
+        if part.matrix is not None:
+            matrix = vtkMatrix4x4()
+            matrix.DeepCopy((*part.matrix, 0, 0, 0, 1))
+            actor.SetUserMatrix(matrix)
+
+        return actor
+
+    @staticmethod
+    def polydata(mesh: Mesh) -> vtkPolyData:
+        """Convert mesh to VTK poly data."""
+        points = vtkPoints()
+        points.SetData(numpy_to_vtk(mesh.vertices, deep=True))
+
+        triangles = vtkCellArray()
+        triangles.SetData(
+            3, numpy_to_vtk(mesh.triangles.ravel().astype(np.int64), deep=True)
+        )
+
+        result = vtkPolyData()
+        result.SetPoints(points)
+        result.SetPolys(triangles)
+
+        return result
+
+    @staticmethod
+    def matrix(location: cq.Location) -> tuple[float, ...]:
+        """Convert location to a row-major 3 by 4 transformation matrix."""
+        transformation = location.wrapped.Transformation()
+
+        return tuple(
+            transformation.Value(row, column)
+            for row in range(1, 4)
+            for column in range(1, 5)
+        )
+
+
+class MayoRenderer:
+    """Render using Mayo.
+
+    The STL file is written once, Mayo is run concurrently for each view.
+
+    :param mayo_config: Mayo settings, overriding view settings.
+    """
+
+    def __init__(self, mayo_config: dict[str, Any] | None = None) -> None:
+        """Initialise MayoRenderer."""
+        self.mayo_config = mayo_config
+
+    def render(
+        self, cq_object: cq.Shape | cq.Assembly, views: Sequence[View]
+    ) -> list[Image.Image]:
+        """Render views of shape or assembly from the tessellation cache."""
+        with TemporaryDirectory() as tmp_directory_name:
+            tmp_directory = Path(tmp_directory_name)
+
+            mesh_pathname = tmp_directory / "result.stl"
+            tessellations.get(
+                as_shape(cq_object), tolerance=0.01, angular_tolerance=0.1
+            ).write_stl(mesh_pathname)
+
+            commands = []
+            out_files = []
+
+            for index, view in enumerate(views):
+                mayo_config_pathname = tmp_directory / f"{index}.ini"
+                with mayo_config_pathname.open("w") as file:
+                    self.create_mayo_config(view).write(file)
+
+                out_files.append(tmp_directory / f"{index}.png")
+                commands.append(
+                    self.command(mayo_config_pathname, mesh_pathname, out_files[-1])
+                )
+
+            for result in tools.run_all(commands):
+                result.check_returncode()
+
+            return [self.load(out_file) for out_file in out_files]
+
+    @staticmethod
+    def load(in_file: Path) -> Image.Image:
+        """Load image into memory."""
+        with Image.open(in_file) as image:
+            image.load()
+
+        return image
+
+    def create_mayo_config(self, view: View) -> ConfigParser:
+        """Create mayo config.
+
+        Mayo config file keys are case-sensitive. To prevent ``configparser`` from
+        forcing keys to lower-case ``configparser.RawConfigParser.optionxform`` is
+        monkey patched.
+        """
+        config = ConfigParser()
+
+        # allow mixed case keys
+        config.optionxform = lambda optionstr: optionstr  # type: ignore[method-assign]
+
+        config["application"] = {
+            "language": "en",
+        }
+
+        camera = view.camera
+        projection = "Orthographic" if camera.orthographic else "Perspective"
+        config["export"] = {
+            "Image\\backgroundColor": camera.background,
+            "Image\\cameraOrientation": ", ".join(map(str, camera.direction)),
+            "Image\\cameraProjection": projection,
+            "Image\\height": str(view.height),
+            "Image\\width": str(view.width),
+        }
+
+        if self.mayo_config is not None:
+            config.read_dict(self.mayo_config)
+
+        return config
+
+    @staticmethod
+    def command(
+        mayo_config_pathname: Path, in_file: Path, out_file: Path
+    ) -> list[str | Path]:
+        """Mayo command to export PNG image from mesh or STEP file."""
+        return [
+            "mayo",
+            "--settings",
+            mayo_config_pathname,
+            in_file,
+            "--export",
+            out_file,
+        ]
+
+
+def x_display_available() -> bool:
+    """Check whether ``$DISPLAY`` names an X server.
+
+    The socket of a local display is checked, remote displays are assumed to exist.
+    """
+    display = os.environ.get("DISPLAY", "")
+    host, _separator, number = display.rpartition(":")
+
+    if not display or host not in ("", "unix"):
+        return bool(display)
+
+    return Path(f"/tmp/.X11-unix/X{number.partition('.')[0]}").exists()
+
+
+def default_renderer() -> Renderer:
+    """Get VTK renderer if it can render offscreen, otherwise Mayo renderer."""
+    if VTKRenderer.available():
+        return VTKRenderer()
+
+    logger.info("VTK cannot render without a display, rendering with Mayo.")
+
+    return MayoRenderer()
+
+
+RENDERERS: dict[str, Callable[[], Renderer]] = {
+    "auto": default_renderer,
+    "mayo": MayoRenderer,
+    "vtk": VTKRenderer,
+}
@@ -0,0 +1,180 @@
+"""Turntable animation exporter.
+
+Render frames with the camera rotating around an axis and assemble them into an
+animated PNG, WebP or GIF.
+
+With VTK the model is tessellated once, frames are rendered by a pool of worker
+processes each creating the VTK scene once for a contiguous run of frames. Mayo runs
+concurrently for each frame.
+
+Example usage:
+
+.. code-block:: python
+
+    turntable = Turntable(frames=120, width=640, height=480)
+    turntable.export(FinalAssembly().cq_object, Path("turntable.webp"))
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from itertools import repeat
+from math import cos, radians, sin
+from os import cpu_count
+from pathlib import Path
+from typing import Any
+
+import cadquery as cq
+import numpy as np
+from PIL import Image
+
+from osr_mechanical.console.renderers import (
+    Camera,
+    Renderer,
+    View,
+    VTKRenderer,
+    default_renderer,
+)
+
+Vector3 = tuple[float, float, float]
+
+#: Pillow save options by file extension.
+FORMATS: dict[str, dict[str, Any]] = {
+    ".gif": {"optimize": True, "disposal": 2},
+    ".png": {"optimize": True},
+    ".webp": {"quality": 80, "method": 6},
+}
+
+
+def rotate(vector: Vector3, axis: Vector3, angle: float) -> Vector3:
+    """Rotate vector around axis by angle in degrees."""
+    v = np.array(vector, dtype=float)
+    k = np.array(axis, dtype=float)
+    k /= np.linalg.norm(k)
+    theta = radians(angle)
+
+    result = (
+        v * cos(theta)
+        + np.cross(k, v) * sin(theta)
+        + k * np.dot(k, v) * (1 - cos(theta))
+    )
+
+    return (float(result[0]), float(result[1]), float(result[2]))
+
+
+def chunks(items: list[View], count: int) -> list[list[View]]:
+    """Split items into at most count contiguous chunks of similar length."""
+    size, remainder = divmod(len(items), count)
+    result = []
+    start = 0
+
+    for index in range(min(count, len(items))):
+        end = start + size + (index < remainder)
+        result.append(items[start:end])
+        start = end
+
+    return result
+
+
+class Turntable:
+    """Render a rotating view.
+
+    :param frames: Number of frames in a revolution.
+    :param axis: Rotation axis.
+    :param camera: Camera of the first frame.
+    :param width: Frame width in pixels.
+    :param height: Frame height in pixels.
+    :param duration: Duration of a revolution in seconds.
+    :param workers: Maximum number of VTK worker processes, defaults to the number
+        of processors.
+    :param renderer: Renderer, defaults to VTK if it can render offscreen, otherwise
+        Mayo.
+    """
+
+    def __init__(
+        self,
+        frames: int = 120,
+        axis: Vector3 = (0, 0, 1),
+        camera: Camera | None = None,
+        width: int = 640,
+        height: int = 480,
+        duration: float = 6,
+        workers: int | None = None,
+        renderer: Renderer | None = None,
+    ) -> None:
+        """Initialise Turntable."""
+        if frames < 1:
+            raise ValueError(f"Expected at least one frame, got {frames}.")
+
+        self.frames = frames
+        self.axis = axis
+        self.camera = camera or Camera()
+        self.width = width
+        self.height = height
+        self.duration = duration
+        self.workers = workers or cpu_count() or 1
+        self.renderer = renderer or default_renderer()
+
+    def views(self) -> list[View]:
+        """Get view of each frame."""
+        return [
+            View(
+                replace(
+                    self.camera,
+                    direction=rotate(
+                        self.camera.direction, self.axis, 360 * index / self.frames
+                    ),
+                ),
+                self.width,
+                self.height,
+            )
+            for index in range(self.frames)
+        ]
+
+    def render(self, cq_object: cq.Shape | cq.Assembly) -> list[Image.Image]:
+        """Render frames."""
+        if isinstance(self.renderer, VTKRenderer):
+            return self.render_vtk(self.renderer, cq_object)
+
+        return self.renderer.render(cq_object, self.views())
+
+    def render_vtk(
+        self, renderer: VTKRenderer, cq_object: cq.Shape | cq.Assembly
+    ) -> list[Image.Image]:
+        """Render frames in worker processes sharing one tessellation."""
+        renderer.check_available()
+
+        parts = renderer.parts(cq_object)
+        views = self.views()
+        frame_chunks = chunks(views, self.workers)
+
+        if len(frame_chunks) <= 1:
+            return VTKRenderer.render_parts(parts, views)
+
+        with ProcessPoolExecutor(max_workers=len(frame_chunks)) as executor:
+            rendered = executor.map(
+                VTKRenderer.render_parts, repeat(parts), frame_chunks
+            )
+
+            return [frame for chunk in rendered for frame in chunk]
+
+    def export(self, cq_object: cq.Shape | cq.Assembly, out_file: Path) -> Path:
+        """Export animation, the format is determined by the file extension."""
+        try:
+            options = FORMATS[out_file.suffix.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported animation format '{out_file.suffix}', expected one of: "
+                f"{', '.join(FORMATS)}."
+            )
+
+        first, *frames = self.render(cq_object)
+        first.save(
+            out_file,
+            save_all=True,
+            append_images=frames,
+            duration=round(1000 * self.duration / self.frames),
+            loop=0,
+            **options,
+        )
+
+        return out_file
@@ -1,6 +1,82 @@
 """Utilities."""
 
+import ast
+from argparse import ArgumentTypeError
+from typing import Any
+
 
 def snake_to_camel_case(snake_str: str) -> str:
     """Convert a snake case string to camel case."""
     return "".join(x.capitalize() for x in snake_str.lower().split("_"))
+
+
+def board_quantity(argument: str) -> tuple[str, int]:
+    """Parse a ``name[=quantity]`` command line argument."""
+    name, _, quantity = argument.partition("=")
+
+    try:
+        count = int(quantity) if quantity else 1
+    except ValueError:
+        raise ArgumentTypeError(f"Invalid quantity: '{quantity}'.")
+
+    if count < 1:
+        raise ArgumentTypeError(f"Quantity must be at least 1, got {count}.")
+
+    return name, count
+
+
+def container_argument(argument: str) -> tuple[str, Any]:
+    """Parse a ``name=value`` container argument.
+
+    Values are Python literals such as ``True`` or ``8``, otherwise strings.
+    """
+    name, separator, value = argument.partition("=")
+
+    if not separator or not name:
+        raise ArgumentTypeError(f"Invalid argument: '{argument}', expected name=value.")
+
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
+
+def positive_integer(argument: str) -> int:
+    """Parse an integer of at least one."""
+    try:
+        result = int(argument)
+    except ValueError:
+        result = 0
+
+    if result < 1:
+        raise ArgumentTypeError(f"Invalid value: '{argument}', expected at least 1.")
+
+    return result
+
+
+def image_size(argument: str) -> tuple[int, int]:
+    """Parse a ``WIDTHxHEIGHT`` image size in pixels."""
+    width, separator, height = argument.partition("x")
+
+    try:
+        size = int(width), int(height)
+    except ValueError:
+        size = (0, 0)
+
+    if not separator or min(size) < 1:
+        raise ArgumentTypeError(f"Invalid size: '{argument}', expected WIDTHxHEIGHT.")
+
+    return size
+
+
+def vector(argument: str) -> tuple[float, float, float]:
+    """Parse an ``x,y,z`` vector."""
+    try:
+        x, y, z = (float(component) for component in argument.split(","))
+    except ValueError:
+        raise ArgumentTypeError(f"Invalid vector: '{argument}', expected x,y,z.")
+
+    if not any((x, y, z)):
+        raise ArgumentTypeError("Vector must not be zero.")
+
+    return x, y, z
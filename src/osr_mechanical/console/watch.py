@@ -0,0 +1,150 @@
+"""Watch source files and incrementally rebuild an assembly.
+
+When a source file changes the module and the modules importing it, directly or
+indirectly, are reloaded. Containers are memoised so that only containers defined
+in reloaded modules are built again, unchanged sibling sub-assemblies are reused.
+"""
+
+import importlib
+import logging
+import sys
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Any
+
+from osr_common import cq_containers
+from osr_common.cq_containers import ContainerMemo
+from osr_mechanical.cache import container_class
+from osr_mechanical.console.batch import EXPORTERS
+from osr_mechanical.dependencies import ModuleGraph
+
+logger = logging.getLogger(__name__)
+
+
+class Watcher:
+    """Rebuild and export an assembly when source files change.
+
+    :param assembly: Container relative to ``osr_mechanical``, such as
+        ``final.FinalAssembly``.
+    :param export_format: Export format, one of :data:`EXPORTERS`.
+    :param out_file: Export file.
+    :param arguments: Container initialisation arguments.
+    :param root: Source directory, defaults to the directory containing
+        ``osr_mechanical``.
+    """
+
+    #: Modules that are not reloaded, the running console command is defined here.
+    EXCLUDE = "osr_mechanical.console"
+
+    def __init__(
+        self,
+        assembly: str,
+        export_format: str,
+        out_file: Path,
+        arguments: dict[str, Any] | None = None,
+        root: Path | None = None,
+    ) -> None:
+        """Initialise Watcher."""
+        self.assembly = assembly
+        self.exporter = EXPORTERS[export_format]
+        self.out_file = out_file
+        self.arguments = arguments or {}
+        self.root = root or Path(__file__).parents[2]
+
+        self.graph = ModuleGraph.from_directory(self.root)
+        self.memo: ContainerMemo = {}
+        self.up_to_date = False
+        self.mtimes = self.modification_times()
+
+    def modification_times(self) -> dict[Path, float]:
+        """Get modification time of each source file."""
+        return {
+            path: path.stat().st_mtime
+            for package in self.graph.packages
+            for path in (self.root / package).rglob("*.py")
+        }
+
+    def changed(self) -> list[Path]:
+        """Source files added or modified since last checked."""
+        mtimes = self.modification_times()
+        result = [
+            path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime
+        ]
+        self.mtimes = mtimes
+
+        return result
+
+    def reload(self, paths: list[Path]) -> list[str]:
+        """Reload modules affected by changed files.
+
+        Memoised containers defined in affected modules are discarded first, so
+        that a failed reload does not leave stale containers to be reused.
+
+        :return: reloaded module names in reload order
+        """
+        changed = {self.graph.update(path) for path in paths}
+        affected = self.graph.dependents(changed)
+
+        reloaded = [
+            module
+            for module in self.graph.reload_order(affected)
+            if module in sys.modules and not module.startswith(self.EXCLUDE)
+        ]
+
+        self.memo = {
+            key: container
+            for key, container in self.memo.items()
+            if type(container).__module__ not in affected
+        }
+
+        for module in reloaded:
+            logger.debug(f"Reloading {module}.")
+            importlib.reload(sys.modules[module])
+
+        return reloaded
+
+    def build(self) -> None:
+        """Build container and export."""
+        start = perf_counter()
+        reused = len(self.memo)
+
+        with cq_containers.memoise_containers(self.memo):
+            container = container_class(self.assembly)(**self.arguments)
+
+        built = len(self.memo) - reused
+        self.exporter(container.cq_object, self.out_file, {})
+
+        sys.stderr.write(
+            f"Exported {self.out_file} in {perf_counter() - start:.2f}s, "
+            f"{built} containers built, {reused} kept in memory.\n"
+        )
+
+    def update(self, paths: list[Path]) -> bool:
+        """Reload changed modules and rebuild if the assembly is affected.
+
+        Errors, such as a syntax error in a changed file, are logged rather than
+        raised. After an error the assembly is rebuilt on the next change.
+
+        :return: ``True`` if the assembly is up to date
+        """
+        try:
+            if self.reload(paths) or not self.up_to_date:
+                self.build()
+        except Exception:
+            logger.exception("Rebuild failed, waiting for changes.")
+            self.up_to_date = False
+        else:
+            self.up_to_date = True
+
+        return self.up_to_date
+
+    def run(self, interval: float = 0.5) -> None:
+        """Build, then rebuild on each change until interrupted."""
+        self.update([])
+
+        while True:
+            sleep(interval)
+
+            if paths := self.changed():
+                sys.stderr.write(f"Changed {', '.join(map(str, paths))}.\n")
+                self.update(paths)
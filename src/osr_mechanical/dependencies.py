@@ -0,0 +1,196 @@
+"""Module import dependencies between project source files.
+
+Used to determine which modules, and so which containers, are affected by an edit.
+For example a change to ``osr_mechanical/frame/side.py`` affects
+``osr_mechanical.frame.final`` which imports ``FrameSide``, and in turn
+``osr_mechanical.final``.
+"""
+
+import ast
+from collections.abc import Iterable, Iterator
+from graphlib import CycleError, TopologicalSorter
+from hashlib import sha256
+from pathlib import Path
+
+PACKAGES = ("osr_common", "osr_mechanical", "osr_warehouse")
+
+
+def module_name(path: Path, root: Path) -> str:
+    """Dotted module name of a source file relative to root."""
+    parts = list(path.relative_to(root).with_suffix("").parts)
+
+    if parts[-1] == "__init__":
+        parts.pop()
+
+    return ".".join(parts)
+
+
+def _resolve(module: str, node: ast.ImportFrom, is_package: bool) -> str:
+    """Absolute module name of a, possibly relative, from import."""
+    if not node.level:
+        return node.module or ""
+
+    package = module.split(".")
+    base = package if is_package else package[:-1]
+    base = base[: len(base) - node.level + 1]
+
+    return ".".join(base + ([node.module] if node.module else []))
+
+
+def _module_level(nodes: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Statements run on import, excluding function bodies."""
+    for node in nodes:
+        yield node
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.stmt):
+                yield from _module_level([child])
+
+
+def imported_modules(source: str, module: str, is_package: bool = False) -> set[str]:
+    """Modules imported by source when it is imported.
+
+    Includes ``from package import module``. Imports within functions are resolved
+    when called and so are excluded.
+    """
+    result: set[str] = set()
+
+    for node in _module_level(ast.parse(source).body):
+        if isinstance(node, ast.Import):
+            result.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = _resolve(module, node, is_package)
+            result.add(base)
+            result.update(f"{base}.{alias.name}" for alias in node.names)
+
+    return result
+
+
+class ModuleGraph:
+    """Import graph of project modules.
+
+    Example usage:
+
+    .. code-block:: python
+
+        graph = ModuleGraph.from_directory(Path("src"))
+        graph.dependents({"osr_mechanical.frame.side"})
+
+    :param packages: Top level packages included in the graph.
+    """
+
+    def __init__(self, root: Path, packages: Iterable[str] = PACKAGES) -> None:
+        """Initialise ModuleGraph."""
+        self.root = root
+        self.packages = tuple(packages)
+
+        self.paths: dict[str, Path] = {}
+        self.imports: dict[str, set[str]] = {}
+
+    @classmethod
+    def from_directory(
+        cls, root: Path, packages: Iterable[str] = PACKAGES
+    ) -> "ModuleGraph":
+        """Build graph from all source files in the packages below root."""
+        graph = cls(root, packages)
+
+        for package in graph.packages:
+            for path in sorted((root / package).rglob("*.py")):
+                graph.update(path)
+
+        return graph
+
+    def update(self, path: Path) -> str:
+        """Add or update a source file, returning its module name."""
+        module = module_name(path, self.root)
+        self.paths[module] = path
+
+        try:
+            source = path.read_text()
+            imported = imported_modules(source, module, path.name == "__init__.py")
+        except (OSError, SyntaxError):
+            imported = self.imports.get(module, set())
+
+        self.imports[module] = imported
+
+        return module
+
+    def dependencies(self, module: str) -> set[str]:
+        """Project modules imported directly by module."""
+        return {
+            name for name in self.imports.get(module, set()) if name in self.imports
+        } - {module}
+
+    def dependents(self, modules: Iterable[str]) -> set[str]:
+        """Modules importing any of modules, directly or indirectly, and modules."""
+        reverse: dict[str, set[str]] = {}
+        for module in self.imports:
+            for dependency in self.dependencies(module):
+                reverse.setdefault(dependency, set()).add(module)
+
+        result = set(modules)
+        pending = list(result)
+
+        while pending:
+            for dependent in reverse.get(pending.pop(), set()) - result:
+                result.add(dependent)
+                pending.append(dependent)
+
+        return result
+
+    def closure(self, modules: Iterable[str]) -> set[str]:
+        """Modules imported by any of modules, directly or indirectly, and modules.
+
+        Includes the parent packages of each module, which run on import.
+        """
+        result: set[str] = set()
+        pending = list(modules)
+
+        while pending:
+            module = pending.pop()
+            if module in result:
+                continue
+
+            result.add(module)
+            pending.extend(self.dependencies(module))
+
+            package = module.rpartition(".")[0]
+            if package in self.imports:
+                pending.append(package)
+
+        return result
+
+    def source_hash(self, modules: Iterable[str]) -> str:
+        """Hash of the source files of modules and the modules they import."""
+        digest = sha256()
+
+        for module in sorted(self.closure(modules)):
+            path = self.paths.get(module)
+            if path is None:
+                continue
+
+            digest.update(module.encode())
+            try:
+                digest.update(path.read_bytes())
+            except OSError:
+                pass
+
+        return digest.hexdigest()
+
+    def reload_order(self, modules: Iterable[str]) -> list[str]:
+        """Order modules so that each follows the modules it imports.
+
+        Modules in an import cycle are ordered by name.
+        """
+        modules = set(modules)
+        sorter = TopologicalSorter(
+            {module: self.dependencies(module) & modules for module in modules}
+        )
+
+        try:
+            return list(sorter.static_order())
+        except CycleError:
+            return sorted(modules)
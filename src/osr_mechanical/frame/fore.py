@@ -171,6 +171,8 @@ class FrameFore(CqAssemblyContainer):
                 f"{Vslot2020.WIDTH}×{Vslot2020.HEIGHT}mm, length={DIM.PILLAR_HEIGHT}mm."
             ),
             Commodity.FABRICATED,
+            profile=Vslot2020.DESIGNATION,
+            length=DIM.PILLAR_HEIGHT,
         )
         beam_lateral = PartIdentifier(
             PartTypes.tslot,
@@ -181,6 +183,8 @@ class FrameFore(CqAssemblyContainer):
                 f"length={DIM.LATERAL_BEAM_LENGTH}mm."
             ),
             Commodity.FABRICATED,
+            profile=Vslot2020.DESIGNATION,
+            length=DIM.LATERAL_BEAM_LENGTH,
         )
         bracket_light_duty = PartIdentifier(
             PartTypes.tslot,
@@ -92,6 +92,8 @@ class FramePivotBeam(CqAssemblyContainer):
                 f"length={DIM.LATERAL_BEAM_LENGTH}mm."
             ),
             Commodity.FABRICATED,
+            profile=Vslot2020.DESIGNATION,
+            length=DIM.LATERAL_BEAM_LENGTH,
         )
         bracket_standard_duty = PartIdentifier(
             PartTypes.tslot,
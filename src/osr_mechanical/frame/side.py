@@ -265,6 +265,8 @@ class FrameSide(CqAssemblyContainer):
                 f"length={self.pillar_transom_height}mm."
             ),
             Commodity.FABRICATED,
+            profile=Vslot2020.DESIGNATION,
+            length=self.pillar_transom_height,
         )
         pillar_rocker = PartIdentifier(
             PartTypes.tslot,
@@ -275,6 +277,8 @@ class FrameSide(CqAssemblyContainer):
                 f"length={DIM.PILLAR_HEIGHT}mm."
             ),
             Commodity.FABRICATED,
+            profile=Vslot2040.DESIGNATION,
+            length=DIM.PILLAR_HEIGHT,
         )
         beam_belly = PartIdentifier(
             PartTypes.tslot,
@@ -286,6 +290,8 @@ class FrameSide(CqAssemblyContainer):
             ),
             Commodity.FABRICATED,
             suffix=self.nautical_side.identifier,
+            profile=Vslot2020.DESIGNATION,
+            length=DIM.BEAM_SIDE_LENGTH,
         )
         beam_deck = PartIdentifier(
             PartTypes.tslot,
@@ -297,6 +303,8 @@ class FrameSide(CqAssemblyContainer):
             ),
             Commodity.FABRICATED,
             suffix=self.nautical_side.identifier,
+            profile=Vslot2020.DESIGNATION,
+            length=DIM.BEAM_SIDE_LENGTH,
         )
 
         return {
@@ -0,0 +1 @@
+"""Nesting of flat parts onto stock sheets."""
@@ -0,0 +1,152 @@
+"""Planar polygon utilities for nesting."""
+
+from math import hypot
+
+Point = tuple[float, float]
+Polygon = tuple[Point, ...]
+BoundingBox = tuple[float, float, float, float]
+
+
+def bounding_box(polygon: Polygon) -> BoundingBox:
+    """Bounding box of polygon as ``(xmin, ymin, xmax, ymax)``."""
+    xs = [p[0] for p in polygon]
+    ys = [p[1] for p in polygon]
+
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def boxes_within(a: BoundingBox, b: BoundingBox, distance: float) -> bool:
+    """Check whether two bounding boxes are closer than distance."""
+    return not (
+        a[2] + distance <= b[0]
+        or b[2] + distance <= a[0]
+        or a[3] + distance <= b[1]
+        or b[3] + distance <= a[1]
+    )
+
+
+def point_in_polygon(point: Point, polygon: Polygon) -> bool:
+    """Check whether a point lies inside a polygon (even-odd rule)."""
+    x, y = point
+    inside = False
+
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+
+    return inside
+
+
+def point_segment_distance(point: Point, start: Point, end: Point) -> float:
+    """Shortest distance between a point and a line segment."""
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    length_squared = dx * dx + dy * dy
+
+    if length_squared == 0:
+        return hypot(point[0] - start[0], point[1] - start[1])
+
+    t = ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length_squared
+    t = max(0.0, min(1.0, t))
+
+    return hypot(point[0] - (start[0] + t * dx), point[1] - (start[1] + t * dy))
+
+
+def _cross(origin: Point, a: Point, b: Point) -> float:
+    """Z component of the cross product of (a - origin) and (b - origin)."""
+    return (a[0] - origin[0]) * (b[1] - origin[1]) - (a[1] - origin[1]) * (
+        b[0] - origin[0]
+    )
+
+
+def segments_intersect(a1: Point, a2: Point, b1: Point, b2: Point) -> bool:
+    """Check whether two line segments properly intersect."""
+    d1 = _cross(b1, b2, a1)
+    d2 = _cross(b1, b2, a2)
+    d3 = _cross(a1, a2, b1)
+    d4 = _cross(a1, a2, b2)
+
+    return (d1 > 0) != (d2 > 0) and (d3 > 0) != (d4 > 0)
+
+
+def segment_distance(a1: Point, a2: Point, b1: Point, b2: Point) -> float:
+    """Shortest distance between two line segments."""
+    if segments_intersect(a1, a2, b1, b2):
+        return 0.0
+
+    return min(
+        point_segment_distance(a1, b1, b2),
+        point_segment_distance(a2, b1, b2),
+        point_segment_distance(b1, a1, a2),
+        point_segment_distance(b2, a1, a2),
+    )
+
+
+def _edges(polygon: Polygon) -> list[tuple[Point, Point]]:
+    """Edges of a closed polygon."""
+    return list(zip(polygon, polygon[1:] + polygon[:1]))
+
+
+def _segments_clear(
+    a1: Point, a2: Point, b1: Point, b2: Point, clearance: float
+) -> bool:
+    """Check whether two segments do not cross and are at least clearance apart."""
+    if segments_intersect(a1, a2, b1, b2):
+        return False
+
+    return segment_distance(a1, a2, b1, b2) >= clearance
+
+
+def polygons_clear(a: Polygon, b: Polygon, clearance: float) -> bool:
+    """Check whether two polygons are at least clearance apart.
+
+    Polygons whose edges cross, or where one contains the other, are not clear.
+    """
+    if point_in_polygon(a[0], b) or point_in_polygon(b[0], a):
+        return False
+
+    box_b = bounding_box(b)
+    edges_b = _edges(b)
+
+    for a1, a2 in _edges(a):
+        if not boxes_within(bounding_box((a1, a2)), box_b, clearance):
+            continue
+
+        if not all(_segments_clear(a1, a2, b1, b2, clearance) for b1, b2 in edges_b):
+            return False
+
+    return True
+
+
+def simplify(polygon: Polygon, tolerance: float) -> Polygon:
+    """Simplify polygon using the Ramer–Douglas–Peucker algorithm.
+
+    Points deviating less than tolerance from the simplified outline are removed.
+    """
+    if len(polygon) < 4:
+        return polygon
+
+    keep = {0, len(polygon) - 1}
+    stack = [(0, len(polygon) - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        index, distance = _furthest(polygon, first, last)
+
+        if distance > tolerance:
+            keep.add(index)
+            stack.extend([(first, index), (index, last)])
+
+    return tuple(polygon[i] for i in sorted(keep))
+
+
+def _furthest(polygon: Polygon, first: int, last: int) -> tuple[int, float]:
+    """Index and distance of point furthest from the segment first→last."""
+    index, distance = first, 0.0
+
+    for i in range(first + 1, last):
+        d = point_segment_distance(polygon[i], polygon[first], polygon[last])
+        if d > distance:
+            index, distance = i, d
+
+    return index, distance
@@ -0,0 +1,193 @@
+"""Nest CadQuery faces onto stock sheets."""
+
+from math import ceil
+from typing import Self
+
+import cadquery as cq
+from cadquery.occ_impl.exporters.utils import toCompound
+
+from osr_common.cq_dxf import DxfDocument
+from osr_mechanical.bom.bom import Bom
+from osr_mechanical.nesting.geometry import Polygon, simplify
+from osr_mechanical.nesting.packing import (
+    Compactor,
+    Item,
+    Placement,
+    Sheet,
+    SkylinePacker,
+)
+
+
+class Nest:
+    """Nest flat parts onto stock sheets.
+
+    Parts are packed by bounding rectangle, then optionally compacted using their
+    outlines. Each sheet is exported as a multilayer DXF document.
+
+    Example usage:
+
+    .. code-block:: python
+
+        board = RpiHatBoard(mounting_holes=False)
+
+        nest = Nest(Sheet(300, 200, margin=5), spacing=3, refine=True)
+        nest.add("rpi_hat", board.board_face(), quantity=12)
+
+        for index, dxf in enumerate(nest.dxf_documents(), start=1):
+            dxf.document.saveas(f"sheet-{index}.dxf")
+
+    :param sheet: Stock sheet.
+    :param spacing: Minimum distance between parts.
+    :param refine: Compact parts using their outlines rather than bounding rectangles.
+    :param tolerance: Maximum deviation of the sampled outline used for compaction.
+    """
+
+    LAYER_SHEET = "sheet"
+    LAYER_OUTLINE = "outline"
+
+    def __init__(
+        self,
+        sheet: Sheet,
+        *,
+        spacing: float = 2,
+        refine: bool = False,
+        tolerance: float = 0.25,
+    ) -> None:
+        """Initialise Nest."""
+        self.sheet = sheet
+        self.spacing = spacing
+        self.refine = refine
+        self.tolerance = tolerance
+
+        self._items: list[Item] = []
+        self._shapes: dict[str, cq.Shape] = {}
+        self._placements: list[Placement] | None = None
+
+    def add(
+        self,
+        name: str,
+        face: cq.Workplane,
+        quantity: int = 1,
+        *,
+        rotatable: bool = True,
+    ) -> Self:
+        """Add part.
+
+        :param name: Unique part name.
+        :param face: Workplane containing the planar part outline, such as
+            ``RpiHatBoard.board_face()``.
+        :param quantity: Number of parts required.
+        :param rotatable: Allow the part to be rotated by 90°.
+
+        :return: Nest
+        """
+        if name in self._shapes:
+            raise ValueError(f"Part '{name}' has already been added.")
+
+        shape = toCompound(face).transformShape(face.plane.fG)
+        bounding_box = shape.BoundingBox()
+        shape = shape.translate(
+            cq.Vector(-bounding_box.xmin, -bounding_box.ymin, -bounding_box.zmin)
+        )
+
+        item = Item(
+            name, bounding_box.xlen, bounding_box.ylen, self._outline(shape), rotatable
+        )
+
+        self._shapes[name] = shape
+        self._items.extend([item] * quantity)
+        self._placements = None
+
+        return self
+
+    def add_bom_part(
+        self, bom: Bom, identifier: str, face: cq.Workplane, multiplier: int = 1
+    ) -> Self:
+        """Add part using the quantity from a bill of materials.
+
+        :param bom: Bill of materials.
+        :param identifier: Part identifier.
+        :param face: Workplane containing the planar part outline.
+        :param multiplier: Number of assemblies to be built.
+
+        :return: Nest
+        """
+        return self.add(identifier, face, bom[identifier].quantity * multiplier)
+
+    def _outline(self, shape: cq.Shape) -> Polygon:
+        """Sample the outer outline of a single face."""
+        faces = shape.Faces()
+        if len(faces) != 1:
+            return ()
+
+        wire = faces[0].outerWire()
+        count = max(ceil(wire.Length() / self.tolerance), 8)
+        points = wire.positions([i / count for i in range(count)])
+
+        return simplify(tuple((p.x, p.y) for p in points), self.tolerance / 4)
+
+    @property
+    def placements(self) -> list[Placement]:
+        """Part placements."""
+        if self._placements is None:
+            self._placements = self.pack()
+
+        return self._placements
+
+    @property
+    def sheet_count(self) -> int:
+        """Number of sheets required."""
+        return max((p.sheet_index for p in self.placements), default=-1) + 1
+
+    def pack(self) -> list[Placement]:
+        """Pack parts onto sheets."""
+        placements = SkylinePacker(self.sheet, self.spacing).pack(self._items)
+
+        if self.refine:
+            compactor = Compactor(self.sheet, self.spacing + self.tolerance)
+            placements = compactor.compact(placements)
+
+        return placements
+
+    def dxf_documents(
+        self, metadata: dict[str, str] | None = None
+    ) -> list[DxfDocument]:
+        """Create a multilayer DXF document for each sheet.
+
+        :param metadata: document metadata a dictionary of name value pairs
+
+        :return: list of DxfDocument, one per sheet
+        """
+        sheets: list[list[cq.Shape]] = [[] for _ in range(self.sheet_count)]
+
+        for placement in self.placements:
+            sheets[placement.sheet_index].append(self.placed_shape(placement))
+
+        return [self._dxf_document(shapes, metadata) for shapes in sheets]
+
+    def _dxf_document(
+        self, shapes: list[cq.Shape], metadata: dict[str, str] | None
+    ) -> DxfDocument:
+        """Create DXF document for a single sheet."""
+        sheet_outline = cq.Workplane("XY").rect(
+            self.sheet.width, self.sheet.height, centered=False
+        )
+
+        return (
+            DxfDocument(metadata=metadata)
+            .add_layer(self.LAYER_SHEET, color=8)
+            .add_layer(self.LAYER_OUTLINE, color=1)
+            .add_shape(sheet_outline, self.LAYER_SHEET)
+            .add_shape(cq.Workplane("XY").add(shapes), self.LAYER_OUTLINE)
+        )
+
+    def placed_shape(self, placement: Placement) -> cq.Shape:
+        """Part shape moved to its position on the sheet."""
+        shape = self._shapes[placement.item.name]
+
+        if placement.rotated:
+            shape = shape.rotate(cq.Vector(), cq.Vector(0, 0, 1), 90).translate(
+                cq.Vector(placement.item.height, 0, 0)
+            )
+
+        return shape.translate(cq.Vector(placement.x, placement.y, 0))
@@ -0,0 +1,395 @@
+"""Skyline packing of flat parts onto stock sheets.
+
+Parts are packed by their bounding rectangles using a bottom-left skyline heuristic.
+The result can optionally be compacted using the part outlines, sliding each part
+down and to the left until it meets a neighbouring outline.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import groupby
+from typing import Iterable
+
+from osr_mechanical.nesting.geometry import (
+    BoundingBox,
+    Polygon,
+    bounding_box,
+    boxes_within,
+    polygons_clear,
+)
+
+Segment = tuple[float, float, float]
+
+EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class Sheet:
+    """Stock sheet.
+
+    :param width: Sheet width (X direction).
+    :param height: Sheet height (Y direction).
+    :param margin: Clear border around the sheet edge.
+    """
+
+    width: float
+    height: float
+    margin: float = 0
+
+
+@dataclass(frozen=True)
+class Item:
+    """Part to be packed.
+
+    :param name: Part name.
+    :param width: Width of part bounding rectangle.
+    :param height: Height of part bounding rectangle.
+    :param polygon: Part outline relative to the minimum corner of the bounding
+        rectangle. Defaults to the bounding rectangle.
+    :param rotatable: Allow the part to be rotated by 90°.
+    """
+
+    name: str
+    width: float
+    height: float
+    polygon: Polygon = field(default=(), compare=False)
+    rotatable: bool = True
+
+    @cached_property
+    def outline(self) -> Polygon:
+        """Part outline, falling back to the bounding rectangle."""
+        if self.polygon:
+            return self.polygon
+
+        return ((0, 0), (self.width, 0), (self.width, self.height), (0, self.height))
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Position of a part on a sheet.
+
+    ``x`` and ``y`` locate the minimum corner of the (possibly rotated) bounding
+    rectangle. Rotation is 90° counter-clockwise about the Z-axis.
+    """
+
+    item: Item
+    sheet_index: int
+    x: float
+    y: float
+    rotated: bool = False
+
+    @property
+    def width(self) -> float:
+        """Width of placed bounding rectangle."""
+        return self.item.height if self.rotated else self.item.width
+
+    @property
+    def height(self) -> float:
+        """Height of placed bounding rectangle."""
+        return self.item.width if self.rotated else self.item.height
+
+    @cached_property
+    def polygon(self) -> Polygon:
+        """Part outline in sheet coordinates."""
+        if self.rotated:
+            return tuple(
+                (self.x + self.item.height - py, self.y + px)
+                for px, py in self.item.outline
+            )
+
+        return tuple((self.x + px, self.y + py) for px, py in self.item.outline)
+
+    @cached_property
+    def bounding_box(self) -> BoundingBox:
+        """Bounding box of placed outline."""
+        return bounding_box(self.polygon)
+
+    def moved(self, dx: float, dy: float) -> "Placement":
+        """Copy of placement translated by (dx, dy)."""
+        return Placement(
+            self.item, self.sheet_index, self.x + dx, self.y + dy, self.rotated
+        )
+
+
+class SkylineSheet:
+    """Skyline of a single stock sheet.
+
+    The skyline is a list of ``(x, y, width)`` segments spanning the sheet width.
+    """
+
+    def __init__(self, width: float, height: float) -> None:
+        """Initialise SkylineSheet."""
+        self.width = width
+        self.height = height
+        self.skyline: list[Segment] = [(0.0, 0.0, width)]
+
+    def find(self, width: float, height: float) -> tuple[float, float, int] | None:
+        """Find the lowest position for a rectangle.
+
+        :return: tuple of top edge, x position, and skyline segment index or ``None``
+            if the rectangle does not fit.
+        """
+        best = None
+
+        for index, segment in enumerate(self.skyline):
+            y = self._fit(index, width)
+
+            if y is None or y + height > self.height + EPSILON:
+                continue
+
+            candidate = (y + height, segment[0], index)
+            if best is None or candidate < best:
+                best = candidate
+
+        return best
+
+    def _fit(self, index: int, width: float) -> float | None:
+        """Y position of a rectangle with left edge at skyline segment index."""
+        x = self.skyline[index][0]
+        if x + width > self.width + EPSILON:
+            return None
+
+        y = 0.0
+        remaining = width
+
+        while remaining > EPSILON and index < len(self.skyline):
+            _x, segment_y, segment_width = self.skyline[index]
+            y = max(y, segment_y)
+            remaining -= segment_width
+            index += 1
+
+        return y
+
+    def insert(self, index: int, width: float, top: float) -> None:
+        """Raise the skyline for a rectangle placed at skyline segment index."""
+        x = self.skyline[index][0]
+        right = x + width
+
+        result = self.skyline[:index] + [(x, top, width)]
+
+        for segment_x, segment_y, segment_width in self.skyline[index:]:
+            end = segment_x + segment_width
+
+            if end <= right + EPSILON:
+                continue
+
+            start = max(segment_x, right)
+            result.append((start, segment_y, end - start))
+
+        self.skyline = self._merge(result)
+
+    @staticmethod
+    def _merge(skyline: list[Segment]) -> list[Segment]:
+        """Merge adjacent segments of equal height."""
+        result = [skyline[0]]
+
+        for segment in skyline[1:]:
+            x, y, width = result[-1]
+
+            if abs(segment[1] - y) < EPSILON:
+                result[-1] = (x, y, width + segment[2])
+            else:
+                result.append(segment)
+
+        return result
+
+
+class SkylinePacker:
+    """Pack parts onto stock sheets using a bottom-left skyline heuristic.
+
+    Parts are sorted by decreasing size and placed at the lowest available position
+    of the first sheet with room, trying both orientations. Additional sheets are
+    added as required.
+
+    :param sheet: Stock sheet.
+    :param spacing: Minimum distance between parts, for example the cutter diameter.
+    """
+
+    def __init__(self, sheet: Sheet, spacing: float = 0) -> None:
+        """Initialise SkylinePacker."""
+        self.sheet = sheet
+        self.spacing = spacing
+
+        self.usable_width = sheet.width - 2 * sheet.margin + spacing
+        self.usable_height = sheet.height - 2 * sheet.margin + spacing
+
+    def pack(self, items: Iterable[Item]) -> list[Placement]:
+        """Pack items onto sheets."""
+        sheets: list[SkylineSheet] = []
+        placements = []
+
+        for item in sorted(items, key=self._sort_key, reverse=True):
+            placement = self._place_on_open_sheets(item, sheets)
+
+            if placement is None:
+                sheets.append(SkylineSheet(self.usable_width, self.usable_height))
+                placement = self._place(item, sheets[-1], len(sheets) - 1)
+
+            if placement is None:
+                raise ValueError(f"Part '{item.name}' does not fit on sheet.")
+
+            placements.append(placement)
+
+        return placements
+
+    @staticmethod
+    def _sort_key(item: Item) -> tuple[float, float]:
+        """Sort by longest side then area."""
+        return max(item.width, item.height), item.width * item.height
+
+    def _place_on_open_sheets(
+        self, item: Item, sheets: list[SkylineSheet]
+    ) -> Placement | None:
+        """Place item on the first open sheet with room."""
+        for sheet_index, sheet in enumerate(sheets):
+            placement = self._place(item, sheet, sheet_index)
+
+            if placement is not None:
+                return placement
+
+        return None
+
+    def _place(
+        self, item: Item, sheet: SkylineSheet, sheet_index: int
+    ) -> Placement | None:
+        """Place item on sheet at the lowest position of either orientation."""
+        orientations = [False, True] if item.rotatable else [False]
+        best = None
+
+        for rotated in orientations:
+            width, height = (
+                (item.height, item.width)
+                if rotated
+                else (
+                    item.width,
+                    item.height,
+                )
+            )
+            position = sheet.find(width + self.spacing, height + self.spacing)
+
+            if position is not None and (best is None or position < best[0]):
+                best = (position, rotated, width + self.spacing)
+
+        if best is None:
+            return None
+
+        (top, x, index), rotated, width = best
+        sheet.insert(index, width, top)
+
+        y = top - (item.width if rotated else item.height) - self.spacing
+        return Placement(
+            item, sheet_index, self.sheet.margin + x, self.sheet.margin + y, rotated
+        )
+
+
+class Compactor:
+    """Polygon-aware compaction of packed parts.
+
+    Each part is slid down and then left, in bottom-left order, as far as its outline
+    allows while keeping clearance from the outlines of all other parts on the sheet.
+    Parts advance in steps no larger than the clearance until blocked, then the slide
+    distance is found by bisection so parts settle against their neighbours rather
+    than against their neighbours' bounding rectangles.
+
+    :param sheet: Stock sheet.
+    :param clearance: Minimum distance between part outlines, greater than zero.
+    :param passes: Number of down-left slide passes per part.
+    :param iterations: Bisection iterations per slide, after the part is blocked.
+    """
+
+    def __init__(
+        self,
+        sheet: Sheet,
+        clearance: float,
+        *,
+        passes: int = 2,
+        iterations: int = 12,
+    ) -> None:
+        """Initialise Compactor."""
+        if clearance <= 0:
+            raise ValueError(f"Clearance must be greater than zero, got {clearance}.")
+
+        self.sheet = sheet
+        self.clearance = clearance
+        self.passes = passes
+        self.iterations = iterations
+
+    def compact(self, placements: Iterable[Placement]) -> list[Placement]:
+        """Compact placements on each sheet."""
+        result = []
+
+        ordered = sorted(placements, key=lambda p: (p.sheet_index, p.y, p.x))
+        for _sheet_index, group in groupby(ordered, key=lambda p: p.sheet_index):
+            current = list(group)
+
+            for index, placement in enumerate(current):
+                others = current[:index] + current[index + 1 :]
+                current[index] = self._compact_one(placement, others)
+
+            result.extend(current)
+
+        return result
+
+    def _compact_one(self, placement: Placement, placed: list[Placement]) -> Placement:
+        """Slide a single part down and left."""
+        for _ in range(self.passes):
+            placement = self._slide(placement, placed, 0, -1)
+            placement = self._slide(placement, placed, -1, 0)
+
+        return placement
+
+    def _slide(
+        self, placement: Placement, placed: list[Placement], dx: int, dy: int
+    ) -> Placement:
+        """Slide part in direction (dx, dy) as far as clearance allows."""
+        limit = (placement.x if dx else placement.y) - self.sheet.margin
+        low, high = self._advance(placement, placed, dx, dy, limit)
+
+        for _ in range(self.iterations if high > low else 0):
+            middle = (low + high) / 2
+
+            if self.fits(placement.moved(dx * middle, dy * middle), placed):
+                low = middle
+            else:
+                high = middle
+
+        return placement.moved(dx * low, dy * low)
+
+    def _advance(
+        self,
+        placement: Placement,
+        placed: list[Placement],
+        dx: int,
+        dy: int,
+        limit: float,
+    ) -> tuple[float, float]:
+        """Advance part in steps until it is blocked or reaches limit.
+
+        Steps are no larger than the clearance, so a part cannot pass over a
+        neighbour into a gap on the far side.
+
+        :return: tuple of the last free and the first blocked offset, equal if the
+            part reached limit.
+        """
+        low = 0.0
+
+        while low < limit:
+            high = min(low + self.clearance, limit)
+            if not self.fits(placement.moved(dx * high, dy * high), placed):
+                return low, high
+            low = high
+
+        return low, low
+
+    def fits(self, candidate: Placement, placed: list[Placement]) -> bool:
+        """Check part outline is clear of all placed part outlines."""
+        for other in placed:
+            if not boxes_within(
+                candidate.bounding_box, other.bounding_box, self.clearance
+            ):
+                continue
+
+            if not polygons_clear(candidate.polygon, other.polygon, self.clearance):
+                return False
+
+        return True
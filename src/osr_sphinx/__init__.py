@@ -1,5 +1,6 @@
 """OSR Sphinx extension."""
 
+import hashlib
 import os
 import shutil
 from pathlib import Path
@@ -8,10 +9,36 @@ from typing import Any
 import requests
 import sphinx.application
 from sphinx.config import Config
+from sphinx.util import logging
 
 from osr_mechanical import __version__
+from osr_sphinx.bom import merge_bom_cache
+from osr_sphinx.commitizen import (
+    merge_changelog,
+    outdated_changelogs,
+    purge_changelog,
+)
 from osr_sphinx.domain import OsrDomain
-from osr_sphinx.pinout import set_pinout_image_uri
+from osr_sphinx.model import (
+    MODEL_VIEWER_JS,
+    add_model_viewer_js,
+    build_missing_models,
+    merge_models,
+    purge_models,
+)
+from osr_sphinx.pinout import render_pinout_diagrams, set_pinout_image_uri
+from osr_sphinx.prefetch import prefetch_models
+from osr_sphinx.utilities.budget import (
+    budget,
+    collect_budget,
+    merge_budget,
+    report_budget,
+    reset_budget,
+    reset_env_budget,
+)
+from osr_sphinx.utilities.final_assembly import prepare_final_assembly
+
+logger = logging.getLogger(__name__)
 
 
 def open_graph_image_url(user: str, repo: str) -> str:
@@ -65,12 +92,82 @@ def download_open_graph_image(app: sphinx.application.Sphinx, config: Config) ->
     return False
 
 
+def file_sha256(path: Path) -> str:
+    """Calculate the SHA256 hash of a file."""
+    with path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def copy_open_graph_card(app: sphinx.application.Sphinx, config: Config) -> bool:
+    """Copy the locally generated Open Graph card if its content changed."""
+    card = Path(app.confdir) / config.osr_open_graph_card
+    save_as = Path(app.outdir) / config.ogp_image
+
+    if not card.exists():
+        logger.warning(
+            f"Open Graph card {card} not found, create it with "
+            "'make open-graph-card' or set osr_open_graph_fetch."
+        )
+        return False
+
+    if save_as.exists() and file_sha256(save_as) == file_sha256(card):
+        return False
+
+    save_as.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(card, save_as)
+
+    return True
+
+
+@budget.timed("open-graph-image")
+def resolve_open_graph_image(app: sphinx.application.Sphinx, config: Config) -> bool:
+    """Copy the local Open Graph card, or download the GitHub image if enabled."""
+    if config.osr_open_graph_fetch:
+        result = download_open_graph_image(app, config)
+    else:
+        result = copy_open_graph_card(app, config)
+
+    save_as = Path(app.outdir) / config.ogp_image
+    budget.record(
+        hit=not result, size=save_as.stat().st_size if save_as.exists() else 0
+    )
+
+    return result
+
+
 def setup(app: sphinx.application.Sphinx) -> dict[str, Any]:
     """Set up."""
     app.add_domain(OsrDomain)
 
-    app.connect("config-inited", download_open_graph_image)
+    app.add_config_value(
+        "osr_open_graph_card",
+        "../_build/open-graph-card/open-graph-card.png",
+        "html",
+        types=[str],
+    )
+    app.add_config_value("osr_open_graph_fetch", False, "html", types=[bool])
+    app.add_config_value("osr_model_viewer_js", MODEL_VIEWER_JS, "html", types=[str])
+    app.add_config_value("osr_budget_report", "", "", types=[str])
+
+    app.connect("config-inited", reset_budget, priority=100)
+    app.connect("builder-inited", reset_env_budget, priority=100)
+    app.connect("doctree-read", collect_budget, priority=900)
+    app.connect("env-merge-info", merge_budget)
+    app.connect("build-finished", report_budget)
+
+    app.connect("config-inited", resolve_open_graph_image)
+    app.connect("builder-inited", prepare_final_assembly)
+    app.connect("builder-inited", render_pinout_diagrams)
+    app.connect("env-before-read-docs", prefetch_models)
     app.connect("doctree-read", set_pinout_image_uri)
+    app.connect("env-merge-info", merge_bom_cache)
+    app.connect("env-get-outdated", outdated_changelogs)
+    app.connect("env-purge-doc", purge_changelog)
+    app.connect("env-merge-info", merge_changelog)
+    app.connect("env-purge-doc", purge_models)
+    app.connect("env-merge-info", merge_models)
+    app.connect("env-updated", build_missing_models)
+    app.connect("html-page-context", add_model_viewer_js)
 
     return {
         "version": __version__,
@@ -1,31 +1,101 @@
-"""Bill of materials."""
+"""Bill of materials.
 
+Bills of materials are cached on the build environment, which Sphinx pickles
+between builds, keyed by assembly name and a hash of the source of the assembly
+module and the project modules it imports. An assembly is modelled again only when
+its source changes.
+"""
+
+import sphinx.application
 from docutils import nodes
-from docutils.parsers.rst import Directive
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+from sphinx.util.docutils import SphinxDirective
 
 from osr_mechanical.bom.bom import Bom, BomBuilder
+from osr_sphinx.utilities.budget import budget
+from osr_sphinx.utilities.dependencies import (
+    container_module,
+    module_graph,
+    note_module_dependencies,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASSEMBLY = "final.FinalAssembly"
+
+#: Build environment attribute of the cache, assembly name to source hash and BOM.
+ENV_ATTRIBUTE = "osr_bom_cache"
+
+BomCache = dict[str, tuple[str, Bom]]
+
+
+def source_modules(assembly_name: str) -> set[str]:
+    """Modules a bill of materials depends on, including the builder."""
+    return {container_module(assembly_name), BomBuilder.__module__}
+
+
+def source_hash(assembly_name: str) -> str:
+    """Hash of the source of an assembly, relative to ``osr_mechanical``."""
+    return module_graph().source_hash(source_modules(assembly_name))
+
 
+def bom_cache(env: BuildEnvironment) -> BomCache:
+    """Get the bill of materials cache of a build environment."""
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, {})
 
-class BomTable(Directive):
+    result: BomCache = getattr(env, ENV_ATTRIBUTE)
+
+    return result
+
+
+def merge_bom_cache(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge bills of materials built by a parallel read process."""
+    bom_cache(env).update(bom_cache(other))
+
+
+class BomTable(SphinxDirective):
     """Bill of materials table directive."""
 
     has_content = False
     required_arguments = 0
     optional_arguments = 1
 
+    @budget.timed("osr:bom")
     def run(self) -> list[nodes.paragraph | nodes.table]:
         """Create bill of materials table with summary."""
-        if self.arguments:
-            assembly_name = self.arguments[0]
-            bom = self.build_bom(assembly_name)
-        else:
-            bom = self.build_bom()
+        assembly_name = self.arguments[0] if self.arguments else DEFAULT_ASSEMBLY
+        note_module_dependencies(self.env, source_modules(assembly_name))
+        bom = self.cached_bom(assembly_name)
 
         summary = self.summary(bom)
         table = self.table(bom)
 
         return [summary, table]
 
+    def cached_bom(self, assembly_name: str) -> Bom:
+        """Get bill of materials from the cache, building it if stale."""
+        cache = bom_cache(self.env)
+        current_hash = source_hash(assembly_name)
+
+        hit = assembly_name in cache and cache[assembly_name][0] == current_hash
+        budget.record(hit=hit)
+
+        if hit:
+            return cache[assembly_name][1]
+
+        logger.info(f"building bill of materials of {assembly_name}")
+        bom = self.build_bom(assembly_name)
+        cache[assembly_name] = (current_hash, bom)
+
+        return bom
+
     @staticmethod
     def build_bom(assembly_name: str | None = None) -> Bom:
         """Build bill of materials."""
@@ -1,13 +1,76 @@
-"""Commitizen Sphinx directives."""
+"""Commitizen Sphinx directives.
 
-import subprocess
+Changelogs are provided by :data:`osr_common.changelog.changelogs`, cached by git
+revision. The revision each document was read at is stored on the build
+environment, so documents containing a changelog are re-read only when commits or
+tags change, otherwise the pickled doctree is reused. Outside a git repository the
+changelog is generated each time it is read.
+"""
 
+from typing import ClassVar
+
+import sphinx.application
 from docutils import nodes
 from docutils.frontend import OptionParser
 from docutils.utils import new_document
+from sphinx.environment import BuildEnvironment
 from sphinx.parsers import RSTParser
 from sphinx.util.docutils import SphinxDirective
 
+from osr_common.changelog import changelogs
+from osr_sphinx.utilities.budget import budget
+
+#: Build environment attribute, document name to the revision it was read at.
+ENV_ATTRIBUTE = "osr_changelog_revisions"
+
+
+def changelog_revisions(env: BuildEnvironment) -> dict[str, str]:
+    """Get the revision each document containing a changelog was read at."""
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, {})
+
+    result: dict[str, str] = getattr(env, ENV_ATTRIBUTE)
+
+    return result
+
+
+@budget.timed("changelog-outdated")
+def outdated_changelogs(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    added: set[str],
+    changed: set[str],
+    removed: set[str],
+) -> list[str]:
+    """Get documents containing a changelog of a previous revision.
+
+    To be called on the Sphinx env-get-outdated event.
+    """
+    revisions = changelog_revisions(env)
+    if not revisions:
+        return []
+
+    revision = changelogs.revision()
+
+    return sorted(name for name, read in revisions.items() if read != revision)
+
+
+def purge_changelog(
+    app: sphinx.application.Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """Forget the revision of a document, to be called on env-purge-doc."""
+    changelog_revisions(env).pop(docname, None)
+
+
+def merge_changelog(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge revisions of documents read by a parallel read process."""
+    changelog_revisions(env).update(changelog_revisions(other))
+
 
 class CzChangelog(SphinxDirective):
     """Commitizen changelog Sphinx directive.
@@ -21,21 +84,28 @@ class CzChangelog(SphinxDirective):
     required_arguments = 0
     optional_arguments = 0
 
+    #: Parsed changelog by revision.
+    _parsed: ClassVar[dict[str, list[nodes.Node]]] = {}
+
+    @budget.timed("osr:cz-changelog")
     def run(self) -> list[nodes.Node]:
         """Run Commitizen changelog."""
-        changelog = self.get_changelog()
+        revision = changelogs.revision()
+        if revision is None:
+            return self.parse_rst(self.get_changelog())
+
+        changelog_revisions(self.env)[self.env.docname] = revision
+
+        budget.record(hit=revision in self._parsed)
+        if revision not in self._parsed:
+            self._parsed[revision] = self.parse_rst(self.get_changelog(revision))
 
-        return self.parse_rst(changelog)
+        return [node.deepcopy() for node in self._parsed[revision]]
 
     @staticmethod
-    def get_changelog() -> str:
-        """Execute cz changelog and capture output."""
-        result = subprocess.run(
-            ["cz", "changelog", "--dry-run", "--file-name", "CHANGELOG.rst"],
-            stdout=subprocess.PIPE,
-        )
-
-        return result.stdout.decode("utf-8")
+    def get_changelog(revision: str | None = None) -> str:
+        """Get changelog, cached by git revision."""
+        return changelogs.text("CHANGELOG.rst", revision)
 
     def parse_rst(self, text: str) -> list[nodes.Node]:
         """Parse reStructuredText string."""
@@ -4,52 +4,53 @@ from docutils import nodes
 from sphinx.util import logging
 from sphinx.util.docutils import SphinxRole
 
-from osr_sphinx.utilities.final_assembly import final_assembly
+from osr_common.measurements import MEASUREMENTS
+from osr_sphinx.utilities.budget import budget
+from osr_sphinx.utilities.dependencies import (
+    container_module,
+    note_module_dependencies,
+)
+from osr_sphinx.utilities.measurements import DEFAULT_CONTAINER, measurements
 
 logger = logging.getLogger(__name__)
 
 
 class DimensionRole(SphinxRole):
-    """Role to calculate bounding box dimensions."""
+    """Role to calculate bounding box dimensions.
 
+    The role text is a measurement, optionally prefixed with a container name
+    relative to ``osr_mechanical``, such as ``frame.final.Frame:width``. The final
+    assembly is measured if no container is given.
+    """
+
+    @budget.timed("osr:dimension")
     def run(self) -> tuple[list[nodes.Node], list[nodes.system_message]]:
         """Run the role."""
-        _valid_labels = {"height", "width", "length"}
-
-        if self.text not in _valid_labels:
-            msg = self.inliner.reporter.error(
-                (
-                    f"Invalid dimension label: {self.text}. "
-                    f"Expected one of {', '.join(str(s) for s in _valid_labels)}."
-                ),
-                line=self.lineno,
-            )
-            prb = self.inliner.problematic(
-                self.rawtext,
-                self.rawtext,
-                msg,
+        name, _, label = self.text.rpartition(":")
+        name = name or DEFAULT_CONTAINER
+
+        if label not in MEASUREMENTS:
+            return self.error(
+                f"Invalid dimension label: {label}. "
+                f"Expected one of {', '.join(MEASUREMENTS)}."
             )
-            return [prb], [msg]
 
-        value_formatted = self._get_value(self.text)
+        note_module_dependencies(self.env, {container_module(name)})
+        budget.record(hit=name in measurements)
+
+        try:
+            value = measurements.measure(name, label)
+        except (AttributeError, ImportError, ValueError):
+            return self.error(f"Invalid assembly: {name}.")
 
-        node = nodes.raw("", nodes.Text(value_formatted), format="html")
+        node = nodes.raw("", nodes.Text(f"{value:.0f} mm"), format="html")
         self.set_source_info(node)
         return [node], []
 
-    @staticmethod
-    def _get_value(label: str) -> str:
-        """Get dimensional value and format."""
-        assembly = final_assembly.cq_object.toCompound()
-        bounding_box = assembly.BoundingBox()
-
-        value = float(0)
-
-        if "height" == label:
-            value = bounding_box.zlen
-        elif "width" == label:
-            value = bounding_box.xlen
-        elif "length" == label:
-            value = bounding_box.ylen
-
-        return f"{value:.0f} mm"
+    def error(
+        self, message: str
+    ) -> tuple[list[nodes.Node], list[nodes.system_message]]:
+        """Report error and mark role text as problematic."""
+        msg = self.inliner.reporter.error(message, line=self.lineno)
+        prb = self.inliner.problematic(self.rawtext, self.rawtext, msg)
+        return [prb], [msg]
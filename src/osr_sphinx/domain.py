@@ -11,6 +11,7 @@ from sphinx.environment import BuildEnvironment
 from osr_sphinx.bom import BomTable
 from osr_sphinx.commitizen import CzChangelog
 from osr_sphinx.dimensions import DimensionRole
+from osr_sphinx.model import ModelViewer
 from osr_sphinx.pinout import Pinout
 from osr_sphinx.print_settings import PrintSettings
 
@@ -24,6 +25,7 @@ class OsrDomain(Domain):
     directives = {
         "bom": BomTable,
         "cz-changelog": CzChangelog,
+        "model": ModelViewer,
         "pinout-diagram": Pinout,
         "print-settings": PrintSettings,
     }
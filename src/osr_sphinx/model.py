@@ -0,0 +1,284 @@
+"""Interactive 3D model Sphinx directive.
+
+Models are shown with `<model-viewer> <https://modelviewer.dev/>`__ from quantized
+binary glTF files in ``_static/models``. A model is named by a hash of the directive
+options and the container source, so that pages showing the same model share one
+file, and files from previous builds are reused.
+
+Missing models are generated after all documents are read, in a pool of worker
+processes sharing the tessellation cache.
+
+Example usage:
+
+.. code-block:: rst
+
+    .. osr:model:: frame.side.FrameSide
+        :arguments: nautical_side=@bom.parts.port
+
+        Frame port sub-assembly.
+"""
+
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from html import escape
+from itertools import groupby
+from pathlib import Path
+from typing import Any
+
+import sphinx.application
+from docutils import nodes
+from docutils.parsers.rst import directives
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+from sphinx.util.console import bold  # type: ignore[attr-defined]
+from sphinx.util.docutils import SphinxDirective
+
+from osr_sphinx.utilities.budget import budget
+from osr_sphinx.utilities.dependencies import (
+    container_module,
+    module_graph,
+    note_module_dependencies,
+)
+from osr_sphinx.utilities.utils import relative_uri
+
+logger = logging.getLogger(__name__)
+
+MODEL_VIEWER_JS = (
+    "https://ajax.googleapis.com/ajax/libs/model-viewer/3.5.0/model-viewer.min.js"
+)
+
+#: Build environment attribute, document name to models by file name.
+ENV_ATTRIBUTE = "osr_models"
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Model of a container.
+
+    :param container: Container name relative to ``osr_mechanical``.
+    :param arguments: Container arguments, ``@`` prefixed values are resolved to
+        objects.
+    :param part: Part or sub-assembly name.
+    :param color: Colour of all parts.
+    """
+
+    container: str
+    arguments: tuple[tuple[str, str], ...] = ()
+    part: str | None = None
+    color: tuple[float, float, float, float] | None = None
+
+    @classmethod
+    def from_options(cls, container: str, options: dict[str, Any]) -> "ModelSpec":
+        """Create from converted directive options."""
+        return cls(
+            container,
+            options.get("arguments", ()),
+            options.get("part"),
+            options.get("color"),
+        )
+
+    @property
+    def file_name(self) -> str:
+        """Name of the model file, a hash of the model and its source."""
+        sha256 = hashlib.sha256(repr(self).encode())
+        sha256.update(
+            module_graph()
+            .source_hash({container_module(self.container), "osr_common.gltf"})
+            .encode()
+        )
+
+        return f"{sha256.hexdigest()[:16]}.glb"
+
+    def build(self, out_file: Path) -> Path:
+        """Write binary glTF, replacing the file atomically."""
+        from osr_common.gltf import glb
+        from osr_mechanical.cache import containers
+        from osr_mechanical.console.batch import resolve_arguments, select_part
+
+        arguments = resolve_arguments(dict(self.arguments))
+        cq_object = containers.from_string(self.container, **arguments).cq_object
+
+        if self.part is not None:
+            cq_object = select_part(cq_object, self.part)
+
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            dir=out_file.parent, suffix=".glb", delete=False
+        ) as file:
+            file.write(glb(cq_object, color=self.color))
+
+        os.replace(file.name, out_file)
+
+        return out_file
+
+
+def build_models(models: list[tuple[ModelSpec, Path]]) -> None:
+    """Build models, models of the same container share a worker."""
+    for spec, out_file in models:
+        spec.build(out_file)
+
+
+def env_models(env: BuildEnvironment) -> dict[str, dict[str, ModelSpec]]:
+    """Get models of each document."""
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, {})
+
+    result: dict[str, dict[str, ModelSpec]] = getattr(env, ENV_ATTRIBUTE)
+
+    return result
+
+
+def models_directory(app: sphinx.application.Sphinx) -> Path:
+    """Get output directory of model files."""
+    return Path(app.outdir) / "_static" / "models"
+
+
+def purge_models(
+    app: sphinx.application.Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """Forget models of a document, to be called on env-purge-doc."""
+    env_models(env).pop(docname, None)
+
+
+def merge_models(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge models of documents read by a parallel read process."""
+    env_models(env).update(env_models(other))
+
+
+@budget.timed("models")
+def build_missing_models(
+    app: sphinx.application.Sphinx, env: BuildEnvironment
+) -> list[str]:
+    """Build models without a file in a process pool.
+
+    To be called on the Sphinx env-updated event.
+    """
+    directory = models_directory(app)
+    missing = {
+        file_name: spec
+        for models in env_models(env).values()
+        for file_name, spec in models.items()
+        if not (directory / file_name).exists()
+    }
+
+    budget.record(hit=not missing)
+    if not missing:
+        return []
+
+    def group(item: tuple[str, ModelSpec]) -> tuple[str, str]:
+        return item[1].container, repr(item[1].arguments)
+
+    groups = [
+        [(spec, directory / file_name) for file_name, spec in items]
+        for _key, items in groupby(sorted(missing.items(), key=group), key=group)
+    ]
+
+    logger.info(bold(f"building {len(missing)} models... "), nonl=True)
+
+    with ProcessPoolExecutor(max_workers=min(len(groups), os.cpu_count() or 1)) as pool:
+        list(pool.map(build_models, groups))
+
+    budget.record(size=sum((directory / name).stat().st_size for name in missing))
+
+    logger.info("done")
+
+    return []
+
+
+def add_model_viewer_js(
+    app: sphinx.application.Sphinx,
+    pagename: str,
+    templatename: str,
+    context: dict[str, Any],
+    doctree: nodes.document | None,
+) -> None:
+    """Add model viewer script to pages with models.
+
+    To be called on the Sphinx html-page-context event.
+    """
+    if env_models(app.env).get(pagename):
+        app.add_js_file(app.config.osr_model_viewer_js, type="module")
+
+
+def color(argument: str) -> tuple[float, float, float, float]:
+    """Convert RGBA option, such as ``0.85, 0.45, 0.01, 1``."""
+    red, green, blue, alpha = (float(value) for value in argument.split(","))
+
+    return red, green, blue, alpha
+
+
+def arguments(argument: str) -> tuple[tuple[str, str], ...]:
+    """Convert container arguments option, such as ``name=value, name=value``."""
+    result = []
+
+    for item in argument.split(","):
+        name, separator, value = item.partition("=")
+        if not separator:
+            raise ValueError(f"Expected name=value, got '{item.strip()}'.")
+        result.append((name.strip(), value.strip()))
+
+    return tuple(result)
+
+
+class ModelViewer(SphinxDirective):
+    """Interactive 3D model directive.
+
+    The argument is a container relative to ``osr_mechanical``, the content is the
+    caption.
+    """
+
+    has_content = True
+    required_arguments = 1
+    optional_arguments = 0
+    option_spec = {
+        "arguments": arguments,
+        "part": directives.unchanged_required,
+        "color": color,
+        "alt": directives.unchanged,
+    }
+
+    @budget.timed("osr:model")
+    def run(self) -> list[nodes.Node]:
+        """Insert model viewer as figure element with caption."""
+        spec = ModelSpec.from_options(self.arguments[0], self.options)
+        note_module_dependencies(self.env, {container_module(spec.container)})
+
+        file_name = spec.file_name
+        env_models(self.env).setdefault(self.env.docname, {})[file_name] = spec
+
+        out_file = models_directory(self.env.app) / file_name
+        budget.record(hit=out_file.exists())
+
+        uri = relative_uri(self.env.app, out_file)
+        alt = self.options.get("alt", " ".join(self.content) or spec.container)
+
+        figure_node = nodes.figure(classes=["osr-model"])
+        self.add_name(figure_node)
+        figure_node += nodes.raw(
+            "",
+            f'<model-viewer src="{uri.as_posix()}" alt="{escape(alt)}" '
+            'camera-controls camera-orbit="-45deg 60deg auto" '
+            'style="width: 100%; height: 400px"></model-viewer>',
+            format="html",
+        )
+
+        if self.content:
+            node = nodes.Element()  # anonymous container for parsing content
+            self.state.nested_parse(self.content, self.content_offset, node)
+            caption_node = node[0]
+            figure_node += nodes.caption(
+                caption_node.rawsource,  # type: ignore[attr-defined]
+                "",
+                *caption_node.children,
+            )
+
+        return [figure_node]
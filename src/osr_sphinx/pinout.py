@@ -7,17 +7,27 @@ Sphinx directives for generating pinout diagrams using
 import hashlib
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
 from importlib.resources import as_file, files
+from os import cpu_count
 from pathlib import Path
 from typing import Any
 
 from docutils import nodes
 from pinout.manager import export_diagram
 from sphinx.application import Sphinx
+from sphinx.util import logging
+from sphinx.util.console import bold  # type: ignore[attr-defined]
 from sphinx.util.docutils import SphinxDirective
 
+from osr_sphinx.utilities.budget import budget
 from osr_sphinx.utilities.utils import relative_uri
 
+logger = logging.getLogger(__name__)
+
+PINOUT_PACKAGE = "osr_elec.pinout"
+
 
 def sha1_file_contents(path: Path) -> Any:
     """Calculate the SHA1 hash of a file."""
@@ -34,8 +44,107 @@ def sha1_file_contents(path: Path) -> Any:
     return sha1
 
 
+def diagram_ids() -> list[str]:
+    """Get identifiers of the pinout diagrams in ``osr_elec.pinout``."""
+    return sorted(
+        package.name
+        for package in files(PINOUT_PACKAGE).iterdir()
+        if package.joinpath("diagram.py").is_file()
+    )
+
+
+def diagram_hash(diagram_id: str) -> str:
+    """Hash the files of a diagram package and the version of ``pinout``.
+
+    Diagrams load their data and stylesheets by file name, so every file of the
+    package is hashed.
+    """
+    sha1 = hashlib.sha1(version("pinout").encode())
+
+    with as_file(files(f"{PINOUT_PACKAGE}.{diagram_id}")) as directory:
+        for path in sorted(directory.iterdir()):
+            if path.is_file():
+                sha1.update(path.name.encode())
+                sha1.update(path.read_bytes())
+
+    return sha1.hexdigest()
+
+
+def pinout_cache_file(app: Sphinx, diagram_id: str) -> Path:
+    """Get the path of the rendered diagram in the persistent cache."""
+    return (
+        Path(app.doctreedir)
+        / "osr"
+        / "pinout"
+        / f"{diagram_id}-{diagram_hash(diagram_id)}.svg"
+    )
+
+
+def render_diagram(diagram_id: str, dest: Path) -> Path:
+    """Render pinout diagram, replacing dest atomically.
+
+    ``pinout`` prints rather than raises errors, leaving an empty file, so an empty
+    diagram raises :class:`RuntimeError`. Diagrams import their data as the module
+    ``data``, render diagrams with :func:`render_diagrams` so that each is rendered
+    in a separate process.
+    """
+    with as_file(files(f"{PINOUT_PACKAGE}.{diagram_id}").joinpath("diagram.py")) as src:
+        with tempfile.TemporaryDirectory() as tmp_dir_name:
+            tmp_dest = Path(tmp_dir_name) / "diagram.svg"
+
+            export_diagram(src, tmp_dest, instance_name="diagram", overwrite=True)
+
+            if not tmp_dest.exists() or not tmp_dest.stat().st_size:
+                raise RuntimeError(f"Rendering pinout diagram {diagram_id} failed.")
+
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(tmp_dest, dest)
+
+    return dest
+
+
+def render_diagrams(diagrams: dict[str, Path]) -> list[Path]:
+    """Render pinout diagrams by identifier and destination in worker processes.
+
+    Each worker renders one diagram, a worker reused for another diagram would keep
+    the ``data`` module of the first.
+    """
+    with ProcessPoolExecutor(
+        max_workers=min(len(diagrams), cpu_count() or 1), max_tasks_per_child=1
+    ) as pool:
+        return list(pool.map(render_diagram, diagrams.keys(), diagrams.values()))
+
+
+@budget.timed("pinout-render")
+def render_pinout_diagrams(app: Sphinx) -> None:
+    """Render pinout diagrams missing from the persistent cache in a worker pool.
+
+    To be called on the Sphinx builder-inited event.
+    """
+    missing = {}
+
+    for diagram_id in diagram_ids():
+        cache_file = pinout_cache_file(app, diagram_id)
+
+        if not cache_file.exists():
+            for stale in cache_file.parent.glob(f"{diagram_id}-*.svg"):
+                stale.unlink()
+            missing[diagram_id] = cache_file
+
+    budget.record(hit=not missing)
+    if not missing:
+        return
+
+    logger.info(bold(f"rendering {len(missing)} pinout diagrams... "), nonl=True)
+
+    for path in render_diagrams(missing):
+        budget.record(size=path.stat().st_size)
+
+    logger.info("done")
+
+
 def set_pinout_image_uri(app: Sphinx, doctree: Any) -> None:
-    """Export pinout diagrams.
+    """Copy rendered pinout diagrams to the output directory.
 
     To be called on the Sphinx doctree-read event.
     """
@@ -45,26 +154,27 @@ def set_pinout_image_uri(app: Sphinx, doctree: Any) -> None:
 
         diagram_id = img.pinout["diagram_id"]
 
-        with as_file(
-            files(f"osr_elec.pinout.{diagram_id}").joinpath("diagram.py")
-        ) as src:
-            with tempfile.TemporaryDirectory() as tmp_dir_name:
-                tmp_dest = Path(tmp_dir_name) / "diagram.svg"
+        with budget.measure("pinout-image") as measurement:
+            cache_file = pinout_cache_file(app, diagram_id)
+            measurement.hit = cache_file.exists()
+            if not measurement.hit:
+                render_diagrams({diagram_id: cache_file})
+            measurement.size = cache_file.stat().st_size
 
-                export_diagram(src, tmp_dest, instance_name="diagram", overwrite=True)
-                sha1 = sha1_file_contents(tmp_dest)
+        sha1 = sha1_file_contents(cache_file)
 
-                dest = (
-                    Path(app.builder.outdir)
-                    .joinpath("_static")
-                    .joinpath("pinout")
-                    .joinpath(f"{diagram_id}-{sha1.hexdigest()}.svg")
-                )
+        dest = (
+            Path(app.builder.outdir)
+            .joinpath("_static")
+            .joinpath("pinout")
+            .joinpath(f"{diagram_id}-{sha1.hexdigest()}.svg")
+        )
 
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(tmp_dest, dest)
+        if not dest.exists():
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(cache_file, dest)
 
-                img["uri"] = relative_uri(app, dest).as_posix()
+        img["uri"] = relative_uri(app, dest).as_posix()
 
 
 class Pinout(SphinxDirective):
@@ -77,8 +187,11 @@ class Pinout(SphinxDirective):
     required_arguments = 1
     optional_arguments = 0
 
+    @budget.timed("osr:pinout-diagram")
     def run(self) -> list[nodes.Node]:
         """Insert pinout diagram as figure element with caption."""
+        self.note_diagram_dependencies(self.arguments[0])
+
         figure_node = nodes.figure()
         self.add_name(figure_node)
 
@@ -101,3 +214,14 @@ class Pinout(SphinxDirective):
         figure_node += caption
 
         return [figure_node]
+
+    def note_diagram_dependencies(self, diagram_id: str) -> None:
+        """Note the files of a diagram package as dependencies.
+
+        Diagrams import their data by file name rather than as a package module, so
+        every file in the package is noted.
+        """
+        with as_file(files(f"{PINOUT_PACKAGE}.{diagram_id}")) as directory:
+            for path in sorted(directory.iterdir()):
+                if path.is_file():
+                    self.env.note_dependency(str(path))
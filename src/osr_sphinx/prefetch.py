@@ -0,0 +1,182 @@
+"""Prefetch models before documents are read.
+
+Before Sphinx reads documents, the sources of the documents to be read are scanned
+for ``osr:bom``, ``osr:dimension`` and ``osr:model``. What each needs is built
+concurrently in a pool of worker processes, with the uses of a container sharing a
+worker so that it is modelled once:
+
+* bills of materials are added to the cache of the build environment,
+* bounding boxes are added to :data:`~osr_sphinx.utilities.measurements.measurements`,
+* model files are written to ``_static/models``.
+
+CadQuery objects cannot be pickled, so rather than containers the workers return
+what the directives and roles use. Reading documents then only looks up results.
+"""
+
+import os
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import cadquery as cq
+import sphinx.application
+from OCP.Bnd import Bnd_Box
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+from sphinx.util.console import bold  # type: ignore[attr-defined]
+
+from osr_sphinx.bom import DEFAULT_ASSEMBLY, BomTable, bom_cache, source_hash
+from osr_sphinx.model import ModelSpec, ModelViewer, models_directory
+from osr_sphinx.utilities.budget import budget
+from osr_sphinx.utilities.measurements import DEFAULT_CONTAINER, measurements
+
+logger = logging.getLogger(__name__)
+
+BOM = re.compile(r"^[ \t]*\.\. osr:bom::[ \t]*(\S*)", re.MULTILINE)
+DIMENSION = re.compile(r":osr:dimension:`([^`]+)`")
+MODEL = re.compile(
+    r"^([ \t]*)\.\. osr:model::[ \t]*(\S+)\n((?:\1[ \t]+:[\w-]+:.*\n)*)", re.MULTILINE
+)
+OPTION = re.compile(r":([\w-]+):[ \t]*(.*)")
+
+#: Kind of result, container or file name, and model specification.
+Job = tuple[str, str, ModelSpec | None]
+
+
+def scan(source: str) -> Iterable[Job]:
+    """Find uses of models in reStructuredText source."""
+    for match in BOM.finditer(source):
+        yield "bom", match[1] or DEFAULT_ASSEMBLY, None
+
+    for match in DIMENSION.finditer(source):
+        yield "dimension", match[1].rpartition(":")[0] or DEFAULT_CONTAINER, None
+
+    for match in MODEL.finditer(source):
+        try:
+            spec = model_spec(match[2], match[3])
+        except (KeyError, ValueError):
+            continue  # the directive reports invalid options when read
+
+        yield "model", spec.file_name, spec
+
+
+def model_spec(container: str, options: str) -> ModelSpec:
+    """Create model specification from the option lines of ``osr:model``.
+
+    Unknown options raise :class:`KeyError`, invalid values :class:`ValueError`.
+    """
+    return ModelSpec.from_options(
+        container,
+        {
+            name: ModelViewer.option_spec[name](value.strip())
+            for name, value in OPTION.findall(options)
+        },
+    )
+
+
+def run_job(kind: str, name: str, spec: ModelSpec | None, directory: Path) -> Any:
+    """Build result of job."""
+    if "bom" == kind:
+        return BomTable.build_bom(name)
+
+    if "dimension" == kind:
+        box = measurements.bounding_box(name)
+        return box.xmin, box.ymin, box.zmin, box.xmax, box.ymax, box.zmax
+
+    assert spec is not None
+    return spec.build(directory / name)
+
+
+def run_jobs(jobs: list[Job], directory: Path) -> list[tuple[Job, Any]]:
+    """Run jobs of one container, failures are left to the read phase."""
+    results = []
+
+    for job in jobs:
+        try:
+            results.append((job, run_job(*job, directory)))
+        except Exception as error:
+            # not all exceptions can be pickled
+            results.append((job, RuntimeError(f"{type(error).__name__}: {error}")))
+
+    return results
+
+
+class Prefetcher:
+    """Build models used by documents before they are read."""
+
+    def __init__(self, app: sphinx.application.Sphinx, env: BuildEnvironment) -> None:
+        """Initialise Prefetcher."""
+        self.env = env
+        self.directory = models_directory(app)
+
+    def is_missing(self, job: Job) -> bool:
+        """Check whether the result of job has to be built."""
+        kind, name, _spec = job
+
+        if "bom" == kind:
+            cached_hash = bom_cache(self.env).get(name, ("",))[0]
+            return cached_hash != source_hash(name)
+
+        if "dimension" == kind:
+            return name not in measurements
+
+        return not (self.directory / name).exists()
+
+    def jobs(self, docnames: Iterable[str]) -> list[list[Job]]:
+        """Find missing results of documents, grouped by container."""
+        groups: dict[tuple[str, str], set[Job]] = defaultdict(set)
+
+        for docname in docnames:
+            source = Path(self.env.doc2path(docname)).read_text()
+
+            for job in filter(self.is_missing, scan(source)):
+                _kind, name, spec = job
+                arguments = spec.arguments if spec else ()
+                groups[(spec.container if spec else name, repr(arguments))].add(job)
+
+        return [sorted(jobs, key=repr) for jobs in groups.values()]
+
+    def store(self, job: Job, result: Any) -> None:
+        """Store result of job for the read phase."""
+        kind, name, _spec = job
+
+        if isinstance(result, Exception):
+            logger.warning(f"prefetching {kind} of {name} failed: {result}")
+        elif "bom" == kind:
+            bom_cache(self.env)[name] = (source_hash(name), result)
+        elif "dimension" == kind:
+            box = Bnd_Box()
+            box.Update(*result)
+            measurements.add(name, cq.BoundBox(box))
+
+    def __call__(self, docnames: Iterable[str]) -> None:
+        """Build missing results of documents in a process pool."""
+        groups = self.jobs(docnames)
+        if not groups:
+            return
+
+        count = sum(len(jobs) for jobs in groups)
+        logger.info(bold(f"prefetching {count} models... "), nonl=True)
+
+        with ProcessPoolExecutor(
+            max_workers=min(len(groups), os.cpu_count() or 1)
+        ) as pool:
+            for results in pool.map(run_jobs, groups, [self.directory] * len(groups)):
+                for job, result in results:
+                    self.store(job, result)
+
+        logger.info("done")
+
+
+@budget.timed("prefetch")
+def prefetch_models(
+    app: sphinx.application.Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """Build models used by the documents to be read.
+
+    To be called on the Sphinx env-before-read-docs event.
+    """
+    Prefetcher(app, env)(docnames)
@@ -3,6 +3,8 @@
 from docutils import nodes
 from docutils.parsers.rst import Directive, directives
 
+from osr_sphinx.utilities.budget import budget
+
 
 def choice_yes_no(argument: str) -> str:
     """Directive option utility ("yes", "no").
@@ -41,6 +43,7 @@ class PrintSettings(Directive):
 
         return data
 
+    @budget.timed("osr:print-settings")
     def run(self) -> list[nodes.paragraph | nodes.table | nodes.definition_list]:
         """Create 3D printer settings table."""
         stl_file_name = self.arguments[0]
@@ -0,0 +1,238 @@
+"""Build time budget of the osr Sphinx extension.
+
+Directives, roles and event handlers record their time, whether a cache was hit
+and the size of any asset produced. At ``build-finished`` a summary table is logged
+and, if ``osr_budget_report`` is set, a JSON report is written.
+
+Measurements taken while reading a document are tagged with the document name and
+moved to the build environment at ``doctree-read``, so that those of parallel read
+processes are merged into the main process with the environment.
+
+Example usage:
+
+.. code-block:: python
+
+    @budget.timed("osr:bom")
+    def run(self) -> list[nodes.Node]:
+        budget.record(hit=name in cache)
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ParamSpec, TypeVar
+
+import sphinx.application
+from docutils import nodes
+from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+#: Build environment attribute of measurements taken while reading documents.
+ENV_ATTRIBUTE = "osr_budget"
+
+
+@dataclass
+class Measurement:
+    """Time taken by a directive, role or event handler.
+
+    :param name: Directive, role or event handler name.
+    :param hit: Whether a cache was hit, ``None`` if not cached.
+    :param size: Size in bytes of assets produced.
+    :param docname: Document read while measured, ``None`` outside reading.
+    """
+
+    name: str
+    seconds: float = 0
+    hit: bool | None = None
+    size: int = 0
+    docname: str | None = None
+
+
+@dataclass
+class Summary:
+    """Total of the measurements of one name."""
+
+    name: str
+    count: int = 0
+    seconds: float = 0
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    def add(self, measurement: Measurement) -> None:
+        """Add measurement to the totals."""
+        self.count += 1
+        self.seconds += measurement.seconds
+        self.hits += measurement.hit is True
+        self.misses += measurement.hit is False
+        self.size += measurement.size
+
+
+class BuildBudget:
+    """Measurements of the current process."""
+
+    def __init__(self) -> None:
+        """Initialise BuildBudget."""
+        self.measurements: list[Measurement] = []
+
+        self._active: list[Measurement] = []
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[Measurement]:
+        """Measure the time taken by the body of the with statement."""
+        measurement = Measurement(name)
+        self._active.append(measurement)
+        start = perf_counter()
+
+        try:
+            yield measurement
+        finally:
+            measurement.seconds = perf_counter() - start
+            self._active.pop()
+            self.measurements.append(measurement)
+
+    def record(self, hit: bool | None = None, size: int = 0) -> None:
+        """Record cache hit or miss and asset size of the current measurement."""
+        if not self._active:
+            return
+
+        if hit is not None:
+            self._active[-1].hit = hit
+        self._active[-1].size += size
+
+    def timed(self, name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+        """Measure the time taken by each call of the decorated function."""
+
+        def decorator(function: Callable[P, T]) -> Callable[P, T]:
+            @wraps(function)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                with self.measure(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def pop(self) -> list[Measurement]:
+        """Remove and return measurements."""
+        result, self.measurements = self.measurements, []
+
+        return result
+
+
+budget = BuildBudget()
+
+
+def summarise(measurements: list[Measurement]) -> list[Summary]:
+    """Total measurements by name, the most time first."""
+    result: dict[str, Summary] = {}
+
+    for measurement in measurements:
+        result.setdefault(measurement.name, Summary(measurement.name)).add(measurement)
+
+    return sorted(result.values(), key=lambda summary: -summary.seconds)
+
+
+def table(summaries: list[Summary]) -> list[str]:
+    """Format summaries as table rows."""
+    rows = [
+        f"{'name':<24} {'count':>6} {'seconds':>9} {'hits':>5} {'misses':>6} "
+        f"{'bytes':>10}"
+    ]
+
+    for summary in summaries:
+        rows.append(
+            f"{summary.name:<24} {summary.count:>6} {summary.seconds:>9.2f} "
+            f"{summary.hits:>5} {summary.misses:>6} {summary.size:>10}"
+        )
+
+    return rows
+
+
+def env_budget(env: BuildEnvironment) -> list[Measurement]:
+    """Get measurements taken while reading documents."""
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, [])
+
+    result: list[Measurement] = getattr(env, ENV_ATTRIBUTE)
+
+    return result
+
+
+def reset_budget(app: sphinx.application.Sphinx, config: Config) -> None:
+    """Forget measurements, to be called first on config-inited."""
+    budget.pop()
+
+
+def reset_env_budget(app: sphinx.application.Sphinx) -> None:
+    """Forget measurements of the previous build, to be called on builder-inited."""
+    env_budget(app.env).clear()
+
+
+def collect_budget(app: sphinx.application.Sphinx, doctree: nodes.document) -> None:
+    """Move measurements to the build environment, to be called on doctree-read."""
+    measurements = budget.pop()
+    for measurement in measurements:
+        measurement.docname = app.env.docname
+
+    env_budget(app.env).extend(measurements)
+
+
+def merge_budget(
+    app: sphinx.application.Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge measurements taken by a parallel read process.
+
+    Only measurements of the documents read by that process are merged. A read
+    process forked after earlier processes were merged inherits their measurements.
+    """
+    env_budget(env).extend(
+        measurement
+        for measurement in env_budget(other)
+        if measurement.docname in docnames
+    )
+
+
+def report_budget(app: sphinx.application.Sphinx, exception: Exception | None) -> None:
+    """Log summary and write JSON report, to be called on build-finished."""
+    measurements = env_budget(app.env) + budget.pop()
+    if not measurements:
+        return
+
+    summaries = summarise(measurements)
+
+    logger.info("osr build budget:")
+    for row in table(summaries):
+        logger.info(f"    {row}")
+
+    if app.config.osr_budget_report:
+        report = Path(app.outdir) / app.config.osr_budget_report
+        write_report(report, summaries, measurements)
+        logger.info(f"osr build budget written to {report}")
+
+
+def write_report(
+    path: Path, summaries: list[Summary], measurements: list[Measurement]
+) -> None:
+    """Write JSON report."""
+    report: dict[str, Any] = {
+        "seconds": sum(summary.seconds for summary in summaries),
+        "summary": [asdict(summary) for summary in summaries],
+        "measurements": [asdict(measurement) for measurement in measurements],
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
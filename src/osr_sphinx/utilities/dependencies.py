@@ -0,0 +1,44 @@
+"""Record the project source files a document depends on.
+
+Sphinx re-reads a document when a file noted as a dependency is newer than the
+document's doctree. Directives and roles that model containers note the source of
+the container module and the project modules it imports, so that editing
+``osr_mechanical/rocker_axle.py`` re-reads only the documents modelling the rocker
+axle, including those modelling the final assembly.
+"""
+
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+
+from sphinx.environment import BuildEnvironment
+
+import osr_mechanical
+from osr_mechanical.dependencies import ModuleGraph
+
+#: Directory containing the project packages.
+SOURCE_ROOT = Path(osr_mechanical.__file__).parents[1]
+
+
+@cache
+def module_graph() -> ModuleGraph:
+    """Import graph of project source files, built once for each process."""
+    return ModuleGraph.from_directory(SOURCE_ROOT)
+
+
+def container_module(name: str) -> str:
+    """Get module of a container named relative to ``osr_mechanical``."""
+    return f"osr_mechanical.{name.rpartition('.')[0]}"
+
+
+def note_module_dependencies(env: BuildEnvironment, modules: Iterable[str]) -> None:
+    """Note source files of modules, and the modules they import, as dependencies.
+
+    :param env: Build environment, dependencies are noted for the current document.
+    :param modules: Dotted module names.
+    """
+    graph = module_graph()
+
+    for module in sorted(graph.closure(modules)):
+        if module in graph.paths:
+            env.note_dependency(str(graph.paths[module]))
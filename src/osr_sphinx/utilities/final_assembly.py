@@ -1,13 +1,83 @@
-"""Singleton for creating a CadQuery model of the final assembly."""
+"""Shared CadQuery model of the final assembly, created on first use.
 
+At ``builder-inited`` the model is saved to a cache file in the doctree directory,
+keyed by the hash of the final assembly source, unless the file exists. Parallel
+read processes load the model from the file rather than modelling it again, and
+builds reading no document that uses the model neither build nor load it.
+"""
+
+from pathlib import Path
+
+import cadquery as cq
+import sphinx.application
 from sphinx.util import logging
 from sphinx.util.console import bold  # type: ignore[attr-defined]
 
-from osr_mechanical.final import FinalAssembly
+from osr_common.serialization import load_assembly, save_assembly
+from osr_sphinx.utilities.budget import budget
+from osr_sphinx.utilities.dependencies import module_graph
 
 logger = logging.getLogger(__name__)
-logger.info(bold("creating CadQuery model of final assembly... "), nonl=True)
 
-final_assembly = FinalAssembly(simple=True)
+MODULE = "osr_mechanical.final"
+
+
+class FinalAssemblyModel:
+    """Simplified final assembly, loaded from the cache file if there is one."""
+
+    def __init__(self) -> None:
+        """Initialise FinalAssemblyModel."""
+        self.cache_file: Path | None = None
+
+        self._cq_object: cq.Assembly | None = None
+
+    @property
+    def cq_object(self) -> cq.Assembly:
+        """Get CadQuery assembly, creating it on first use."""
+        if self._cq_object is None:
+            if self.cache_file is not None and self.cache_file.exists():
+                self._cq_object = load_assembly(self.cache_file)
+            else:
+                self._cq_object = self.build()
+
+        return self._cq_object
+
+    @staticmethod
+    def build() -> cq.Assembly:
+        """Create CadQuery model of final assembly."""
+        from osr_mechanical.final import FinalAssembly
+
+        logger.info(bold("creating CadQuery model of final assembly... "), nonl=True)
+        result = FinalAssembly(simple=True).cq_object
+        logger.info("done")
+
+        return result
+
+    def prepare(self, cache_file: Path) -> None:
+        """Save model to cache file unless it exists, removing stale files."""
+        self.cache_file = cache_file
+
+        for path in cache_file.parent.glob("final-assembly-*.bin"):
+            if path != cache_file:
+                path.unlink()
+
+        budget.record(hit=cache_file.exists())
+
+        if not cache_file.exists():
+            save_assembly(self.cq_object, cache_file)
+            budget.record(size=cache_file.stat().st_size)
+
+
+final_assembly = FinalAssemblyModel()
+
+
+@budget.timed("final-assembly")
+def prepare_final_assembly(app: sphinx.application.Sphinx) -> None:
+    """Save final assembly model for parallel read processes.
 
-logger.info("done")
+    To be called on the Sphinx builder-inited event.
+    """
+    source_hash = module_graph().source_hash({MODULE})
+    final_assembly.prepare(
+        Path(app.doctreedir) / "osr" / f"final-assembly-{source_hash[:16]}.bin"
+    )
@@ -0,0 +1,57 @@
+"""Measurements of containers, computed once for each build.
+
+The bounding box of each container is computed once from the cached bounding boxes
+of its parts, so that repeated measurements, and containers sharing parts, do not
+flatten and measure an assembly again.
+"""
+
+from typing import Any
+
+import cadquery as cq
+
+from osr_common.measurements import BoundingBoxes, measure
+from osr_mechanical.cache import containers
+from osr_sphinx.utilities.final_assembly import final_assembly
+
+#: Container measured when no container is given.
+DEFAULT_CONTAINER = "final.FinalAssembly"
+
+
+class Measurements:
+    """Measurements of containers named relative to ``osr_mechanical``."""
+
+    def __init__(self) -> None:
+        """Initialise Measurements."""
+        self.bounding_boxes = BoundingBoxes()
+
+        self._containers: dict[str, cq.BoundBox] = {}
+
+    @staticmethod
+    def container(name: str) -> Any:
+        """Get container, the final assembly is the shared simplified model."""
+        if DEFAULT_CONTAINER == name:
+            return final_assembly
+
+        return containers.from_string(name)
+
+    def bounding_box(self, name: str) -> cq.BoundBox:
+        """Get bounding box of container, computing it on first use."""
+        if name not in self._containers:
+            self._containers[name] = self.bounding_boxes(self.container(name).cq_object)
+
+        return self._containers[name]
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether the bounding box of container has been computed."""
+        return name in self._containers
+
+    def add(self, name: str, bounding_box: cq.BoundBox) -> None:
+        """Add bounding box of container computed elsewhere."""
+        self._containers[name] = bounding_box
+
+    def measure(self, name: str, measurement: str) -> float:
+        """Get measurement of container, such as ``width``."""
+        return measure(self.bounding_box(name), measurement)
+
+
+measurements = Measurements()
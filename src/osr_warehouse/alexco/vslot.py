@@ -22,6 +22,7 @@ class Vslot2020:
 
     PROFILE: cq.Sketch
 
+    DESIGNATION = "AEC 2020"
     WIDTH = HEIGHT = 20
     COUNTERBORE_DEPTH = 6
 
@@ -57,6 +58,7 @@ class Vslot2040:
 
     PROFILE: cq.Sketch
 
+    DESIGNATION = "AEC 2040"
     WIDTH = 20
     HEIGHT = 40
     DISTANCE_BETWEEN_CENTERS = 20
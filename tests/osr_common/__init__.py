@@ -0,0 +1 @@
+"""OSR common tests."""
@@ -0,0 +1,110 @@
+"""Test changelog provider."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from osr_common.changelog import ChangelogProvider
+
+
+def git(*args: str) -> None:
+    """Run git command."""
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repository(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create git repository with a commit, the working directory."""
+    directory = tmp_path / "repository"
+    directory.mkdir()
+    monkeypatch.chdir(directory)
+
+    git("init", "--quiet")
+    git("commit", "--quiet", "--allow-empty", "--message", "feat: initial")
+
+    return directory
+
+
+@pytest.fixture
+def provider(tmp_path: Path) -> ChangelogProvider:
+    """Create changelog provider printing the file name."""
+    return ChangelogProvider(
+        tmp_path / "cache",
+        [sys.executable, "-c", "import sys; print(sys.argv[1])"],
+    )
+
+
+@pytest.mark.usefixtures("repository")
+class TestChangelogProvider:
+    """Test changelog provider."""
+
+    def test_cached(self, provider: ChangelogProvider) -> None:
+        """Test changelog is generated once for each revision and format."""
+        assert "CHANGELOG.rst\n" == provider.text("CHANGELOG.rst")
+        assert "CHANGELOG.rst\n" == provider.text("CHANGELOG.rst")
+        assert "CHANGELOG.md\n" == provider.text("CHANGELOG.md")
+
+        assert (1, 2) == (provider.hits, provider.misses)
+
+    def test_revision(self) -> None:
+        """Test revision changes with commits and tags."""
+        revisions = {ChangelogProvider.revision()}
+
+        git("tag", "v1.0.0")
+        revisions.add(ChangelogProvider.revision())
+
+        git("commit", "--quiet", "--allow-empty", "--message", "fix: change")
+        revisions.add(ChangelogProvider.revision())
+
+        assert 3 == len(revisions)
+
+    def test_configuration(self, repository: Path) -> None:
+        """Test revision changes with the Commitizen configuration."""
+        revisions = {ChangelogProvider.revision()}
+
+        (repository / "pyproject.toml").write_text("[tool.commitizen]\n")
+        revisions.add(ChangelogProvider.revision())
+
+        (repository / "pyproject.toml").write_text(
+            '[tool.commitizen]\ntemplate = "CHANGELOG.md.j2"\n'
+        )
+        revisions.add(ChangelogProvider.revision())
+
+        assert 3 == len(revisions)
+
+
+class TestChangelogProviderFailures:
+    """Test changelog provider outside a repository and when Commitizen fails."""
+
+    def test_not_a_repository(
+        self,
+        provider: ChangelogProvider,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test changelog is generated but not cached outside a repository."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+
+        assert ChangelogProvider.revision() is None
+        assert "CHANGELOG.rst\n" == provider.text("CHANGELOG.rst")
+        assert not provider.directory.exists()
+
+    @pytest.mark.usefixtures("repository")
+    def test_failure(self, tmp_path: Path) -> None:
+        """Test failed changelog is not cached, or raises if checked."""
+        provider = ChangelogProvider(
+            tmp_path / "cache", [sys.executable, "-c", "print('partial'); exit(1)"]
+        )
+
+        assert "partial\n" == provider.text("CHANGELOG.rst")
+        assert not provider.directory.exists()
+
+        with pytest.raises(subprocess.CalledProcessError):
+            provider.text("CHANGELOG.rst", check=True)
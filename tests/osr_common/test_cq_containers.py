@@ -0,0 +1,46 @@
+"""Test CadQuery object containers."""
+
+import cadquery as cq
+
+from osr_common.cq_containers import CqWorkplaneContainer, memoise_containers
+
+
+class Block(CqWorkplaneContainer):
+    """Block container."""
+
+    def __init__(self, height: float = 1) -> None:
+        """Initialise Block."""
+        self.height = height
+        self._cq_object = self._make()
+
+    def _make(self) -> cq.Workplane:
+        """Create block."""
+        return cq.Workplane().box(1, 1, self.height)
+
+
+class TestMemoiseContainers:
+    """Test container memoisation."""
+
+    def test_not_memoised_by_default(self) -> None:
+        """Test containers are created on each call outside the context."""
+        assert Block() is not Block()
+
+    def test_memoised(self) -> None:
+        """Test containers with equal arguments are reused."""
+        with memoise_containers() as memo:
+            first = Block(height=2)
+
+            assert first is Block(height=2)
+            assert first is not Block(height=3)
+
+        assert 2 == len(memo)
+
+    def test_shared_memo(self) -> None:
+        """Test memo is reused between contexts."""
+        memo: dict[object, object] = {}
+
+        with memoise_containers(memo):
+            first = Block()
+
+        with memoise_containers(memo):
+            assert first is Block()
@@ -0,0 +1,67 @@
+"""Test binary glTF export."""
+
+import json
+import struct
+from typing import Any
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from osr_common.gltf import glb, quantize
+
+
+def parse(data: bytes) -> tuple[dict[str, Any], bytes]:
+    """Parse GLB container into JSON document and binary buffer."""
+    magic, version, length = struct.unpack_from("<4sII", data)
+    assert (b"glTF", 2, len(data)) == (magic, version, length)
+
+    json_length, json_type = struct.unpack_from("<I4s", data, 12)
+    assert b"JSON" == json_type
+    document = json.loads(data[20 : 20 + json_length])
+
+    binary_length, binary_type = struct.unpack_from("<I4s", data, 20 + json_length)
+    assert b"BIN\0" == binary_type
+
+    return document, data[28 + json_length : 28 + json_length + binary_length]
+
+
+@pytest.fixture
+def assembly() -> cq.Assembly:
+    """Create assembly using a part twice."""
+    box = cq.Workplane().box(10, 20, 30)
+
+    return (
+        cq.Assembly()
+        .add(box, loc=cq.Location((100, 0, 0)), color=cq.Color("red"))
+        .add(box, loc=cq.Location((0, 0, 0), (0, 0, 1), 90), color=cq.Color("red"))
+    )
+
+
+def test_quantize() -> None:
+    """Test quantized vertices are restored by the dequantization matrix."""
+    vertices = np.array([[-5, 0, 2], [5, 1, 2], [0, 0.5, 2]], dtype=np.float32)
+
+    result, dequantize = quantize(vertices)
+    restored = (dequantize @ np.c_[result[:, :3], np.ones(3)].T).T[:, :3]
+
+    assert (3, 4) == result.shape
+    assert vertices == pytest.approx(restored, abs=1e-3)
+
+
+def test_instances(assembly: cq.Assembly) -> None:
+    """Test a part used twice is stored as one mesh."""
+    document, binary = parse(glb(assembly))
+
+    assert 1 == len(document["meshes"])
+    assert 1 == len(document["materials"])
+    assert [1, 2] == document["nodes"][0]["children"]
+    assert {0} == {node["mesh"] for node in document["nodes"][1:]}
+    assert len(binary) == document["buffers"][0]["byteLength"]
+
+
+def test_alignment(assembly: cq.Assembly) -> None:
+    """Test buffer views are aligned to four bytes."""
+    document, _binary = parse(glb(assembly))
+
+    assert all(0 == view["byteOffset"] % 4 for view in document["bufferViews"])
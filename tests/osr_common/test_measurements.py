@@ -0,0 +1,72 @@
+"""Test bounding box measurements."""
+
+import cadquery as cq
+import pytest
+
+from osr_common.measurements import BoundingBoxes, axis_aligned, measure
+
+
+@pytest.fixture
+def assembly() -> cq.Assembly:
+    """Create assembly using a part more than once."""
+    box = cq.Workplane().box(10, 20, 30)
+
+    return (
+        cq.Assembly()
+        .add(box, loc=cq.Location((100, 0, 0)))
+        .add(box, loc=cq.Location((0, 0, 0), (0, 0, 1), 90))
+        .add(cq.Workplane().cylinder(5, 3), loc=cq.Location((0, 0, 50)))
+    )
+
+
+class TestBoundingBoxes:
+    """Test bounding boxes."""
+
+    def test_assembly(self, assembly: cq.Assembly) -> None:
+        """Test assembly box matches box of flattened assembly."""
+        expected = assembly.toCompound().BoundingBox()
+        result = BoundingBoxes()(assembly)
+
+        assert expected.xmin == pytest.approx(result.xmin)
+        assert expected.xmax == pytest.approx(result.xmax)
+        assert expected.ylen == pytest.approx(result.ylen)
+        assert expected.zlen == pytest.approx(result.zlen)
+
+    def test_parts_cached(self, assembly: cq.Assembly) -> None:
+        """Test parts used more than once are measured once."""
+        bounding_boxes = BoundingBoxes()
+        bounding_boxes(assembly)
+
+        assert 2 == len(bounding_boxes)
+
+    def test_rotated_part(self) -> None:
+        """Test part rotated other than by a multiple of 90° is not enlarged."""
+        cylinder = cq.Solid.makeCylinder(5, 40)
+        assembly = cq.Assembly().add(
+            cylinder, loc=cq.Location((0, 0, 0), (1, 1, 0), 30)
+        )
+
+        expected = assembly.toCompound().BoundingBox()
+        result = BoundingBoxes()(assembly)
+
+        assert expected.xlen == pytest.approx(result.xlen)
+        assert expected.ylen == pytest.approx(result.ylen)
+        assert expected.zlen == pytest.approx(result.zlen)
+
+
+def test_axis_aligned() -> None:
+    """Test rotations by multiples of 90°."""
+    assert axis_aligned(cq.Location((1, 2, 3), (0, 0, 1), 270))
+    assert not axis_aligned(cq.Location((1, 2, 3), (0, 0, 1), 30))
+
+
+def test_measure() -> None:
+    """Test measurements of bounding box."""
+    bounding_box = cq.Solid.makeBox(10, 20, 30).BoundingBox()
+
+    assert 10 == pytest.approx(measure(bounding_box, "width"))
+    assert 20 == pytest.approx(measure(bounding_box, "length"))
+    assert 30 == pytest.approx(measure(bounding_box, "height"))
+
+    with pytest.raises(ValueError):
+        measure(bounding_box, "depth")
@@ -0,0 +1,71 @@
+"""Test meshing settings."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import cadquery as cq
+import pytest
+from OCP.BRepTools import BRepTools
+
+from osr_common.cq_wrappers import Export
+from osr_common.meshing import MeshSettings, mesh_settings, set_mesh_settings
+from osr_common.tessellation import TessellationCache, as_shape
+
+
+@pytest.fixture
+def cylinder() -> cq.Shape:
+    """Create cylinder."""
+    return as_shape(cq.Workplane().cylinder(20, 5))
+
+
+@pytest.fixture
+def project_settings() -> Iterator[None]:
+    """Restore project-wide meshing settings."""
+    settings = mesh_settings()
+    yield
+    set_mesh_settings(settings)
+
+
+class TestMeshSettings:
+    """Test meshing settings."""
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_mesh(self, cylinder: cq.Shape, parallel: bool) -> None:
+        """Test shape is meshed within tolerance."""
+        MeshSettings(parallel=parallel).mesh(cylinder, 0.01, 0.1)
+
+        assert BRepTools.Triangulation_s(cylinder.wrapped, 0.01)
+
+    def test_key(self) -> None:
+        """Test parallel meshing does not affect key."""
+        assert MeshSettings(parallel=True).key == MeshSettings(parallel=False).key
+        assert MeshSettings(relative=True).key != MeshSettings().key
+        assert MeshSettings(min_size=0.1).key != MeshSettings().key
+
+    def test_tessellation_cache(self, cylinder: cq.Shape) -> None:
+        """Test meshes are cached by settings."""
+        cache = TessellationCache()
+
+        cache.get(cylinder, 0.01, settings=MeshSettings(parallel=True))
+        cache.get(cylinder, 0.01, settings=MeshSettings(parallel=False))
+        cache.get(cylinder, 0.01, settings=MeshSettings(relative=True))
+
+        assert (1, 2) == (cache.hits, cache.misses)
+
+    @pytest.mark.usefixtures("project_settings")
+    def test_project_settings(self) -> None:
+        """Test project-wide settings."""
+        settings = MeshSettings(parallel=False, relative=True)
+        set_mesh_settings(settings)
+
+        assert settings is mesh_settings()
+
+
+def test_export_stl(cylinder: cq.Shape, tmp_path: Path) -> None:
+    """Test STL export is meshed with settings, leaving the shape unchanged."""
+    out_file = tmp_path / "cylinder.stl"
+
+    Export()(cylinder, out_file, tolerance=0.01, settings=MeshSettings(parallel=True))
+
+    assert out_file.stat().st_size > 84
+    assert not BRepTools.Triangulation_s(cylinder.wrapped, 0.01)
@@ -0,0 +1,52 @@
+"""Test assembly serialization."""
+
+from pathlib import Path
+
+import cadquery as cq
+import pytest
+
+from osr_common.serialization import load_assembly, save_assembly
+
+
+@pytest.fixture
+def assembly() -> cq.Assembly:
+    """Create nested assembly using a part more than once."""
+    box = cq.Workplane().box(10, 20, 30)
+    sub_assembly = cq.Assembly(name="sub", loc=cq.Location((0, 0, 10))).add(
+        box,
+        name="rotated",
+        loc=cq.Location((0, 0, 0), (0, 0, 1), 90),
+        color=cq.Color("red"),
+    )
+
+    return (
+        cq.Assembly(name="top")
+        .add(box, name="moved", loc=cq.Location((100, 0, 0)))
+        .add(sub_assembly)
+    )
+
+
+def test_round_trip(assembly: cq.Assembly, tmp_path: Path) -> None:
+    """Test parts are loaded with names, locations and colours."""
+    result = load_assembly(save_assembly(assembly, tmp_path / "assembly.bin"))
+
+    assert [
+        (name, color and color.toTuple()) for _shape, name, _location, color in assembly
+    ] == [
+        (name, color and color.toTuple()) for _shape, name, _location, color in result
+    ]
+
+    expected = assembly.toCompound().BoundingBox()
+    bounding_box = result.toCompound().BoundingBox()
+
+    assert expected.xmax == pytest.approx(bounding_box.xmax)
+    assert expected.ylen == pytest.approx(bounding_box.ylen)
+    assert expected.zmax == pytest.approx(bounding_box.zmax)
+
+
+def test_shared_shapes(assembly: cq.Assembly, tmp_path: Path) -> None:
+    """Test shapes used more than once are loaded once."""
+    result = load_assembly(save_assembly(assembly, tmp_path / "assembly.bin"))
+    first, second = (shape for shape, _name, _location, _color in result)
+
+    assert first.isSame(second)
@@ -0,0 +1,141 @@
+"""Test tessellation cache."""
+
+import os
+from pathlib import Path
+
+import cadquery as cq
+import numpy as np
+import pytest
+from OCP.BRepTools import BRepTools
+
+from osr_common.cache import cache_directory
+from osr_common.meshing import MeshSettings, mesh_settings
+from osr_common.tessellation import Mesh, TessellationCache, as_shape
+
+
+@pytest.fixture
+def box() -> cq.Shape:
+    """Create box."""
+    return as_shape(cq.Workplane().box(10, 20, 30))
+
+
+class TestTessellationCache:
+    """Test tessellation cache."""
+
+    def test_memory(self, box: cq.Shape) -> None:
+        """Test mesh is reused from memory."""
+        cache = TessellationCache()
+
+        first = cache.get(box)
+
+        assert first is cache.get(box)
+        assert (1, 1) == (cache.hits, cache.misses)
+        assert 12 == len(first.triangles)
+
+    def test_tolerance(self, box: cq.Shape) -> None:
+        """Test meshes are cached by tolerance."""
+        cache = TessellationCache()
+
+        assert cache.get(box, 0.1) is not cache.get(box, 0.01)
+
+    def test_moved_shape(self, box: cq.Shape) -> None:
+        """Test moved shape is tessellated again."""
+        cache = TessellationCache()
+
+        cache.get(box)
+        cache.get(box.translate(cq.Vector(1, 0, 0)))
+
+        assert 2 == cache.misses
+
+    def test_disk(self, box: cq.Shape, tmp_path: Path) -> None:
+        """Test mesh is memory mapped from disk by a new cache."""
+        expected = TessellationCache(tmp_path).get(box)
+
+        cache = TessellationCache(tmp_path)
+        mesh = cache.get(box)
+
+        assert 1 == cache.hits
+        assert isinstance(mesh.vertices, np.memmap)
+        np.testing.assert_array_equal(expected.triangles, mesh.triangles)
+
+    def test_prune(self, box: cq.Shape, tmp_path: Path) -> None:
+        """Test least recently used meshes are removed from disk."""
+        cache = TessellationCache(tmp_path)
+        shapes = [box.translate(cq.Vector(i, 0, 0)) for i in range(3)]
+        keys = [cache.key(shape, 0.1, 0.1, mesh_settings()) for shape in shapes]
+
+        for shape, used in zip(shapes, [2, 1, 3]):
+            cache.get(shape)
+            for path in tmp_path.glob("*/*.npy"):
+                if path.name.startswith(keys[shapes.index(shape)]):
+                    os.utime(path, (used, used))
+
+        size = sum(path.stat().st_size for path in tmp_path.glob("*/*.npy")) // 3
+        cache.prune(2 * size)
+
+        assert [True, False, True] == [
+            (tmp_path / key[:2] / f"{key}.vertices.npy").exists() for key in keys
+        ]
+
+    def test_max_bytes(self, box: cq.Shape, tmp_path: Path) -> None:
+        """Test meshes are pruned when saving exceeds the maximum size."""
+        TessellationCache(tmp_path, max_bytes=1).get(box)
+
+        assert [] == list(tmp_path.glob("*/*.npy"))
+
+    def test_read_only(self, box: cq.Shape) -> None:
+        """Test arrays are read-only."""
+        mesh = TessellationCache().get(box)
+
+        with pytest.raises(ValueError):
+            mesh.vertices[0, 0] = 1
+
+
+def test_face_without_triangulation(
+    box: cq.Shape, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test faces which could not be meshed are skipped."""
+    mesh_shape = MeshSettings.mesh
+
+    def mesh_except_first_face(
+        settings: MeshSettings, shape: cq.Shape, *args: float
+    ) -> None:
+        mesh_shape(settings, shape, *args)
+        BRepTools.Clean_s(shape.Faces()[0].wrapped)
+
+    monkeypatch.setattr(MeshSettings, "mesh", mesh_except_first_face)
+
+    mesh = Mesh.from_shape(box, 0.1, 0.1)
+
+    assert 10 == len(mesh.triangles)
+    assert "1 faces could not be meshed" in caplog.text
+
+
+def test_meshed_shape() -> None:
+    """Test mesh does not depend on an existing triangulation of the shape."""
+    sphere = cq.Solid.makeSphere(10)
+    coarse = Mesh.from_shape(sphere, 1, 0.5)
+
+    assert not BRepTools.Triangulation_s(sphere.wrapped, 1)
+
+    MeshSettings().mesh(sphere, 0.01, 0.1)
+
+    assert len(coarse.triangles) == len(Mesh.from_shape(sphere, 1, 0.5).triangles)
+
+
+def test_write_stl(box: cq.Shape, tmp_path: Path) -> None:
+    """Test binary STL has a record for each triangle."""
+    mesh = TessellationCache().get(box)
+    path = tmp_path / "box.stl"
+
+    mesh.write_stl(path)
+
+    assert 84 + 50 * 12 == path.stat().st_size
+    np.testing.assert_allclose(1, np.linalg.norm(mesh.normals(), axis=1), rtol=1e-6)
+
+
+def test_cache_directory(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test cache directory environment variable."""
+    monkeypatch.setenv("OSR_CACHE_DIR", str(tmp_path))
+
+    assert tmp_path / "tessellation" == cache_directory("tessellation")
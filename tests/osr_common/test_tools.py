@@ -0,0 +1,69 @@
+"""Test external tool runner."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import CalledProcessError, TimeoutExpired
+from time import perf_counter
+
+import pytest
+
+from osr_common.tools import Tool, ToolRunner
+
+PYTHON = sys.executable
+
+
+def python(code: str) -> list[str]:
+    """Python command running code."""
+    return [PYTHON, "-c", code]
+
+
+class TestToolRunner:
+    """Test external tool runner."""
+
+    def test_output(self) -> None:
+        """Test output is captured."""
+        result = ToolRunner().run_sync(python("print('out'); exit(3)"))
+
+        assert (3, "out\n", 1) == (result.returncode, result.stdout, result.attempts)
+        with pytest.raises(CalledProcessError):
+            result.check_returncode()
+
+    def test_retries(self) -> None:
+        """Test failed invocation is retried."""
+        runner = ToolRunner({PYTHON: Tool(retries=2)})
+
+        result = runner.run_sync(python("exit(1)"))
+
+        assert 3 == result.attempts
+
+    def test_timeout(self) -> None:
+        """Test invocation is killed on timeout."""
+        runner = ToolRunner({PYTHON: Tool(timeout=0.5)})
+
+        with pytest.raises(TimeoutExpired):
+            runner.run_sync(python("import time; time.sleep(10)"))
+
+    def test_concurrency(self) -> None:
+        """Test invocations overlap within the concurrency limit."""
+        runner = ToolRunner({PYTHON: Tool(concurrency=2)})
+        command = python("import time; time.sleep(0.5)")
+
+        start = perf_counter()
+        results = runner.run_all([command] * 4)
+        seconds = perf_counter() - start
+
+        assert [0, 0, 0, 0] == [result.returncode for result in results]
+        assert 1 <= seconds < 2
+
+    def test_concurrency_threads(self) -> None:
+        """Test the concurrency limit applies to event loops in other threads."""
+        runner = ToolRunner({PYTHON: Tool(concurrency=1)})
+        command = python("import time; time.sleep(0.5)")
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(runner.run_sync, [command] * 2))
+        seconds = perf_counter() - start
+
+        assert [0, 0] == [result.returncode for result in results]
+        assert seconds >= 1
@@ -0,0 +1,67 @@
+"""Test cut list optimisation."""
+
+import pytest
+
+from osr_mechanical.bom.cutlist import Cut, CutListOptimiser
+from osr_mechanical.bom.parts import PartIdentifier, PartTypes
+
+
+class TestCutListOptimiser:
+    """Test cut list optimiser."""
+
+    def setup_method(self) -> None:
+        """Set up TestCutListOptimiser."""
+        self.optimiser = CutListOptimiser(stock_length=1000, kerf=3)
+
+    @staticmethod
+    def part(root: str, length: float, profile: str = "AEC 2020") -> PartIdentifier:
+        """Create T-slot part."""
+        return PartIdentifier(
+            PartTypes.tslot, root, "Test part.", profile=profile, length=length
+        )
+
+    def test_parts_without_length_ignored(self) -> None:
+        """Test parts without a length are not cut."""
+        bracket = PartIdentifier(PartTypes.tslot, "BRACKET", "Test bracket.")
+
+        cut_list = self.optimiser.optimise([(bracket, 4)])
+
+        assert 0 == len(cut_list)
+
+    def test_kerf(self) -> None:
+        """Test kerf is allowed for each cut."""
+        cut_list = self.optimiser.optimise([(self.part("HALF", 500), 2)])
+
+        assert 2 == len(cut_list)
+
+    def test_multiplier(self) -> None:
+        """Test quantity is multiplied by the number of assemblies."""
+        cut_list = self.optimiser.optimise([(self.part("BEAM", 240), 2)], multiplier=3)
+
+        assert 6 == sum(len(bar.cuts) for bar in cut_list)
+        assert 2 == len(cut_list)
+
+    def test_profiles_not_mixed(self) -> None:
+        """Test each profile is cut from its own stock."""
+        parts = [(self.part("A", 100), 1), (self.part("B", 100, "AEC 2040"), 1)]
+
+        cut_list = self.optimiser.optimise(parts)
+
+        assert 1 == cut_list.bar_count("AEC 2020")
+        assert 1 == cut_list.bar_count("AEC 2040")
+
+    def test_exact_improves_first_fit_decreasing(self) -> None:
+        """Test exact solver finds the optimal packing where FFD does not."""
+        optimiser = CutListOptimiser(stock_length=100, kerf=0)
+        cuts = [Cut(str(length), length) for length in [50, 40, 30, 30, 25, 25]]
+
+        first_fit = optimiser.first_fit_decreasing("P", cuts)
+        optimal = optimiser.optimise_profile("P", cuts)
+
+        assert 3 == len(first_fit)
+        assert 2 == len(optimal)
+
+    def test_part_longer_than_stock(self) -> None:
+        """Test part longer than stock length."""
+        with pytest.raises(ValueError):
+            self.optimiser.optimise([(self.part("LONG", 1200), 1)])
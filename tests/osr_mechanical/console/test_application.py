@@ -0,0 +1,61 @@
+"""Test console application start-up."""
+
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET = 200_000  # μs
+HEAVY_MODULES = {"cadquery", "OCP", "PIL", "jinja2", "ezdxf", "cq_warehouse"}
+MODULE = "osr_mechanical.console.application"
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of each module imported by module.
+
+    Uses ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestImportTime:
+    """Test console import time budget."""
+
+    def setup_method(self) -> None:
+        """Set up TestImportTime."""
+        self.times = import_times(MODULE)
+
+    def test_no_heavy_imports(self) -> None:
+        """Test heavy dependencies are not imported at start-up."""
+        top_level = {name.split(".")[0] for name in self.times}
+
+        assert set() == top_level & HEAVY_MODULES
+
+    def test_import_time_budget(self) -> None:
+        """Test console import time is within budget."""
+        assert self.times[MODULE] < IMPORT_TIME_BUDGET
+
+
+def test_version() -> None:
+    """Test version option."""
+    result = subprocess.run(
+        [sys.executable, "-m", MODULE, "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.startswith("console ")
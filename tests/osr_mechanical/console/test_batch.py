@@ -0,0 +1,225 @@
+"""Test batch job runner."""
+
+from pathlib import Path
+from typing import Any
+
+import cadquery as cq
+import pytest
+
+from osr_mechanical import cache
+from osr_mechanical.bom.parts import port
+from osr_mechanical.cache import ContainerCache
+from osr_mechanical.console import batch
+from osr_mechanical.console.batch import (
+    BatchRunner,
+    Job,
+    JobFileError,
+    SharedJob,
+    group_jobs,
+    load_jobs,
+    resolve_arguments,
+    select_part,
+    share_jobs,
+)
+
+JOBS = """
+[[job]]
+name = "step"
+assembly = "final.FinalAssembly"
+format = "step"
+output = "final.step"
+
+[[job]]
+name = "simple"
+assembly = "final.FinalAssembly"
+arguments = {simple = true}
+format = "stl"
+output = "final.stl"
+
+[[job]]
+assembly = "final.FinalAssembly"
+format = "bom-csv"
+output = "bom.csv"
+
+[[job]]
+command = ["open-graph-card"]
+"""
+
+
+class TestLoadJobs:
+    """Test job file loading."""
+
+    def test_load(self) -> None:
+        """Test jobs are loaded with default names."""
+        jobs = load_jobs(JOBS)
+
+        assert ["step", "simple", "job-2", "job-3"] == [job.name for job in jobs]
+        assert Path("bom.csv") == jobs[2].output
+
+    def test_unknown_format(self) -> None:
+        """Test unknown export format."""
+        with pytest.raises(JobFileError):
+            load_jobs('[[job]]\nassembly = "a.A"\nformat = "x"\noutput = "a.x"')
+
+    def test_unknown_key(self) -> None:
+        """Test unknown job key."""
+        with pytest.raises(JobFileError):
+            load_jobs('[[job]]\ncommand = ["bom"]\ncolour = "red"')
+
+    @pytest.mark.parametrize(
+        "document", ['[job]\ncommand = ["bom"]', 'job = ["bom"]', "job = 1"]
+    )
+    def test_not_array_of_tables(self, document: str) -> None:
+        """Test jobs must be an array of tables."""
+        with pytest.raises(JobFileError):
+            load_jobs(document)
+
+    def test_duplicate_names(self) -> None:
+        """Test job names are unique."""
+        with pytest.raises(JobFileError):
+            load_jobs('[[job]]\nname = "a"\ncommand = []\n' * 2)
+
+
+def test_group_jobs() -> None:
+    """Test jobs sharing a container are grouped."""
+    groups = group_jobs(load_jobs(JOBS))
+
+    assert [["step", "job-2"], ["simple"], ["job-3"]] == [
+        [job.name for job in group] for group in groups
+    ]
+
+
+def test_resolve_arguments() -> None:
+    """Test @ prefixed arguments are resolved to objects."""
+    arguments = {"nautical_side": "@bom.parts.port", "simple": True}
+
+    assert {"nautical_side": port, "simple": True} == resolve_arguments(arguments)
+
+
+class TestSelectPart:
+    """Test part selection."""
+
+    def setup_method(self) -> None:
+        """Set up TestSelectPart."""
+        self.box = cq.Workplane().box(1, 1, 1)
+        self.assembly = cq.Assembly(name="root").add(
+            cq.Assembly(name="sub").add(self.box, name="box")
+        )
+
+    def test_part(self) -> None:
+        """Test part of a sub-assembly."""
+        assert self.box is select_part(self.assembly, "sub/box")
+
+    def test_sub_assembly(self) -> None:
+        """Test sub-assembly."""
+        assert "sub" == select_part(self.assembly, "sub").name
+
+    def test_invalid(self) -> None:
+        """Test invalid part name."""
+        with pytest.raises(ValueError):
+            select_part(self.assembly, "lid")
+
+
+class Plate:
+    """Container counting how often it is built."""
+
+    builds = 0
+
+    def __init__(self, assembly: bool = False) -> None:
+        """Initialise Plate."""
+        Plate.builds += 1
+        plate = cq.Workplane().box(10, 10, 1)
+
+        self.cq_object: Any = (
+            cq.Assembly(name="plates").add(plate, name="a").add(plate, name="b")
+            if assembly
+            else plate
+        )
+
+
+@pytest.fixture
+def plate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Resolve containers to Plate, with an empty container cache."""
+    monkeypatch.setattr(cache, "container_class", lambda _name: Plate)
+    monkeypatch.setattr(batch, "containers", ContainerCache())
+    monkeypatch.setattr(Plate, "builds", 0)
+
+
+@pytest.mark.usefixtures("plate")
+class TestShareJobs:
+    """Test exports of one container sharing a saved model."""
+
+    def jobs(self, directory: Path, *formats: str, **kwargs: Any) -> list[Job]:
+        """Create export jobs of plate."""
+        return [
+            Job(
+                name=export_format,
+                output=directory / f"plate.{export_format}",
+                assembly="plate.Plate",
+                format=export_format,
+                **kwargs,
+            )
+            for export_format in formats
+        ]
+
+    def test_shape(self, tmp_path: Path) -> None:
+        """Test container is built once and shared by exports of shapes."""
+        groups = share_jobs(self.jobs(tmp_path, "dxf", "stl", "step"), tmp_path)
+
+        assert [["dxf"], ["stl"], ["step"]] == [[j.name for j in g] for g in groups]
+        assert 1 == Plate.builds
+        assert not isinstance(groups[0][0], SharedJob)
+
+        shared = groups[1][0]
+        assert isinstance(shared, SharedJob)
+        assert 100 == pytest.approx(shared.cq_object().Volume())
+
+    def test_assembly(self, tmp_path: Path) -> None:
+        """Test assemblies are shared flattened."""
+        jobs = self.jobs(tmp_path, "glb", arguments={"assembly": True})
+
+        ((shared,),) = share_jobs(jobs, tmp_path)
+        assembly = shared.cq_object()
+
+        assert isinstance(assembly, cq.Assembly)
+        assert 200 == pytest.approx(assembly.toCompound().Volume())
+
+    def test_build_failure(self, tmp_path: Path) -> None:
+        """Test jobs are not shared if the container cannot be built."""
+        jobs = self.jobs(tmp_path, "stl", "step", part="missing")
+
+        assert [jobs] == share_jobs(jobs, tmp_path)
+
+    def test_run(self, tmp_path: Path) -> None:
+        """Test shared exports run in worker processes."""
+        jobs = self.jobs(tmp_path, "brep", "step", "stl")
+
+        results = BatchRunner(workers=2).run(jobs)
+
+        assert [None] * 3 == [result.error for result in results]
+        assert 1 == Plate.builds
+        assert all(job.output and job.output.stat().st_size for job in jobs)
+
+
+class TestBatchRunner:
+    """Test batch runner."""
+
+    def test_commands(self, tmp_path: Path) -> None:
+        """Test command jobs run in worker processes."""
+        jobs = load_jobs(f"""
+            [[job]]
+            name = "version"
+            command = ["--version"]
+            output = "{tmp_path / "version.txt"}"
+
+            [[job]]
+            name = "invalid"
+            command = ["invalid-command"]
+            """)
+
+        results = BatchRunner(workers=2).run(jobs)
+
+        assert ["version", "invalid"] == [result.name for result in results]
+        assert results[0].error is None
+        assert results[1].error is not None
+        assert (tmp_path / "version.txt").read_text().startswith("console ")
@@ -0,0 +1,74 @@
+"""Test console daemon."""
+
+import json
+import socket
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from osr_mechanical.console.daemon import DaemonServer, exit_status, send_message
+
+
+def command(argv: list[str]) -> None:
+    """Echo arguments and exit with the first as the status."""
+    sys.stdout.write(" ".join(argv))
+    sys.stderr.write("warning")
+
+    exit(int(argv[0]))
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> Iterator[Path]:
+    """Run daemon in a thread."""
+    socket_path = tmp_path / "daemon.sock"
+    server = DaemonServer(socket_path, command)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    yield socket_path
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def request(socket_path: Path, argv: list[str], cwd: Path) -> list[dict[str, Any]]:
+    """Send request to daemon and read response messages."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+
+        with client.makefile("rwb") as stream:
+            send_message(stream, {"argv": argv, "cwd": str(cwd)})
+
+            return [json.loads(line) for line in stream]
+
+
+class TestDaemonServer:
+    """Test console daemon server."""
+
+    def test_output_and_exit_status(self, daemon: Path, tmp_path: Path) -> None:
+        """Test output is streamed followed by the exit status."""
+        messages = request(daemon, ["3", "bom"], tmp_path)
+
+        assert [{"stdout": "3 bom"}, {"stderr": "warning"}, {"exit": 3}] == messages
+
+    def test_sequential_commands(self, daemon: Path, tmp_path: Path) -> None:
+        """Test daemon serves more than one command."""
+        request(daemon, ["0"], tmp_path)
+
+        assert {"exit": 0} == request(daemon, ["0"], tmp_path)[-1]
+
+    def test_daemon_already_running(self, daemon: Path) -> None:
+        """Test second daemon on the same socket."""
+        with pytest.raises(RuntimeError):
+            DaemonServer(daemon, command)
+
+
+@pytest.mark.parametrize("code,expected", [(None, 0), (2, 2), ("error", 1)])
+def test_exit_status(code: Any, expected: int) -> None:
+    """Test conversion of SystemExit code to exit status."""
+    assert expected == exit_status(code)
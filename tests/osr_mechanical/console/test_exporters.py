@@ -0,0 +1,31 @@
+"""Test custom exporters."""
+
+from osr_mechanical.console.exporters import ExportPNG
+from osr_mechanical.console.renderers import CAMERAS, View
+
+
+class TestExportPNG:
+    """Test PNG exporter."""
+
+    def test_downscale_sources(self) -> None:
+        """Test views of a camera are cropped and downscaled from one view."""
+        large = View(CAMERAS["iso"], 1000, 750)
+        small = View(CAMERAS["iso"], 640, 480)
+        og_image = View(CAMERAS["iso"], 640, 490)
+        top = View(CAMERAS["top"], 640, 480)
+
+        sources = ExportPNG.downscale_sources([small, large, og_image, top])
+
+        assert [large, large, large, top] == sources
+
+    def test_downscale_sources_cover(self) -> None:
+        """Test views are cropped from a view covering all of them."""
+        large = View(CAMERAS["iso"], 1000, 750)
+        wide = View(CAMERAS["iso"], 1200, 600)
+        portrait = View(CAMERAS["iso"], 300, 400)
+        tall = View(CAMERAS["iso"], 200, 400)
+
+        sources = ExportPNG.downscale_sources([large, wide, portrait, tall])
+
+        assert [View(CAMERAS["iso"], 1500, 750)] * 2 == sources[:2]
+        assert [View(CAMERAS["iso"], 300, 600)] * 2 == sources[2:]
@@ -0,0 +1,74 @@
+"""Test image labelling and PNG optimisation."""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+from osr_mechanical.console.images import (
+    FONT_PATH,
+    Labeller,
+    encode_png,
+    optimise_pngs,
+    reduce_palette,
+)
+
+
+@pytest.fixture
+def image() -> Image.Image:
+    """Create image with few colours."""
+    result = Image.new("RGB", (64, 48))
+    ImageDraw.Draw(result).rectangle((8, 8, 32, 32), fill=(255, 0, 0))
+
+    return result
+
+
+def test_reduce_palette(image: Image.Image) -> None:
+    """Test palette conversion is lossless."""
+    result = reduce_palette(image)
+
+    assert "P" == result.mode
+    assert image.tobytes() == result.convert("RGB").tobytes()
+
+
+def test_reduce_palette_many_colors() -> None:
+    """Test image with more than 256 colours is unchanged."""
+    image = Image.new("RGB", (300, 1))
+    image.putdata([(index % 256, index // 256, 0) for index in range(300)])
+
+    assert image is reduce_palette(image)
+
+
+def test_encode_png(image: Image.Image) -> None:
+    """Test encoded image is lossless and smaller than the default encoding."""
+    default = BytesIO()
+    image.save(default, "PNG")
+
+    result = encode_png(image)
+
+    assert len(result) <= default.tell()
+    assert image.tobytes() == Image.open(BytesIO(result)).convert("RGB").tobytes()
+
+
+def test_optimise_pngs(image: Image.Image, tmp_path: Path) -> None:
+    """Test images are written."""
+    out_files = [tmp_path / f"{index}.png" for index in range(3)]
+
+    result = optimise_pngs([(image, out_file) for out_file in out_files])
+
+    assert out_files == result
+    assert all(out_file.stat().st_size for out_file in out_files)
+
+
+@pytest.mark.skipif(not FONT_PATH.exists(), reason="requires DejaVu Sans font")
+def test_labeller(image: Image.Image) -> None:
+    """Test label is appended and reused for images of the same width."""
+    labeller = Labeller("label")
+
+    result = labeller(image)
+    labeller(image.copy())
+
+    assert 64 == result.width
+    assert result.height > image.height
+    assert 1 == len(labeller._labels)
@@ -0,0 +1,141 @@
+"""Test raster image renderers."""
+
+from pathlib import Path
+
+import cadquery as cq
+import numpy as np
+import pytest
+
+from osr_common.tessellation import Mesh, as_shape
+from osr_mechanical.console.renderers import (
+    CAMERAS,
+    Camera,
+    MayoRenderer,
+    View,
+    VTKRenderer,
+    default_renderer,
+    x_display_available,
+)
+
+
+class TestCamera:
+    """Test camera settings."""
+
+    def test_background_rgb(self) -> None:
+        """Test background colour conversion."""
+        assert (1.0, 0.0, 0.2) == Camera(background="#ff0033").background_rgb
+
+    def test_view_up(self) -> None:
+        """Test view up is not parallel to view direction."""
+        assert (0, 0, 1) == CAMERAS["front"].view_up
+        assert (0, 1, 0) == CAMERAS["top"].view_up
+
+
+class TestVTKRenderer:
+    """Test VTK renderer."""
+
+    def test_polydata(self) -> None:
+        """Test mesh conversion."""
+        mesh = Mesh.from_arrays(
+            np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32),
+            np.array([[0, 1, 2]], dtype=np.uint32),
+        )
+
+        polydata = VTKRenderer.polydata(mesh)
+
+        assert (3, 1) == (polydata.GetNumberOfPoints(), polydata.GetNumberOfCells())
+
+    def test_matrix(self) -> None:
+        """Test location conversion."""
+        matrix = VTKRenderer.matrix(cq.Location(cq.Vector(1, 2, 3)))
+
+        assert (1, 2, 3) == matrix[3::4]
+
+    def test_scene(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test an actor is created for each part, sharing the shape of a workplane."""
+        box = cq.Workplane().box(1, 1, 1)
+        assembly = cq.Assembly().add(box, name="a").add(box, name="b")
+
+        renderer = VTKRenderer()
+        shapes: list[cq.Shape] = []
+        mesh = renderer.mesh
+
+        def record(shape: cq.Shape) -> Mesh:
+            shapes.append(shape)
+            return mesh(shape)
+
+        monkeypatch.setattr(renderer, "mesh", record)
+
+        parts = renderer.parts(assembly)
+        actors = VTKRenderer.scene(parts).GetActors()
+
+        assert 2 == len(parts) == actors.GetNumberOfItems()
+        assert parts[0].mesh is parts[1].mesh
+        assert shapes[0] is shapes[1]
+
+    @pytest.mark.skipif(not VTKRenderer.available(), reason="requires a display")
+    def test_render(self) -> None:
+        """Test images are rendered at size."""
+        shape = as_shape(cq.Workplane().box(1, 1, 1))
+        views = [View(CAMERAS["iso"], 64, 48), View(CAMERAS["top"], 32, 32)]
+
+        images = VTKRenderer().render(shape, views)
+
+        assert [(64, 48), (32, 32)] == [image.size for image in images]
+
+    def test_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test rendering without an OpenGL context raises an exception."""
+        monkeypatch.setattr(VTKRenderer, "available", staticmethod(lambda: False))
+
+        with pytest.raises(RuntimeError):
+            VTKRenderer().render(as_shape(cq.Workplane().box(1, 1, 1)), [View()])
+
+
+@pytest.mark.parametrize(
+    "display, socket, expected",
+    [
+        ("", True, False),
+        (":0", True, True),
+        (":1.0", False, False),
+        ("localhost:10.0", False, True),
+    ],
+)
+def test_x_display_available(
+    monkeypatch: pytest.MonkeyPatch, display: str, socket: bool, expected: bool
+) -> None:
+    """Test X display detection."""
+    monkeypatch.setenv("DISPLAY", display)
+    monkeypatch.setattr(Path, "exists", lambda path: socket)
+
+    assert expected == x_display_available()
+
+
+@pytest.mark.parametrize(
+    "available, expected", [(True, VTKRenderer), (False, MayoRenderer)]
+)
+def test_default_renderer(
+    monkeypatch: pytest.MonkeyPatch, available: bool, expected: type
+) -> None:
+    """Test Mayo is used when VTK cannot render offscreen."""
+    monkeypatch.setattr(VTKRenderer, "available", staticmethod(lambda: available))
+
+    assert isinstance(default_renderer(), expected)
+
+
+def test_mayo_config() -> None:
+    """Test Mayo config uses camera settings."""
+    config = MayoRenderer(mayo_config={"export": {"Image\\width": "10"}})
+
+    export = config.create_mayo_config(View(width=1000, height=750))["export"]
+
+    assert "1, -1, 1" == export["Image\\cameraOrientation"]
+    assert "Orthographic" == export["Image\\cameraProjection"]
+    assert "750" == export["Image\\height"]
+    assert "10" == export["Image\\width"]
+
+
+def test_mayo_command(tmp_path: Path) -> None:
+    """Test Mayo command."""
+    command = MayoRenderer.command(tmp_path / "a.ini", tmp_path / "a.stl", tmp_path)
+
+    assert ["mayo", "--settings", tmp_path / "a.ini"] == command[:3]
@@ -0,0 +1,77 @@
+"""Test turntable animation exporter."""
+
+from pathlib import Path
+from typing import Sequence
+
+import cadquery as cq
+import pytest
+from PIL import Image
+
+from osr_mechanical.console.renderers import Camera, View
+from osr_mechanical.console.turntable import Turntable, chunks, rotate
+
+
+class FakeRenderer:
+    """Renderer of blank images."""
+
+    def __init__(self) -> None:
+        """Initialise FakeRenderer."""
+        self.views: list[View] = []
+
+    def render(
+        self, cq_object: cq.Shape | cq.Assembly, views: Sequence[View]
+    ) -> list[Image.Image]:
+        """Render blank image of each view."""
+        self.views.extend(views)
+
+        return [Image.new("RGB", view.size) for view in views]
+
+
+def test_rotate() -> None:
+    """Test rotation around Z."""
+    assert (0.0, 1.0, 1.0) == pytest.approx(rotate((1, 0, 1), (0, 0, 1), 90))
+
+
+def test_chunks() -> None:
+    """Test contiguous chunks of similar length."""
+    views = [View(width=width) for width in range(1, 8)]
+
+    result = chunks(views, 3)
+
+    assert [3, 2, 2] == [len(chunk) for chunk in result]
+    assert views == [view for chunk in result for view in chunk]
+    assert 2 == len(chunks(views[:2], 3))
+
+
+class TestTurntable:
+    """Test turntable."""
+
+    def test_views(self) -> None:
+        """Test camera rotates a full revolution."""
+        views = Turntable(frames=4, camera=Camera((1, 0, 0))).views()
+
+        directions = [view.camera.direction for view in views]
+
+        assert [(1, 0, 0), (0, 1, 0), (-1, 0, 0), (0, -1, 0)] == [
+            pytest.approx(direction, abs=1e-9) for direction in directions
+        ]
+
+    def test_no_frames(self) -> None:
+        """Test a turntable has at least one frame."""
+        with pytest.raises(ValueError):
+            Turntable(frames=0)
+
+    def test_renderer(self) -> None:
+        """Test frames are rendered with the selected renderer."""
+        renderer = FakeRenderer()
+
+        frames = Turntable(frames=3, renderer=renderer).render(
+            cq.Solid.makeBox(1, 1, 1)
+        )
+
+        assert 3 == len(frames) == len(renderer.views)
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        """Test unsupported animation format."""
+        with pytest.raises(ValueError):
+            Turntable().export(None, tmp_path / "turntable.mp4")  # type: ignore
@@ -1,6 +1,17 @@
 """Test console utilities."""
 
-from osr_mechanical.console.utilities import snake_to_camel_case
+from argparse import ArgumentTypeError
+
+import pytest
+
+from osr_mechanical.console.utilities import (
+    board_quantity,
+    container_argument,
+    image_size,
+    positive_integer,
+    snake_to_camel_case,
+    vector,
+)
 
 
 class TestSnakeToCamelCase:
@@ -11,3 +22,79 @@ class TestSnakeToCamelCase:
         result = snake_to_camel_case("valid_snake_case")
 
         assert "ValidSnakeCase" == result
+
+
+class TestBoardQuantity:
+    """Test board quantity argument type."""
+
+    def test_name_only(self) -> None:
+        """Test quantity defaults to one."""
+        assert ("rpi_hat", 1) == board_quantity("rpi_hat")
+
+    def test_name_and_quantity(self) -> None:
+        """Test name with quantity."""
+        assert ("rpi_hat", 12) == board_quantity("rpi_hat=12")
+
+    def test_invalid_quantity(self) -> None:
+        """Test invalid quantity."""
+        with pytest.raises(ArgumentTypeError):
+            board_quantity("rpi_hat=many")
+
+
+class TestContainerArgument:
+    """Test container argument type."""
+
+    def test_literal(self) -> None:
+        """Test Python literal value."""
+        assert ("simple", True) == container_argument("simple=True")
+
+    def test_string(self) -> None:
+        """Test non-literal value is a string."""
+        assert ("side", "@bom.parts.port") == container_argument("side=@bom.parts.port")
+
+    def test_invalid(self) -> None:
+        """Test argument without a value."""
+        with pytest.raises(ArgumentTypeError):
+            container_argument("simple")
+
+
+class TestPositiveInteger:
+    """Test positive integer argument type."""
+
+    def test_integer(self) -> None:
+        """Test integer of at least one."""
+        assert 120 == positive_integer("120")
+
+    @pytest.mark.parametrize("argument", ["0", "-1", "many"])
+    def test_invalid(self, argument: str) -> None:
+        """Test invalid integer."""
+        with pytest.raises(ArgumentTypeError):
+            positive_integer(argument)
+
+
+class TestImageSize:
+    """Test image size argument type."""
+
+    def test_size(self) -> None:
+        """Test width and height."""
+        assert (640, 490) == image_size("640x490")
+
+    @pytest.mark.parametrize("argument", ["640", "640x", "axb", "0x10"])
+    def test_invalid(self, argument: str) -> None:
+        """Test invalid size."""
+        with pytest.raises(ArgumentTypeError):
+            image_size(argument)
+
+
+class TestVector:
+    """Test vector argument type."""
+
+    def test_vector(self) -> None:
+        """Test components."""
+        assert (0.0, -1.0, 0.5) == vector("0,-1,0.5")
+
+    @pytest.mark.parametrize("argument", ["0,1", "a,b,c", "0,0,0"])
+    def test_invalid(self, argument: str) -> None:
+        """Test invalid vector."""
+        with pytest.raises(ArgumentTypeError):
+            vector(argument)
@@ -0,0 +1,138 @@
+"""Test incremental rebuilds of watched sources."""
+
+import importlib
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import osr_mechanical
+from osr_mechanical.console.watch import Watcher
+
+PACKAGE = "osr_mechanical.watched"
+
+CONTAINER = """\
+import cadquery as cq
+
+from osr_common.cq_containers import CqWorkplaneContainer
+from osr_mechanical.watched import log
+
+
+class {name}(CqWorkplaneContainer):
+    def __init__(self) -> None:
+        self._cq_object = self._make()
+
+    def _make(self) -> cq.Workplane:
+        log.built.append("{name}")
+        return {make}
+"""
+
+SOURCES = {
+    "__init__.py": "",
+    "log.py": "built = []\n",
+    "part.py": CONTAINER.format(name="Part", make="cq.Workplane().box(1, 1, 1)"),
+    "sibling.py": CONTAINER.format(
+        name="Sibling", make="cq.Workplane().cylinder(1, 1)"
+    ),
+    "assembly.py": "from osr_mechanical.watched.part import Part\n"
+    "from osr_mechanical.watched.sibling import Sibling\n"
+    + CONTAINER.format(
+        name="Assembly",
+        make="Part().cq_object.union(Sibling().cq_object.translate((2, 0, 0)))",
+    ),
+}
+
+
+@pytest.fixture
+def root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Write package below osr_mechanical to a temporary source directory."""
+    directory = tmp_path / "osr_mechanical" / "watched"
+    directory.mkdir(parents=True)
+
+    for name, source in SOURCES.items():
+        (directory / name).write_text(source)
+
+    monkeypatch.setattr(
+        osr_mechanical,
+        "__path__",
+        [*osr_mechanical.__path__, str(tmp_path / "osr_mechanical")],
+    )
+    # reloaded sources may have the same size and modification time
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    importlib.invalidate_caches()
+
+    yield tmp_path
+
+    for module in [name for name in sys.modules if name.startswith(PACKAGE)]:
+        del sys.modules[module]
+
+
+def built() -> list[str]:
+    """Get and clear names of containers built since last called."""
+    log: Any = importlib.import_module(f"{PACKAGE}.log")
+    result = sorted(log.built)
+    log.built.clear()
+
+    return result
+
+
+class TestWatcher:
+    """Test watcher."""
+
+    def setup_method(self) -> None:
+        """Set up TestWatcher."""
+        self.path = Path("osr_mechanical", "watched", "part.py")
+
+    def watcher(self, root: Path) -> Watcher:
+        """Create watcher of assembly, built once."""
+        watcher = Watcher(
+            "watched.assembly.Assembly", "brep", root / "out.brep", root=root
+        )
+
+        assert watcher.update([])
+        assert ["Assembly", "Part", "Sibling"] == built()
+
+        return watcher
+
+    def test_unchanged(self, root: Path) -> None:
+        """Test assembly is not rebuilt without changes."""
+        watcher = self.watcher(root)
+
+        assert watcher.update([])
+        assert [] == built()
+        assert (root / "out.brep").exists()
+
+    def test_dependents_rebuilt(self, root: Path) -> None:
+        """Test containers depending on a changed module are rebuilt."""
+        watcher = self.watcher(root)
+        sibling = next(
+            c for c in watcher.memo.values() if type(c).__name__ == "Sibling"
+        )
+
+        path = root / self.path
+        path.write_text(path.read_text().replace("box(1, 1, 1)", "box(2, 2, 2)"))
+
+        assert watcher.update([path])
+        assert ["Assembly", "Part"] == built()
+        assert sibling in watcher.memo.values()
+
+        part = next(c for c in watcher.memo.values() if type(c).__name__ == "Part")
+        assert 8 == pytest.approx(part.cq_object.val().Volume())
+
+    def test_failed_rebuild(self, root: Path) -> None:
+        """Test a failed rebuild discards affected containers and recovers."""
+        watcher = self.watcher(root)
+
+        path = root / self.path
+        source = path.read_text()
+        path.write_text(source.replace("return", "return ("))
+
+        assert not watcher.update([path])
+        assert {"Sibling"} == {type(c).__name__ for c in watcher.memo.values()}
+
+        path.write_text(source)
+
+        assert watcher.update([path])
+        assert ["Assembly", "Part"] == built()
@@ -0,0 +1,130 @@
+"""Test skyline packing."""
+
+import pytest
+
+from osr_mechanical.nesting.geometry import polygons_clear
+from osr_mechanical.nesting.packing import (
+    Compactor,
+    Item,
+    Placement,
+    Sheet,
+    SkylinePacker,
+)
+
+
+class TestSkylinePacker:
+    """Test skyline packer."""
+
+    def setup_method(self) -> None:
+        """Set up TestSkylinePacker."""
+        self.sheet = Sheet(100, 50, margin=5)
+
+    def test_single_row(self) -> None:
+        """Test parts are placed left to right along the bottom of the sheet."""
+        items = [Item(f"part_{i}", 20, 10) for i in range(3)]
+
+        placements = SkylinePacker(self.sheet, spacing=2).pack(items)
+
+        assert [5, 27, 49] == sorted(p.x for p in placements)
+        assert {5} == {p.y for p in placements}
+
+    def test_additional_sheet(self) -> None:
+        """Test a second sheet is used when the first is full."""
+        items = [Item(f"part_{i}", 40, 20) for i in range(5)]
+
+        placements = SkylinePacker(self.sheet).pack(items)
+
+        assert 2 == max(p.sheet_index for p in placements) + 1
+
+    def test_rotation(self) -> None:
+        """Test a part is rotated to fit the sheet."""
+        placement = SkylinePacker(self.sheet).pack([Item("part", 30, 80)]).pop()
+
+        assert placement.rotated
+        assert (80, 30) == (placement.width, placement.height)
+
+    def test_part_too_large(self) -> None:
+        """Test a part larger than the sheet."""
+        with pytest.raises(ValueError):
+            SkylinePacker(self.sheet).pack([Item("part", 120, 120)])
+
+    def test_placements_within_sheet(self) -> None:
+        """Test all placements are within the sheet margin."""
+        items = [Item(f"part_{i}", 7 + i % 11, 3 + i % 7) for i in range(200)]
+
+        placements = SkylinePacker(self.sheet, spacing=1).pack(items)
+
+        for p in placements:
+            assert p.x >= self.sheet.margin
+            assert p.y >= self.sheet.margin
+            assert p.x + p.width <= self.sheet.width - self.sheet.margin
+            assert p.y + p.height <= self.sheet.height - self.sheet.margin
+
+
+class TestPolygonsClear:
+    """Test polygon clearance."""
+
+    def test_crossing_edges(self) -> None:
+        """Test polygons whose edges cross are not clear without clearance."""
+        horizontal = ((0, 4), (10, 4), (10, 6), (0, 6))
+        vertical = ((4, 0), (6, 0), (6, 10), (4, 10))
+
+        assert not polygons_clear(horizontal, vertical, 0)
+        assert not polygons_clear(vertical, horizontal, 0)
+
+    def test_apart(self) -> None:
+        """Test polygons further apart than clearance are clear."""
+        square = ((0, 0), (10, 0), (10, 10), (0, 10))
+        moved = tuple((x + 12, y) for x, y in square)
+
+        assert polygons_clear(square, moved, 0)
+        assert polygons_clear(square, moved, 2)
+        assert not polygons_clear(square, moved, 2.5)
+
+
+class TestCompactor:
+    """Test polygon-aware compaction."""
+
+    def test_triangles_interlock(self) -> None:
+        """Test compacted outlines remain clear of each other."""
+        sheet = Sheet(100, 100)
+        triangle = ((0, 0), (20, 0), (0, 20))
+        items = [Item(f"part_{i}", 20, 20, triangle, rotatable=False) for i in range(8)]
+
+        placements = SkylinePacker(sheet, spacing=1).pack(items)
+        compacted = Compactor(sheet, clearance=1).compact(placements)
+
+        assert sum(p.y for p in compacted) <= sum(p.y for p in placements)
+
+        for i, a in enumerate(compacted):
+            for b in compacted[i + 1 :]:
+                assert polygons_clear(a.polygon, b.polygon, 1 - 1e-6)
+
+    def test_part_does_not_pass_through_neighbour(self) -> None:
+        """Test a part stops at a neighbour with a free gap on its far side."""
+        sheet = Sheet(100, 100)
+        wall = (
+            (0, 0),
+            (100, 0),
+            (100, 2),
+            (42, 2),
+            (42, 100),
+            (40, 100),
+            (40, 2),
+            (0, 2),
+        )
+        placements = [
+            Placement(Item("floor", 100, 100, wall, rotatable=False), 0, 0, 0),
+            Placement(Item("part", 10, 10, rotatable=False), 0, 60, 50),
+        ]
+
+        part = Compactor(sheet, clearance=1).compact(placements)[1]
+
+        assert part.y == pytest.approx(3, abs=0.01)
+        assert part.x == pytest.approx(43, abs=0.01)
+
+    @pytest.mark.parametrize("clearance", [0, -1])
+    def test_clearance_required(self, clearance: float) -> None:
+        """Test compaction without clearance is rejected."""
+        with pytest.raises(ValueError):
+            Compactor(Sheet(100, 100), clearance)
@@ -0,0 +1,76 @@
+"""Test benchmark suite."""
+
+import pytest
+
+from osr_mechanical.benchmark import (
+    Benchmark,
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchmarkRunner,
+    compare,
+)
+
+
+class TestBenchmarkRunner:
+    """Test benchmark runner."""
+
+    def test_repeat_and_warmup(self) -> None:
+        """Test benchmark is run warmup plus repeat times with setup once."""
+        calls = {"setup": 0, "func": 0}
+
+        def setup() -> int:
+            calls["setup"] += 1
+            return 2
+
+        def func(argument: int) -> None:
+            calls["func"] += argument
+
+        report = BenchmarkRunner(repeat=3, warmup=2).run([Benchmark("a", func, setup)])
+
+        assert {"setup": 1, "func": 10} == calls
+        assert 3 == len(report.results[0].times)
+
+    def test_pattern(self) -> None:
+        """Test benchmarks are filtered by name."""
+        benchmarks = [Benchmark(name, lambda _: None) for name in ["a.x", "a.y", "b"]]
+
+        report = BenchmarkRunner(repeat=1).run(benchmarks, pattern="a.*")
+
+        assert ["a.x", "a.y"] == [result.name for result in report.results]
+
+    def test_repeat_positive(self) -> None:
+        """Test at least one timed run."""
+        with pytest.raises(ValueError):
+            BenchmarkRunner(repeat=0)
+
+
+class TestCompare:
+    """Test comparison against baseline."""
+
+    def setup_method(self) -> None:
+        """Set up TestCompare."""
+        self.baseline = BenchmarkReport(
+            {}, [BenchmarkResult("a", [1.0, 1.0]), BenchmarkResult("b", [1.0])]
+        )
+
+    def test_regression(self) -> None:
+        """Test median time exceeding threshold is a regression."""
+        current = BenchmarkReport(
+            {}, [BenchmarkResult("a", [1.2, 1.3, 0.5]), BenchmarkResult("b", [1.05])]
+        )
+
+        comparisons = compare(self.baseline, current, threshold=0.1)
+
+        assert [True, False] == [c.regression for c in comparisons]
+
+    def test_new_benchmark_ignored(self) -> None:
+        """Test benchmarks missing from the baseline are not compared."""
+        current = BenchmarkReport({}, [BenchmarkResult("c", [1.0])])
+
+        assert [] == compare(self.baseline, current)
+
+    def test_json_round_trip(self) -> None:
+        """Test report is decoded from JSON."""
+        result = BenchmarkReport.from_json(self.baseline.to_json())
+
+        assert self.baseline == result
@@ -0,0 +1,39 @@
+"""Test container cache."""
+
+from osr_mechanical.cache import ContainerCache
+
+
+class Container:
+    """Container recording its initialisation arguments."""
+
+    def __init__(self, size: int = 1, holes: list[int] | None = None) -> None:
+        """Initialise Container."""
+        self.size = size
+        self.holes = holes
+
+
+class TestContainerCache:
+    """Test container cache."""
+
+    def setup_method(self) -> None:
+        """Set up TestContainerCache."""
+        self.cache = ContainerCache()
+
+    def test_hit(self) -> None:
+        """Test container is reused."""
+        first = self.cache.get(Container, size=2)
+
+        assert first is self.cache.get(Container, size=2)
+        assert (1, 1) == (self.cache.hits, self.cache.misses)
+
+    def test_arguments(self) -> None:
+        """Test containers are cached by keyword arguments."""
+        assert self.cache.get(Container) is not self.cache.get(Container, size=2)
+        assert 2 == len(self.cache)
+
+    def test_unhashable_arguments(self) -> None:
+        """Test containers with unhashable arguments are not cached."""
+        first = self.cache.get(Container, holes=[1])
+
+        assert first is not self.cache.get(Container, holes=[1])
+        assert 0 == len(self.cache)
@@ -0,0 +1,85 @@
+"""Test module dependencies."""
+
+from pathlib import Path
+
+import pytest
+
+from osr_mechanical.dependencies import ModuleGraph
+
+SOURCES = {
+    "pkg/__init__.py": "",
+    "pkg/base.py": "import math\n",
+    "pkg/sub/__init__.py": "from .. import base\n",
+    "pkg/sub/part.py": "from pkg.base import math\n",
+    "pkg/assembly.py": "from .sub.part import Part\n",
+    "pkg/unrelated.py": "import pkg\n",
+    "pkg/lazy.py": "def make():\n    from pkg import base\n",
+}
+
+
+@pytest.fixture
+def graph(tmp_path: Path) -> ModuleGraph:
+    """Create module graph of a source tree."""
+    for name, source in SOURCES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+
+    return ModuleGraph.from_directory(tmp_path, ["pkg"])
+
+
+class TestModuleGraph:
+    """Test module graph."""
+
+    def test_dependencies(self, graph: ModuleGraph) -> None:
+        """Test relative and absolute imports are resolved."""
+        assert {"pkg", "pkg.base"} == graph.dependencies("pkg.sub")
+        assert {"pkg.sub.part"} == graph.dependencies("pkg.assembly")
+
+    def test_dependents(self, graph: ModuleGraph) -> None:
+        """Test modules affected by a change."""
+        assert {
+            "pkg.base",
+            "pkg.sub",
+            "pkg.sub.part",
+            "pkg.assembly",
+        } == graph.dependents({"pkg.base"})
+
+    def test_function_imports_excluded(self, graph: ModuleGraph) -> None:
+        """Test imports within functions are not dependencies."""
+        assert set() == graph.dependencies("pkg.lazy")
+
+    def test_reload_order(self, graph: ModuleGraph) -> None:
+        """Test modules follow the modules they import."""
+        order = graph.reload_order(graph.dependents({"pkg.base"}))
+
+        assert order.index("pkg.base") < order.index("pkg.sub.part")
+        assert order.index("pkg.sub.part") < order.index("pkg.assembly")
+
+    def test_update(self, graph: ModuleGraph, tmp_path: Path) -> None:
+        """Test changed imports are updated."""
+        (tmp_path / "pkg/unrelated.py").write_text("from pkg import assembly\n")
+
+        graph.update(tmp_path / "pkg/unrelated.py")
+
+        assert "pkg.unrelated" in graph.dependents({"pkg.base"})
+
+    def test_closure(self, graph: ModuleGraph) -> None:
+        """Test modules imported, directly or indirectly, including packages."""
+        assert {
+            "pkg",
+            "pkg.base",
+            "pkg.sub",
+            "pkg.sub.part",
+            "pkg.assembly",
+        } == graph.closure({"pkg.assembly"})
+
+    def test_source_hash(self, graph: ModuleGraph, tmp_path: Path) -> None:
+        """Test source hash changes only when an imported module changes."""
+        source_hash = graph.source_hash({"pkg.assembly"})
+
+        (tmp_path / "pkg/unrelated.py").write_text("import os\n")
+        assert source_hash == graph.source_hash({"pkg.assembly"})
+
+        (tmp_path / "pkg/base.py").write_text("import os\n")
+        assert source_hash != graph.source_hash({"pkg.assembly"})
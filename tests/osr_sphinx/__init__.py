@@ -0,0 +1 @@
+"""OSR Sphinx tests."""
@@ -0,0 +1,108 @@
+"""Test build time budget."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from osr_sphinx.utilities.budget import (
+    Measurement,
+    budget,
+    collect_budget,
+    env_budget,
+    merge_budget,
+    summarise,
+    table,
+    write_report,
+)
+
+MEASUREMENTS = [
+    Measurement("osr:bom", 0.5, hit=True),
+    Measurement("osr:model", 2.0, hit=False, size=100),
+    Measurement("osr:bom", 1.0, hit=False),
+    Measurement("osr:model", 0.25, hit=True, size=50),
+    Measurement("prefetch", 1.0),
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_budget() -> Iterator[None]:
+    """Forget measurements of the current process."""
+    budget.pop()
+    yield
+    budget.pop()
+
+
+def test_summarise() -> None:
+    """Test measurements are totalled by name, the most time first."""
+    summaries = summarise(MEASUREMENTS)
+
+    assert ["osr:model", "osr:bom", "prefetch"] == [s.name for s in summaries]
+    assert (2, 2.25, 1, 1, 150) == (
+        summaries[0].count,
+        summaries[0].seconds,
+        summaries[0].hits,
+        summaries[0].misses,
+        summaries[0].size,
+    )
+    assert (0, 0) == (summaries[2].hits, summaries[2].misses)
+
+
+def test_table() -> None:
+    """Test a header and a row for each summary."""
+    rows = table(summarise(MEASUREMENTS))
+
+    assert 4 == len(rows)
+    assert rows[0].split() == ["name", "count", "seconds", "hits", "misses", "bytes"]
+    assert rows[1].split() == ["osr:model", "2", "2.25", "1", "1", "150"]
+
+
+def test_write_report(tmp_path: Path) -> None:
+    """Test JSON report of summaries and measurements."""
+    path = tmp_path / "reports" / "budget.json"
+
+    write_report(path, summarise(MEASUREMENTS), MEASUREMENTS)
+    report = json.loads(path.read_text())
+
+    assert 4.75 == report["seconds"]
+    assert "osr:model" == report["summary"][0]["name"]
+    assert len(MEASUREMENTS) == len(report["measurements"])
+
+
+def read(env: Any, docname: str, name: str) -> None:
+    """Measure reading a document and collect the measurement."""
+    env.docname = docname
+    with budget.measure(name):
+        pass
+
+    collect_budget(SimpleNamespace(env=env), None)  # type: ignore[arg-type]
+
+
+def test_collect_budget() -> None:
+    """Test measurements are moved to the environment tagged by document."""
+    env: Any = SimpleNamespace()
+
+    read(env, "index", "osr:bom")
+
+    assert [] == budget.measurements
+    assert ["index"] == [m.docname for m in env_budget(env)]
+
+
+def test_merge_budget() -> None:
+    """Test measurements inherited from processes merged earlier are not merged."""
+    main: Any = SimpleNamespace()
+    read(main, "index", "osr:bom")
+
+    first: Any = SimpleNamespace(osr_budget=list(env_budget(main)))
+    read(first, "frame", "osr:model")
+    merge_budget(None, main, {"frame"}, first)  # type: ignore[arg-type]
+
+    # forked after the first process was merged
+    second: Any = SimpleNamespace(osr_budget=list(env_budget(main)))
+    read(second, "jigs", "osr:model")
+    merge_budget(None, main, {"jigs"}, second)  # type: ignore[arg-type]
+
+    assert ["index", "frame", "jigs"] == [m.docname for m in env_budget(main)]
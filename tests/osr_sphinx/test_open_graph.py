@@ -0,0 +1,80 @@
+"""Test Open Graph image."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import osr_sphinx
+from osr_sphinx import copy_open_graph_card, resolve_open_graph_image
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Any:
+    """Create Sphinx application of a source and output directory."""
+    (tmp_path / "docs").mkdir()
+
+    return SimpleNamespace(
+        confdir=str(tmp_path / "docs"), outdir=str(tmp_path / "html")
+    )
+
+
+@pytest.fixture
+def config() -> Any:
+    """Create Sphinx configuration of the Open Graph image."""
+    return SimpleNamespace(
+        osr_open_graph_card="card.png",
+        osr_open_graph_fetch=False,
+        ogp_image="_static/card.png",
+    )
+
+
+class TestCopyOpenGraphCard:
+    """Test copying of the local Open Graph card."""
+
+    def test_missing(
+        self, app: Any, config: Any, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test a missing card is a warning."""
+        assert not copy_open_graph_card(app, config)
+        assert "card.png not found" in caplog.text
+        assert not Path(app.outdir).exists()
+
+    def test_copy(self, app: Any, config: Any) -> None:
+        """Test card is copied only if its content changed."""
+        card = Path(app.confdir, "card.png")
+        save_as = Path(app.outdir, "_static", "card.png")
+
+        card.write_bytes(b"first")
+        assert copy_open_graph_card(app, config)
+        assert b"first" == save_as.read_bytes()
+
+        card.touch()
+        assert not copy_open_graph_card(app, config)
+
+        card.write_bytes(b"second")
+        assert copy_open_graph_card(app, config)
+        assert b"second" == save_as.read_bytes()
+
+
+@pytest.mark.parametrize("fetch", [True, False])
+def test_resolve_open_graph_image(
+    app: Any, config: Any, monkeypatch: pytest.MonkeyPatch, fetch: bool
+) -> None:
+    """Test GitHub image is downloaded only if fetching is enabled."""
+    called: list[str] = []
+
+    def record(name: str) -> Any:
+        def handler(app: Any, config: Any) -> bool:
+            called.append(name)
+            return True
+
+        return handler
+
+    monkeypatch.setattr(osr_sphinx, "download_open_graph_image", record("download"))
+    monkeypatch.setattr(osr_sphinx, "copy_open_graph_card", record("copy"))
+    config.osr_open_graph_fetch = fetch
+
+    assert resolve_open_graph_image(app, config)
+    assert ["download" if fetch else "copy"] == called
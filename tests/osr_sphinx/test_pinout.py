@@ -0,0 +1,128 @@
+"""Test pinout diagram rendering."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from osr_sphinx import pinout
+from osr_sphinx.pinout import (
+    diagram_ids,
+    pinout_cache_file,
+    render_diagram,
+    render_pinout_diagrams,
+)
+
+PACKAGE = "test_pinout_diagrams"
+
+
+@pytest.fixture
+def diagrams(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Create a package of pinout diagrams."""
+    package = tmp_path / "src" / PACKAGE
+    board = package / "board"
+    board.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "resources").mkdir()
+    (board / "__init__.py").write_text("")
+    (board / "diagram.py").write_text("diagram = None\n")
+    (board / "data.py").write_text("pins = []\n")
+
+    monkeypatch.syspath_prepend(str(tmp_path / "src"))
+    monkeypatch.setattr(pinout, "PINOUT_PACKAGE", PACKAGE)
+
+    yield board
+
+    for module in [name for name in sys.modules if name.startswith(PACKAGE)]:
+        del sys.modules[module]
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Any:
+    """Create Sphinx application of the doctree directory."""
+    return SimpleNamespace(doctreedir=str(tmp_path / "doctrees"))
+
+
+def export(svg: str | None) -> Any:
+    """Create export_diagram writing svg, or no file if ``None``."""
+
+    def export_diagram(src: Path, dest: Path, **kwargs: Any) -> None:
+        if svg is not None:
+            dest.write_text(svg)
+
+    return export_diagram
+
+
+def test_diagram_ids(diagrams: Path) -> None:
+    """Test packages without diagram.py are not diagrams."""
+    assert ["board"] == diagram_ids()
+
+
+def test_pinout_cache_file(diagrams: Path, app: Any) -> None:
+    """Test cache file changes with each file of the diagram package."""
+    first = pinout_cache_file(app, "board")
+    (diagrams / "data.py").write_text("pins = [1]\n")
+    second = pinout_cache_file(app, "board")
+
+    assert Path(app.doctreedir, "osr", "pinout") == first.parent
+    assert first.name.startswith("board-")
+    assert first != second
+    assert second == pinout_cache_file(app, "board")
+
+
+class TestRenderDiagram:
+    """Test rendering of a diagram."""
+
+    def test_render(
+        self, diagrams: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test diagram is moved to destination."""
+        monkeypatch.setattr(pinout, "export_diagram", export("<svg/>"))
+        dest = tmp_path / "out" / "board.svg"
+
+        assert dest == render_diagram("board", dest)
+        assert "<svg/>" == dest.read_text()
+
+    @pytest.mark.parametrize("svg", ["", None])
+    def test_empty(
+        self,
+        diagrams: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        svg: str | None,
+    ) -> None:
+        """Test an empty or missing diagram raises an exception."""
+        monkeypatch.setattr(pinout, "export_diagram", export(svg))
+        dest = tmp_path / "out" / "board.svg"
+
+        with pytest.raises(RuntimeError):
+            render_diagram("board", dest)
+
+        assert not dest.exists()
+
+
+def test_render_pinout_diagrams(
+    diagrams: Path, app: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test missing diagrams are rendered and stale diagrams removed."""
+    rendered: list[str] = []
+
+    def render_diagrams(missing: dict[str, Path]) -> list[Path]:
+        rendered.extend(missing)
+        return [render_diagram(*item) for item in missing.items()]
+
+    monkeypatch.setattr(pinout, "export_diagram", export("<svg/>"))
+    monkeypatch.setattr(pinout, "render_diagrams", render_diagrams)
+
+    stale = pinout_cache_file(app, "board").with_name("board-stale.svg")
+    stale.parent.mkdir(parents=True)
+    stale.write_text("<svg/>")
+
+    render_pinout_diagrams(app)
+    render_pinout_diagrams(app)
+
+    assert ["board"] == rendered
+    assert [pinout_cache_file(app, "board")] == list(stale.parent.iterdir())
@@ -0,0 +1,143 @@
+"""Test prefetching of models."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import docutils.core
+import pytest
+from docutils import nodes
+from docutils.parsers.rst import directives
+
+from osr_sphinx.bom import DEFAULT_ASSEMBLY
+from osr_sphinx.model import ModelSpec, ModelViewer
+from osr_sphinx.prefetch import Prefetcher, scan
+from osr_sphinx.utilities.measurements import DEFAULT_CONTAINER
+
+MODEL = """\
+.. osr:model:: jigs.vslot.EndTapJig
+
+    End tap jig for 2020 V-slot extrusion.
+"""
+
+MODEL_OPTIONS = """\
+.. osr:model:: jigs.vslot.EndTapJig
+    :part: 2020_end_tap_jig__body
+    :color: 0.85, 0.45, 0.01, 1
+    :alt: End tap jig body
+
+    3D printed body for 2020 V-slot end tap jig.
+"""
+
+MODEL_ARGUMENTS = """\
+.. container:: frame
+
+    .. osr:model:: frame.side.FrameSide
+        :arguments: nautical_side=@bom.parts.port
+
+        Frame port sub-assembly.
+"""
+
+BOM_AND_DIMENSIONS = """\
+The frame is :osr:dimension:`width` wide and
+:osr:dimension:`frame.final.Frame:length` long.
+
+.. osr:bom::
+
+.. osr:bom:: frame.final.Frame
+"""
+
+
+class ModelSpecs(ModelViewer):
+    """Model directive recording the file names it would compute."""
+
+    file_names: list[str] = []
+
+    def run(self) -> list[nodes.Node]:
+        """Record file name of model."""
+        spec = ModelSpec.from_options(self.arguments[0], self.options)
+        self.file_names.append(spec.file_name)
+        return []
+
+
+def directive_file_names(source: str) -> list[str]:
+    """Parse source with docutils and return file names of osr:model directives."""
+    ModelSpecs.file_names = []
+    directives.register_directive("osr:model", ModelSpecs)
+    docutils.core.publish_doctree(source, settings_overrides={"report_level": 5})
+    return ModelSpecs.file_names
+
+
+class TestScan:
+    """Test scanning of reStructuredText sources."""
+
+    @pytest.mark.parametrize("source", [MODEL, MODEL_OPTIONS, MODEL_ARGUMENTS])
+    def test_model(self, source: str) -> None:
+        """Test file name of model equals file name of directive."""
+        jobs = list(scan(source))
+
+        assert [(kind, name) for kind, name, _spec in jobs] == [
+            ("model", file_name) for file_name in directive_file_names(source)
+        ]
+
+    def test_model_options(self) -> None:
+        """Test options of model are converted as by directive."""
+        ((_kind, _name, spec),) = scan(MODEL_OPTIONS)
+
+        assert spec is not None
+        assert "2020_end_tap_jig__body" == spec.part
+        assert (0.85, 0.45, 0.01, 1.0) == spec.color
+
+    def test_model_arguments(self) -> None:
+        """Test arguments of nested model are found."""
+        ((_kind, _name, spec),) = scan(MODEL_ARGUMENTS)
+
+        assert spec is not None
+        assert "frame.side.FrameSide" == spec.container
+        assert (("nautical_side", "@bom.parts.port"),) == spec.arguments
+
+    @pytest.mark.parametrize(
+        "option", [":color: orange", ":name: end-tap-jig", ":arguments: side"]
+    )
+    def test_invalid_option(self, option: str) -> None:
+        """Test models with invalid options are skipped."""
+        invalid = MODEL.replace("\n\n", f"\n    {option}\n\n", 1)
+
+        assert [("model", name) for name in directive_file_names(MODEL_OPTIONS)] == [
+            (kind, name) for kind, name, _spec in scan(invalid + MODEL_OPTIONS)
+        ]
+
+    def test_bom_and_dimensions(self) -> None:
+        """Test default container is used without container."""
+        assert [
+            ("bom", DEFAULT_ASSEMBLY, None),
+            ("bom", "frame.final.Frame", None),
+            ("dimension", DEFAULT_CONTAINER, None),
+            ("dimension", "frame.final.Frame", None),
+        ] == list(scan(BOM_AND_DIMENSIONS))
+
+
+class TestPrefetcher:
+    """Test prefetcher."""
+
+    def test_jobs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test jobs of a container are grouped."""
+        sources = {
+            "bom": BOM_AND_DIMENSIONS,
+            "jig": MODEL + MODEL_OPTIONS,
+            "side": MODEL_ARGUMENTS,
+        }
+        for docname, source in sources.items():
+            (tmp_path / f"{docname}.rst").write_text(source)
+
+        env = SimpleNamespace(doc2path=lambda docname: tmp_path / f"{docname}.rst")
+        app = SimpleNamespace(outdir=str(tmp_path / "html"))
+        monkeypatch.setattr(Prefetcher, "is_missing", lambda _self, _job: True)
+
+        groups = Prefetcher(app, env).jobs(sources)  # type: ignore[arg-type]
+
+        assert [[(kind, name) for kind, name, _spec in jobs] for jobs in groups] == [
+            [("bom", DEFAULT_ASSEMBLY), ("dimension", DEFAULT_CONTAINER)],
+            [("bom", "frame.final.Frame"), ("dimension", "frame.final.Frame")],
+            sorted(("model", name) for name in directive_file_names(sources["jig"])),
+            [("model", directive_file_names(MODEL_ARGUMENTS)[0])],
+        ]